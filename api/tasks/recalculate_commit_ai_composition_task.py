@@ -23,6 +23,7 @@ from mvp.models import (
     RepositoryFile,
     RepositoryPullRequest,
 )
+from mvp.services import OrganizationCacheService
 from mvp.tasks import ImportAIEngineDataTask
 from mvp.utils import start_new_thread
 
@@ -65,6 +66,11 @@ class RecalculateCommitAICompositionTask:
         for organization in organizations:
             self.update_organization_background(organization)
 
+        # older commits don't trigger a full organization update, but their daily composition changed
+        for organization in set(commit.repository.organization for commit in commits) - organizations:
+            self.importer.update_daily_composition(organization)
+            OrganizationCacheService.bump_data_version(organization)
+
     def update_commit(self, commit: RepositoryCommit, pull_requests: List[RepositoryPullRequest]):
         self.update_commit_ai_fields(commit)
 
@@ -78,6 +84,7 @@ class RecalculateCommitAICompositionTask:
         commit.last_recalculated_at = timezone.make_aware(datetime.utcnow())
 
         commit.save()
+        self.importer.track_composition_change(commit)
 
     def update_commit_ai_fields(self, commit: RepositoryCommit):
         commit.reset_ai_fields()
@@ -0,0 +1,75 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from api.tasks.recalculate_commit_ai_composition_task import RecalculateCommitAICompositionTask
+from compass.integrations.integrations import GitHubIntegration
+from mvp.models import (
+    Organization,
+    Repository,
+    RepositoryCommit,
+    RepositoryCommitStatusChoices,
+    RepositoryFile,
+)
+from mvp.services import AICompositionService, OrganizationCacheService
+from mvp.services.repository_daily_composition_service import (
+    RepositoryDailyCompositionService,
+)
+
+
+class RecalculateCommitAICompositionTaskTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.organization = Organization.objects.create(name="Test Org")
+        self.repository = Repository.objects.create(
+            organization=self.organization,
+            provider=GitHubIntegration().provider,
+            external_id="1",
+            owner="org",
+            name="repo",
+            last_commit_sha="sha2",
+        )
+        self.today = timezone.now().replace(hour=12, minute=0, second=0, microsecond=0)
+        self.older_commit = self.create_commit("sha1", days_ago=3)
+        self.create_commit("sha2", days_ago=1)
+        RepositoryFile.objects.create(
+            commit=self.older_commit,
+            file_path="file.py",
+            code_num_lines=100,
+            code_ai_num_lines=50,
+            code_ai_blended_num_lines=20,
+            code_ai_pure_num_lines=30,
+        )
+        RepositoryDailyCompositionService(self.organization).update_all()
+
+    def create_commit(self, sha, days_ago):
+        return RepositoryCommit.objects.create(
+            repository=self.repository,
+            sha=sha,
+            date_time=self.today - timedelta(days=days_ago),
+            status=RepositoryCommitStatusChoices.ANALYZED,
+            code_num_lines=100,
+            code_ai_num_lines=10,
+            code_ai_blended_num_lines=5,
+        )
+
+    def get_cached_overall_chart(self):
+        def get_overall_chart():
+            cumulative, _ = AICompositionService(self.organization).get_charts(
+                self.today - timedelta(days=3), self.today
+            )
+            overall = next(
+                chart for chart in cumulative if chart.label == AICompositionService.SERIES_DELTA_NAME_OVERALL
+            )
+            return overall.data.series[0].data
+
+        return OrganizationCacheService.get_or_set(self.organization, "overall_chart", get_overall_chart)
+
+    def test_run_older_commit_invalidates_cached_charts(self):
+        self.assertEqual(self.get_cached_overall_chart(), [10.0, 10.0, 10.0, 10.0])
+
+        RecalculateCommitAICompositionTask().run([self.older_commit])
+
+        self.assertEqual(self.get_cached_overall_chart(), [50.0, 50.0, 10.0, 10.0])
@@ -0,0 +1,162 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from compass.integrations.integrations import GitHubIntegration
+from mvp.models import (
+    CustomUser,
+    Organization,
+    ProductivityImprovementChoices,
+    Repository,
+    RepositoryCommit,
+    RepositoryCommitStatusChoices,
+    RepositoryGroup,
+    RepositoryGroupCategoryChoices,
+)
+from mvp.services.repository_daily_composition_service import (
+    RepositoryDailyCompositionService,
+)
+from mvp.tests.test_views.base_view_test import BaseViewTestCase
+
+
+class TestRepositoryGroupView(BaseViewTestCase):
+    def setUp(self):
+        self.credentials = {
+            "email": "testuser@domain.com",
+            "password": "testpass456",
+        }
+
+        self.organization = Organization.objects.create(name="TestOrg")
+        self.user = CustomUser.objects.create_user(
+            email=self.credentials["email"],
+            password=self.credentials["password"],
+        )
+
+        owner_group = Group.objects.get(name="Owner")
+        owner_group.user_set.add(self.user)
+        self.user.organizations.add(self.organization)
+
+        self.now = timezone.now().replace(hour=12, minute=0, second=0, microsecond=0)
+        self.num_groups = 0
+
+        self.create_repository("ungrouped")
+
+    def login(self):
+        self.client.login(
+            email=self.credentials["email"],
+            password=self.credentials["password"],
+        )
+
+    def create_groups(self, num_groups):
+        for _ in range(num_groups):
+            self.num_groups += 1
+            group = RepositoryGroup.objects.create(
+                organization=self.organization,
+                name=f"Group {self.num_groups}",
+                usage_category=RepositoryGroupCategoryChoices.DEVELOPMENT,
+                potential_productivity_improvement_label=ProductivityImprovementChoices.NEW_CODEBASE,
+                potential_productivity_improvement_percentage=40,
+                num_developers=10,
+            )
+            self.create_repository(f"repo-{self.num_groups}-a", group)
+            self.create_repository(f"repo-{self.num_groups}-b", group)
+
+        RepositoryDailyCompositionService(self.organization).update_all()
+
+    def create_repository(self, name, group=None):
+        repository = Repository.objects.create(
+            organization=self.organization,
+            provider=GitHubIntegration().provider,
+            external_id=name,
+            owner="org",
+            name=name,
+            group=group,
+            last_analysis_num_files=10,
+            code_num_lines=300,
+        )
+
+        for days_ago, num_lines in [(20, 100), (5, 200), (1, 300)]:
+            RepositoryCommit.objects.create(
+                repository=repository,
+                sha=f"{name}-{days_ago}",
+                date_time=self.now - timedelta(days=days_ago),
+                status=RepositoryCommitStatusChoices.ANALYZED,
+                code_num_lines=num_lines,
+                code_ai_num_lines=num_lines // 10,
+                code_ai_blended_num_lines=num_lines // 20,
+            )
+
+        return repository
+
+    def get_num_queries(self):
+        # measure the uncached response
+        cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse("repository_group_list"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["repositories"]["groups"]), self.num_groups)
+        # ignore the queries made by the profiler middleware
+        queries = [
+            query["sql"]
+            for query in context.captured_queries
+            if "silk_" not in query["sql"] and not query["sql"].startswith("EXPLAIN")
+        ]
+        return len(queries)
+
+    def test_num_queries_does_not_depend_on_num_groups(self):
+        self.login()
+
+        self.create_groups(2)
+        # warm up per-process caches, e.g. data providers
+        self.get_num_queries()
+        num_queries = self.get_num_queries()
+
+        self.create_groups(4)
+        self.assertEqual(self.get_num_queries(), num_queries)
+
+    def test_charts_and_roi_fields(self):
+        self.login()
+        self.create_groups(2)
+
+        response = self.client.get(reverse("repository_group_list"))
+        data = response.data["repositories"]
+
+        self.assertEqual(data["count"], 5)
+        for group in data["groups"]:
+            self.assertTrue(group["charts_cumulative"])
+            self.assertTrue(group["charts_daily"])
+            self.assertIn("hours_saved", group)
+            self.assertEqual(
+                group["date_ai_fields"]["code_num_lines"],
+                sum(repo["date_ai_fields"]["code_num_lines"] for repo in group["repositories"]),
+            )
+
+        self.assertTrue(data["ungrouped"]["charts_cumulative"])
+        self.assertEqual(
+            data["ungrouped"]["date_ai_fields"]["code_num_lines"],
+            data["ungrouped"]["repositories"][0]["date_ai_fields"]["code_num_lines"],
+        )
+
+    def test_roi_fields_of_group_without_repositories(self):
+        self.login()
+        RepositoryGroup.objects.create(
+            organization=self.organization,
+            name="Empty group",
+            usage_category=RepositoryGroupCategoryChoices.DEVELOPMENT,
+            potential_productivity_improvement_label=ProductivityImprovementChoices.NEW_CODEBASE,
+            potential_productivity_improvement_percentage=40,
+            num_developers=10,
+        )
+
+        response = self.client.get(reverse("repository_group_list"))
+        group = response.data["repositories"]["groups"][0]
+
+        self.assertEqual(group["productivity_achievement"], 0)
+        self.assertEqual(group["potential_productivity_captured"], 0)
+        self.assertNotIn("hours_saved", group)
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from django.contrib.auth.mixins import PermissionRequiredMixin
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -5,7 +7,7 @@ from rest_framework.views import APIView
 from api.utils import parse_date_param
 from mvp.mixins import DecodePublicIdMixin
 from mvp.serializers import ai_composition_serializer, charts_serializer
-from mvp.services import AICompositionService
+from mvp.services import AICompositionService, OrganizationCacheService
 
 
 class RepositoriesCompositionView(DecodePublicIdMixin, PermissionRequiredMixin, APIView):
@@ -18,14 +20,22 @@ class RepositoriesCompositionView(DecodePublicIdMixin, PermissionRequiredMixin,
         since = parse_date_param(request, "since")
         until = parse_date_param(request, "until")
 
-        service = AICompositionService(current_org)
+        # the default date range moves every day
+        data = OrganizationCacheService.get_or_set(
+            current_org,
+            f"{self.__class__.__name__}_{since}_{until}_{datetime.utcnow().date()}",
+            lambda: self.get_composition_data(current_org, since, until),
+        )
+
+        return Response(data)
+
+    def get_composition_data(self, organization, since, until):
+        service = AICompositionService(organization)
         cumulative_charts, daily_charts = service.get_charts(since=since, until=until, daily_charts=True)
         ai_composition = service.get_composition(cumulative_charts)
 
-        return Response(
-            {
-                "ai_composition": ai_composition_serializer(ai_composition),
-                "cumulative_charts": charts_serializer(cumulative_charts),
-                "daily_charts": charts_serializer(daily_charts),
-            }
-        )
+        return {
+            "ai_composition": ai_composition_serializer(ai_composition),
+            "cumulative_charts": charts_serializer(cumulative_charts),
+            "daily_charts": charts_serializer(daily_charts),
+        }
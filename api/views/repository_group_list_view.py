@@ -18,6 +18,7 @@ from mvp.services import (
     AICompositionService,
     ConnectedIntegrationsService,
     GroupsAICodeService,
+    OrganizationCacheService,
     RuleService,
 )
 from mvp.services.roi_service import ROIService
@@ -26,13 +27,20 @@ from mvp.services.roi_service import ROIService
 class RepositoryGroupView(DecodePublicIdMixin, PermissionRequiredMixin, APIView):
     permission_required = "mvp.can_view_ai_code_monitor"
 
+    UNGROUPED_ID = "ungrouped"
+
     def get(self, request):
         current_org = request.current_organization
         until = parse_date_param(request, "until") or datetime.utcnow().date()
         since = parse_date_param(request, "since") or until - timedelta(days=ROIService.OVERALL_PERCENTAGE_PERIOD_DAYS)
 
-        organization_rules = RuleService.get_organization_rules(current_org)
-        repositories = self.get_repositories_data(current_org, organization_rules, since, until)
+        repositories = OrganizationCacheService.get_or_set(
+            current_org,
+            f"{self.__class__.__name__}_{since}_{until}",
+            lambda: self.get_repositories_data(
+                current_org, RuleService.get_organization_rules(current_org), since, until
+            ),
+        )
 
         integrations = ConnectedIntegrationsService.get_connected_integration_statuses(
             organization=current_org,
@@ -48,30 +56,56 @@ class RepositoryGroupView(DecodePublicIdMixin, PermissionRequiredMixin, APIView)
         since=None,
         until=None,
     ):
-        groups = self.get_grouped_data(
+        groups = self.get_groups(organization, until)
+        ungrouped_repositories = self.get_ungrouped_repositories(organization, until)
+
+        repositories_by_group = {group.id: list(group.repository_set.all()) for group in groups}
+        repositories_by_group[self.UNGROUPED_ID] = list(ungrouped_repositories)
+        all_repositories = [repo for repos in repositories_by_group.values() for repo in repos]
+
+        # Fetch the composition data of all groups at once to avoid N+1 queries
+        service = AICompositionService(organization)
+        charts = service.get_charts_by_group(since, until, repositories_by_group, daily_charts=True)
+        daily_data = (
+            service.get_daily_num_lines_by_repository(since, until, all_repositories) if all_repositories else {}
+        )
+        roi_percentages = ROIService.get_overall_percentages(
+            organization,
+            {
+                group.id: repositories_by_group[group.id]
+                for group in groups
+                if self.has_roi(group) and repositories_by_group[group.id]
+            },
+        )
+
+        groups_serialized = self.get_grouped_data(
             organization,
             organization_rules,
+            groups,
+            charts,
+            daily_data,
+            roi_percentages,
             with_attestation_data=True,
-            since=since,
             until=until,
         )
-        ungrouped = self.get_ungrouped_data(organization, with_attestation_data=True, since=since, until=until)
-        num_repositories = len(ungrouped["repositories"]) + sum([len(group["repositories"]) for group in groups])
+        ungrouped = self.get_ungrouped_data(
+            ungrouped_repositories,
+            charts[self.UNGROUPED_ID],
+            daily_data,
+            with_attestation_data=True,
+            until=until,
+        )
+        num_repositories = len(ungrouped["repositories"]) + sum(
+            [len(group["repositories"]) for group in groups_serialized]
+        )
 
         return {
             "count": num_repositories,
-            "groups": groups,
+            "groups": groups_serialized,
             "ungrouped": ungrouped,
         }
 
-    def get_grouped_data(
-        self,
-        organization,
-        organization_rules,
-        with_attestation_data=False,
-        since=None,
-        until=None,
-    ):
+    def get_groups(self, organization, until=None):
         repository_set_prefetch = Prefetch(
             "repository_set",
             queryset=Repository.objects.annotate(
@@ -89,13 +123,24 @@ class RepositoryGroupView(DecodePublicIdMixin, PermissionRequiredMixin, APIView)
             to_attr="until_commit",
         )
 
-        groups = organization.repositorygroup_set.prefetch_related(
+        return organization.repositorygroup_set.prefetch_related(
             "rules",
             "rules__conditions",
             repository_set_prefetch,
             until_commit_prefetch,
         ).order_by("name")
 
+    def get_grouped_data(
+        self,
+        organization,
+        organization_rules,
+        groups,
+        charts,
+        daily_data,
+        roi_percentages,
+        with_attestation_data=False,
+        until=None,
+    ):
         context = {"with_attestation_data": with_attestation_data, "until": until}
 
         if with_attestation_data:
@@ -104,24 +149,17 @@ class RepositoryGroupView(DecodePublicIdMixin, PermissionRequiredMixin, APIView)
 
         groups_serialized = RepositoryGroupSerializer(groups, many=True, context=context).data
 
-        service = AICompositionService(organization)
-        repositories = [repo for group in groups for repo in group.repository_set.all()]
-
-        daily_data = service.get_daily_num_lines_by_repository(since, until, repositories)
-
         for group, group_serialized in zip(groups, groups_serialized):
             rule_risk_list = self.get_group_rule_risk_list(group, organization_rules)
             group_serialized["rule_risk_list"] = [(RuleSerializer(rule).data, risk) for rule, risk in rule_risk_list]
             repos = group.repository_set.all()
             group_serialized["num_files"] = sum(repo.last_analysis_num_files for repo in repos)
 
-            # TODO: avoid N+1
-            group_serialized["charts_cumulative"], group_serialized["charts_daily"] = self.get_repositories_chart(
-                organization, repos, group.id, since, until
-            )
+            charts_cumulative, charts_daily = charts[group.id]
+            group_serialized["charts_cumulative"] = charts_serializer(charts_cumulative)
+            group_serialized["charts_daily"] = charts_serializer(charts_daily)
 
-            # TODO: avoid N+1
-            self.add_roi_fields(organization, group, group_serialized, repos)
+            self.add_roi_fields(organization, group, group_serialized, roi_percentages.get(group.id))
 
             range_ai_fields = self.get_date_range_ai_fields(repos, daily_data)
 
@@ -143,8 +181,8 @@ class RepositoryGroupView(DecodePublicIdMixin, PermissionRequiredMixin, APIView)
 
         return groups_serialized
 
-    def get_ungrouped_data(self, organization, with_attestation_data=False, since=None, until=None):
-        repositories = (
+    def get_ungrouped_repositories(self, organization, until=None):
+        return (
             Repository.objects.filter(
                 organization=organization,
                 last_analysis_num_files__gt=0,
@@ -161,6 +199,7 @@ class RepositoryGroupView(DecodePublicIdMixin, PermissionRequiredMixin, APIView)
             .prefetch_related(Repository.get_prefetch_commit_before_date(until))
         )
 
+    def get_ungrouped_data(self, repositories, charts, daily_data, with_attestation_data=False, until=None):
         context = {"with_attestation_data": with_attestation_data, "until": until}
 
         if with_attestation_data:
@@ -170,8 +209,6 @@ class RepositoryGroupView(DecodePublicIdMixin, PermissionRequiredMixin, APIView)
 
         attested_num_lines = 0
 
-        service = AICompositionService(organization)
-        daily_data = service.get_daily_num_lines_by_repository(since, until, repositories)
         date_ai_fields = self.get_date_range_ai_fields(repositories, daily_data)
 
         if until:
@@ -190,14 +227,12 @@ class RepositoryGroupView(DecodePublicIdMixin, PermissionRequiredMixin, APIView)
             attested_num_lines = sum(repo["attested_num_lines"] for repo in repositories_serialized)
 
         num_files = sum(repo["last_analysis_num_files"] for repo in repositories_serialized)
-        charts_cumulative, charts_daily = self.get_repositories_chart(
-            organization, repositories, "ungrouped", since, until
-        )
+        charts_cumulative, charts_daily = charts
 
         return {
             "name": "Ungrouped",
-            "charts_cumulative": charts_cumulative,
-            "charts_daily": charts_daily,
+            "charts_cumulative": charts_serializer(charts_cumulative),
+            "charts_daily": charts_serializer(charts_daily),
             "repositories": repositories_serialized,
             "num_files": num_files,
             "attested_num_lines": attested_num_lines,
@@ -208,24 +243,17 @@ class RepositoryGroupView(DecodePublicIdMixin, PermissionRequiredMixin, APIView)
     def get_group_rule_risk_list(self, group, organization_rules):
         return RuleService.get_instance_rules_list(group, list(group.rules.all()) + list(organization_rules))
 
-    def get_repositories_chart(self, organization, repositories, group_id, since, until):
-        if not repositories:
-            return [], []
-
-        service = AICompositionService(organization)
-        charts_cumulative, charts_daily = service.get_charts(
-            since, until, repositories, identifier=group_id, daily_charts=True
-        )
-
-        return charts_serializer(charts_cumulative), charts_serializer(charts_daily)
+    def has_roi(self, group):
+        return group.roi_enabled and group.max_genai_code_usage_percentage > 0
 
-    def add_roi_fields(self, organization, group, group_serialized, repositories):
-        if not group.roi_enabled or group.max_genai_code_usage_percentage <= 0 or not repositories:
+    def add_roi_fields(self, organization, group, group_serialized, roi_percentage):
+        # groups without ROI or without repositories have no percentage
+        if not self.has_roi(group) or roi_percentage is None:
             group_serialized["productivity_achievement"] = 0
             group_serialized["potential_productivity_captured"] = 0
             return
 
-        overall_percentage, debug_data = ROIService.get_overall_percentage(group, organization, repositories)
+        overall_percentage, debug_data = roi_percentage
 
         group_serialized["potential_productivity_captured"] = ROIService.get_potential_productivity_captured(
             overall_percentage, group
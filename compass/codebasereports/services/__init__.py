@@ -3,6 +3,7 @@ from .sema_score_calculator import SemaScoreCalculator  # noqa: F401
 from .sema_score_data_provider import SemaScoreDataProvider  # noqa: F401
 from .sema_score_service import SemaScoreService  # noqa: F401
 from .trend_change_calculator import (  # noqa: F401
+    RollingTrendChangeCalculator,
     TrendChangeCalculator,
     TrendChangeConfig,
 )
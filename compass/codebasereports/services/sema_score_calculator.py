@@ -125,54 +125,70 @@ class SemaScoreCalculator:
         self.provider = SemaScoreDataProvider(organization)
 
     def get_scores(self, date):
-        self.init_scores(date)
-        self.update_scores()
+        return self.get_scores_by_day([date])[0]
 
-        return (
-            self.get_score_value(self.SCORE_SEMA),
-            self.get_score_value(self.SCORE_COMPLIANCE),
-            self.get_score_value(self.SCORE_PRODUCT),
-        )
+    def get_scores_by_day(self, days):
+        """
+        Returns the (sema, compliance, product) scores of each day.
 
-    def init_scores(self, date):
+        The reference metrics and the provider data are loaded once for the whole range, and the scores of
+        all the days are calculated at once, a metric at a time.
+        """
         ref_metrics = pd.DataFrame.from_records(self.provider.get_reference_metrics())
-        self.metric_values = self.get_metric_values(date, ref_metrics) if not ref_metrics.empty else None
+        quartiles = self.get_metric_quartiles(days, ref_metrics) if not ref_metrics.empty else {}
+
+        scores = {
+            score_name: self.get_score_values(quartiles, metrics, len(days))
+            for score_name, metrics in (
+                (self.SCORE_SEMA, self.metrics),
+                (self.SCORE_COMPLIANCE, self.get_module_type_metrics(self.SCORE_COMPLIANCE)),
+                (self.SCORE_PRODUCT, self.get_module_type_metrics(self.SCORE_PRODUCT)),
+            )
+        }
 
-        self._sema_score = [0, 0]  # numerator, denominator
-        self._product_score = [0, 0]
-        self._compliance_score = [0, 0]
+        return [
+            (scores[self.SCORE_SEMA][index], scores[self.SCORE_COMPLIANCE][index], scores[self.SCORE_PRODUCT][index])
+            for index in range(len(days))
+        ]
 
-    def update_scores(self):
-        for metric in self.metrics:
-            quartile = self.get_metric_quartile(metric)
-            if not quartile:
-                continue
+    def get_module_type_metrics(self, module_type):
+        modules_df = self.modules_df
+        return modules_df[modules_df["module_type"] == module_type]["metric"].tolist()
 
-            self._update_score(self.SCORE_SEMA, metric, quartile)
+    def get_score_values(self, quartiles, metrics, num_days):
+        """
+        Weighted average of the quartile weights of the metrics with a value, as a percentage
+        """
+        numerator = None
+        denominator = None
+        for metric in metrics:
+            metric_quartiles = quartiles.get(metric)
+            if metric_quartiles is None:
+                continue
 
-            module_type = self.get_modules_df_metric_value(metric, "module_type")
-            self._update_score(module_type, metric, quartile)
+            if numerator is None:
+                numerator = np.zeros(len(metric_quartiles))
+                denominator = np.zeros(len(metric_quartiles), dtype=int)
 
-    def _update_score(self, score_name, metric, quartile):
-        score = self.get_score_by_name(score_name)
-        metric_weight = self.get_modules_df_metric_value(metric, "weight")
+            has_value = metric_quartiles > 0
+            metric_weight = self.get_modules_df_metric_value(metric, "weight")
+            quartile_weights = np.array([self.QUARTILE_WEIGHT.get(quartile, 0) for quartile in metric_quartiles])
 
-        score[0] += metric_weight * self.QUARTILE_WEIGHT[quartile]
-        score[1] += metric_weight
+            # metrics are added one at a time, in the same order for every day
+            numerator = np.where(has_value, numerator + metric_weight * quartile_weights, numerator)
+            denominator = np.where(has_value, denominator + metric_weight, denominator)
 
-    def get_score_by_name(self, name):
-        return getattr(self, f"_{name}_score")
+        if numerator is None:
+            return [None] * num_days
 
-    def get_score_value(self, score_name):
-        numerator, denominator = self.get_score_by_name(score_name)
-        return int(np.ceil(numerator * 100 / denominator)) if denominator else None
+        return [
+            int(np.ceil(day_numerator * 100 / day_denominator)) if day_denominator else None
+            for day_numerator, day_denominator in zip(numerator, denominator)
+        ]
 
     def get_modules_df_metric_value(self, metric, column):
         return self.modules_df[self.modules_df["metric"] == metric][column].values[0]
 
-    def get_metric_quartile(self, metric):
-        return self.metric_values[metric] if self.metric_values is not None and metric in self.metric_values else 0
-
     def get_percentiles(self, ref_metrics, metric):
         result = ref_metrics[(ref_metrics["metric"] == metric)]
         if result.empty:
@@ -196,19 +212,20 @@ class SemaScoreCalculator:
 
         return 4
 
-    def get_metric_values(self, date, ref_metrics):
+    def get_metric_quartiles(self, days, ref_metrics):
         """
-        Returns the values for each metric on a given date
+        Returns the quartile of each metric on each day, 0 when the metric has no value
         """
         result = {}
         for metric in self.metrics:
-            value = self.provider.get_metric_value(metric, date)
-            if value is None:
+            values = [self.provider.get_metric_value(metric, day) for day in days]
+            if all(value is None for value in values):
                 continue
 
+            # percentiles are decimals, compared one by one so that there are no float rounding differences
             percentiles = self.get_percentiles(ref_metrics, metric)
-            quartile = self.get_quartile(value, percentiles)
-            result[metric.lower()] = [quartile]
+            result[metric] = np.array(
+                [self.get_quartile(value, percentiles) if value is not None else 0 for value in values]
+            )
 
-        result_df = pd.DataFrame(result)
-        return result_df.iloc[0] if not result_df.empty else None
+        return result
@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
 
+import pandas as pd
 from django.conf import settings
 from django.db.models import Sum
 
@@ -20,13 +21,16 @@ from mvp.models import DataProviderMemberProjectRecord, ReferenceMetric
 from mvp.services import OrganizationSegmentService
 from mvp.utils import get_months_ago
 
-from .trend_change_calculator import TrendChangeCalculator, TrendChangeConfig
+from .trend_change_calculator import RollingTrendChangeCalculator, TrendChangeCalculator
 
 
 class SemaScoreDataProvider:
     def __init__(self, organization):
         self.organization = organization
-        self._commits_per_developer = {}
+        self._commit_trend_evaluations = {}
+        self._commit_trend_calculator = None
+        self._commits_per_developer_since = None
+        self._chart_day_indexes = {}
         self._widgets = {}
 
         self.until = datetime.utcnow().date()
@@ -55,10 +59,7 @@ class SemaScoreDataProvider:
         return self.get_snyk_issues_value(date, "license", severities=severities)
 
     def get_snyk_issues_value(self, date, issue_type, severities=[SnykIssueSeverity.HIGH]):
-        if "snyk" not in self._widgets:
-            self._widgets["snyk"] = SnykWidget(self.organization).get_widgets(self.since, self.until)
-
-        chart = self._widgets["snyk"].get(f"chart_snyk_issues_{issue_type}")
+        chart = self.get_widgets(SnykWidget).get(f"chart_snyk_issues_{issue_type}")
         if not chart:
             return None
 
@@ -82,10 +83,7 @@ class SemaScoreDataProvider:
 
     def get_cyber_security_evaluation_value(self, date):
         # TODO: when we have other Cyber Security data providers, we need to choose among them
-        if "iradar" not in self._widgets:
-            self._widgets["iradar"] = IRadarWidget(self.organization).get_widgets(self.since, self.until)
-
-        chart = self._widgets["iradar"].get("chart_iradar_submodules_with_risk")
+        chart = self.get_widgets(IRadarWidget).get("chart_iradar_submodules_with_risk")
         if not chart:
             return None
 
@@ -94,10 +92,7 @@ class SemaScoreDataProvider:
         return self.get_chart_day_value(chart, day) if chart else None
 
     def get_developers_retention_ratio_value(self, date):
-        if "team" not in self._widgets:
-            self._widgets["team"] = TeamWidget(self.organization).get_widgets(self.since, self.until)
-
-        chart = self._widgets["team"].get("chart_team_developers_percentage")
+        chart = self.get_widgets(TeamWidget).get("chart_team_developers_percentage")
         if not chart:
             return None
 
@@ -108,10 +103,7 @@ class SemaScoreDataProvider:
 
     def get_in_house_current_test_ratio_value(self, date):
         # TODO: when we have other Code Quality data providers, we need to choose among them
-        if "codacy" not in self._widgets:
-            self._widgets["codacy"] = CodacyWidget(self.organization).get_widgets(self.since, self.until)
-
-        chart = self._widgets["codacy"].get("chart_codacy_coverage_percentage")
+        chart = self.get_widgets(CodacyWidget).get("chart_codacy_coverage_percentage")
         if not chart:
             return None
 
@@ -120,45 +112,63 @@ class SemaScoreDataProvider:
 
         return value / 100 if value else 0
 
+    def get_widgets(self, widget_class):
+        if widget_class not in self._widgets:
+            self._widgets[widget_class] = widget_class(self.organization).get_cached_widgets(self.since, self.until)
+
+        return self._widgets[widget_class]
+
+    def get_loaded_widgets(self, widget_class):
+        return self._widgets.get(widget_class)
+
     def get_chart_day_value(self, chart, day, series_index=0):
         if not chart or chart.get("no_data"):
             return None
 
-        try:
-            index = chart["categories"].index(day)
-            return chart["series"][series_index]["data"][index]
-        except ValueError:
+        index = self.get_chart_day_index(chart, day)
+        if index is None:
             return None
 
-    def get_average_developer_activity_evaluation_value(self, date):
-        records = self.get_commits_per_developer(date)
-        if not records:
-            return None
+        return chart["series"][series_index]["data"][index]
 
-        return TrendChangeCalculator().average_developer_activity(records, TrendChangeConfig())
+    def get_chart_day_index(self, chart, day):
+        # charts are kept in self._widgets, so their ids don't change while the indexes are used
+        chart_id = id(chart)
+        if chart_id not in self._chart_day_indexes:
+            self._chart_day_indexes[chart_id] = {category: index for index, category in enumerate(chart["categories"])}
 
-    def get_commit_analysis_evaluation_value(self, date):
-        records = self.get_commits_per_developer(date)
-        if not records:
-            return None
+        return self._chart_day_indexes[chart_id].get(day)
 
-        return TrendChangeCalculator().commit_analysis(records, TrendChangeConfig())
+    def get_average_developer_activity_evaluation_value(self, date):
+        return self.get_commit_trend_evaluation(date, "average_developer_activity")
+
+    def get_commit_analysis_evaluation_value(self, date):
+        return self.get_commit_trend_evaluation(date, "commit_analysis")
 
     def get_developers_and_development_activity_evaluation_value(self, date):
-        records = self.get_commits_per_developer(date)
-        if not records:
-            return None
+        return self.get_commit_trend_evaluation(date, "developers_and_development_activity")
+
+    def get_commit_trend_evaluation(self, date, trend):
+        """
+        Evaluates the trends of the commits per developer of the trailing LAST_NUM_MONTHS months,
+        None if there are no commits.
 
-        return TrendChangeCalculator().developers_and_development_activity(records, TrendChangeConfig())
+        The records since the first date are loaded in a single query, and the window slides over them
+        as dates go forward, so consecutive dates don't evaluate the whole window again.
+        """
+        if date not in self._commit_trend_evaluations:
+            since = get_months_ago(date, TrendChangeCalculator.LAST_NUM_MONTHS)
+            if self._commit_trend_calculator is None or since < self._commits_per_developer_since:
+                self._commit_trend_calculator = RollingTrendChangeCalculator(self.load_commits_per_developer(since))
+                self._commits_per_developer_since = since
 
-    def get_commits_per_developer(self, date):
-        if date not in self._commits_per_developer:
-            self._commits_per_developer[date] = self._get_commits_per_developer(date)
+            self._commit_trend_evaluations[date] = self._commit_trend_calculator.evaluate(since, date)
 
-        return self._commits_per_developer[date]
+        evaluations = self._commit_trend_evaluations[date]
+        return evaluations[trend] if evaluations else None
 
-    def _get_commits_per_developer(self, date):
-        return (
+    def load_commits_per_developer(self, since):
+        records = (
             DataProviderMemberProjectRecord.objects.filter(
                 member__organization=self.organization,
                 field__name__in=[
@@ -166,9 +176,12 @@ class SemaScoreDataProvider:
                     BitBucketIntegration.FIELD_COMMIT_COUNT,
                     GitHubIntegration.FIELD_COMMIT_COUNT,
                 ],
-                date_time__gte=get_months_ago(date, TrendChangeCalculator.LAST_NUM_MONTHS),
-                date_time__lte=date,
+                date_time__gte=since,
             )
             .values("date_time", "member__external_id")
             .annotate(commits=Sum("value"))
+            .order_by("date_time")
         )
+        df = pd.DataFrame.from_records(records, columns=["date_time", "member__external_id", "commits"])
+        df["date_time"] = pd.to_datetime(df["date_time"], utc=True)
+        return df
@@ -1,5 +1,13 @@
 import logging
 
+from compass.codebasereports.widgets import (
+    CodacyWidget,
+    IRadarWidget,
+    ProcessWidget,
+    SemaScoreWidget,
+    SnykWidget,
+    TeamWidget,
+)
 from compass.integrations.integrations import (
     SnykIntegration,
     get_codebase_reports_providers,
@@ -14,6 +22,9 @@ logger = logging.getLogger(__name__)
 
 class SemaScoreService:
     NUM_MONTHS_HISTORIC = 3
+    RECORDS_BATCH_SIZE = 1000
+
+    REPORT_WIDGETS = [CodacyWidget, IRadarWidget, ProcessWidget, SemaScoreWidget, SnykWidget, TeamWidget]
 
     def __init__(self, organization):
         self.organization = organization
@@ -38,21 +49,44 @@ class SemaScoreService:
         logger.info(f'Calculating scores for "{self.organization}" since {since} until {until}')
 
         days = get_days(since, until)
+        scores_by_day = self.calculator.get_scores_by_day(days)
 
-        for day in days:
-            self.record_scores(day, *self.calculator.get_scores(day))
+        num_records = self.record_scores(zip(days, scores_by_day))
+        logger.info(f'Recorded {num_records} scores for "{self.organization}" ({len(days)} days)')
 
         return True
 
-    def record_scores(self, date, sema_score, compliance_score, product_score):
-        if sema_score is not None or compliance_score is not None or product_score is not None:
-            ScoreRecord.objects.create(
+    def populate_widgets(self):
+        """
+        Stores the report widgets of the default time window for the current data version of the organization,
+        so the views don't compute them. The ones loaded for the scores are reused, as the scores don't change them.
+        """
+        provider = self.calculator.provider
+        for widget_class in self.REPORT_WIDGETS:
+            widget = widget_class(self.organization)
+            widgets = provider.get_loaded_widgets(widget_class)
+            if widgets is not None:
+                widget.set_cached_widgets(provider.since, provider.until, widgets)
+            else:
+                widget.get_cached_widgets(provider.since, provider.until)
+
+    def record_scores(self, scores_by_day):
+        """
+        Creates the score records of all the days with any score in a single insert
+        """
+        records = [
+            ScoreRecord(
                 organization=self.organization,
                 compliance_score=compliance_score,
                 product_score=product_score,
                 sema_score=sema_score,
                 date_time=date,
             )
+            for date, (sema_score, compliance_score, product_score) in scores_by_day
+            if sema_score is not None or compliance_score is not None or product_score is not None
+        ]
+        ScoreRecord.objects.bulk_create(records, batch_size=self.RECORDS_BATCH_SIZE)
+        return len(records)
 
     def delete_records_on_new_connections(self):
         last_record = self.get_last_score_record()
@@ -1,5 +1,7 @@
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
 
@@ -38,7 +40,7 @@ class TrendChangeCalculator:
         return self.calculate_trend(df, "member__external_id", conf)
 
     def records_to_df(self, records):
-        df = pd.DataFrame.from_records(records)
+        df = records.copy() if isinstance(records, pd.DataFrame) else pd.DataFrame.from_records(records)
         df["date_time"] = pd.to_datetime(df["date_time"])
         df["month"] = df["date_time"].dt.month
         df["year"] = df["date_time"].dt.year
@@ -46,16 +48,17 @@ class TrendChangeCalculator:
 
     def calculate_trend(self, df, column_name, conf: TrendChangeConfig):
         df = df.rolling(conf.moving_window, min_periods=1).mean()
-        y = df[column_name].values
+        return self.calculate_trend_values(df[column_name].values, df.index, conf)
 
-        df_months = df.iloc[-self.LAST_NUM_MONTHS :]
-        y_last_months = df_months[column_name].values
+    def calculate_trend_values(self, y, index, conf: TrendChangeConfig):
+        """
+        Evaluates the trend of the monthly values y (already averaged by the moving window), labelled by index
+        """
+        y_last_months = y[-self.LAST_NUM_MONTHS :]
+        index_last_months = index[-self.LAST_NUM_MONTHS :]
 
         global_maxima = y_last_months.max()
-        global_maxima_date = df_months[column_name].idxmax()
-
         global_minima = y_last_months.min()
-        global_minima_date = df_months[column_name].idxmin()
 
         perc_dec_last_months = (y_last_months[-1] - global_maxima) / global_maxima
         perc_inc_last_months = (y_last_months[-1] - global_minima) / global_minima
@@ -67,35 +70,21 @@ class TrendChangeCalculator:
             return self.EVALUATION_STRENGTH
 
         (
-            time_periods_inc,
+            _,
             perc_diff_inc,
-            time_periods_dec,
+            _,
             perc_diff_dec,
-        ) = self.evaluate_time_periods(y_last_months, df_months, conf, y.mean())
-        time_periods_inc.extend(time_periods_dec)
-        perc_diff_inc.extend(perc_diff_dec)
-
-        df_temp = pd.DataFrame(columns=["Start", "End", "Percentage Difference"])
-        df_temp["Start"] = [x[0] for x in time_periods_inc]
-        df_temp["End"] = [x[1] for x in time_periods_inc]
-        df_temp["Percentage Difference"] = perc_diff_inc
-
-        df_temp = df_temp[df_temp["Percentage Difference"] > conf.commit_delta]
-        df_temp.sort_values(by=["Percentage Difference"], inplace=True, ascending=False)
-        if df_temp.shape[0] == 0:
-            return self.EVALUATION_STRENGTH
+        ) = self.evaluate_time_periods(y_last_months, index_last_months, conf, y.mean())
 
-        if df_temp.shape[0] >= 2:
-            df_temp = df_temp.iloc[:2, :]
-            df_temp = df_temp.sort_values(by=["Start"], ascending=True)
-            df_temp = df_temp.reset_index(drop=True)
+        # only the biggest difference matters, the time periods are just for reference
+        perc_diffs = [perc_diff for perc_diff in perc_diff_inc + perc_diff_dec if perc_diff > conf.commit_delta]
+        if not perc_diffs:
+            return self.EVALUATION_STRENGTH
 
-        risk_type = [self.EVALUATION_LOW_RISK, self.EVALUATION_MEDIUM_RISK][
-            int(df_temp["Percentage Difference"].max() > conf.risk_threshold)
-        ]
+        risk_type = [self.EVALUATION_LOW_RISK, self.EVALUATION_MEDIUM_RISK][int(max(perc_diffs) > conf.risk_threshold)]
         return risk_type
 
-    def evaluate_time_periods(self, y, df, conf: TrendChangeConfig, y_avg=None):
+    def evaluate_time_periods(self, y, index, conf: TrendChangeConfig, y_avg=None):
         if y_avg is None:
             y_avg = y.mean()
         prev = y[0]
@@ -154,7 +143,7 @@ class TrendChangeCalculator:
         for mn in minima:
             for mx in maxima:
                 if mn < mx:
-                    time_periods_inc.append((df.index[mn], df.index[mx]))
+                    time_periods_inc.append((index[mn], index[mx]))
                     if conf.use_average:
                         perc_diff_inc.append((y[mx] - y[mn]) / y_avg)
                     else:
@@ -163,10 +152,95 @@ class TrendChangeCalculator:
         for mx in maxima:
             for mn in minima:
                 if mn > mx:
-                    time_periods_dec.append((df.index[mx], df.index[mn]))
+                    time_periods_dec.append((index[mx], index[mn]))
                     if conf.use_average:
                         perc_diff_dec.append((y[mx] - y[mn]) / y_avg)
                     else:
                         perc_diff_dec.append((y[mx] - y[mn]) / y[mx])
                     break
         return time_periods_inc, perc_diff_inc, time_periods_dec, perc_diff_dec
+
+
+class RollingTrendChangeCalculator(TrendChangeCalculator):
+    """
+    Evaluates the trends of a window of commits per developer that slides forward, e.g. day by day.
+
+    Instead of building a data frame of the records in the window on every move, it keeps the commits and
+    the members of each month in the window, adding the records that enter it and removing the ones that leave.
+    The evaluations are the same as the ones of TrendChangeCalculator for the records in the window.
+    """
+
+    def __init__(self, records: pd.DataFrame, conf: TrendChangeConfig | None = None):
+        """
+        records: date_time (sorted), member__external_id and commits columns
+        """
+        self.conf = conf or TrendChangeConfig()
+        self.dates = pd.to_datetime(records["date_time"])
+        self.months = list(zip(self.dates.dt.year, self.dates.dt.month))
+        self.members = records["member__external_id"].tolist()
+        self.commits = records["commits"].tolist()
+        self.reset()
+
+    def reset(self, start=0):
+        self.start = start
+        self.end = start
+        self.since = None
+        self.until = None
+        self.month_commits = defaultdict(int)
+        self.month_members = defaultdict(Counter)
+
+    def move_window(self, since, until):
+        """
+        Moves the window to the records from since until until (both included)
+        """
+        if self.since is not None and (since < self.since or until < self.until):
+            self.reset()
+
+        start = self.dates.searchsorted(pd.Timestamp(since), side="left")
+        end = max(self.dates.searchsorted(pd.Timestamp(until), side="right"), start)
+        if start >= self.end:
+            # none of the current records stay in the window
+            self.reset(start)
+
+        for index in range(self.end, end):
+            self.month_commits[self.months[index]] += self.commits[index]
+            self.month_members[self.months[index]][self.members[index]] += 1
+
+        for index in range(self.start, start):
+            month = self.months[index]
+            self.month_commits[month] -= self.commits[index]
+            self.month_members[month][self.members[index]] -= 1
+            if not self.month_members[month][self.members[index]]:
+                del self.month_members[month][self.members[index]]
+            if not self.month_members[month]:
+                del self.month_commits[month]
+                del self.month_members[month]
+
+        self.start, self.end = start, end
+        self.since, self.until = since, until
+
+    def evaluate(self, since, until):
+        """
+        Returns the evaluation of each trend for the records from since until until, None if there are none
+        """
+        self.move_window(since, until)
+        if not self.month_commits:
+            return None
+
+        months = sorted(self.month_commits)
+        commits = np.array([self.month_commits[month] for month in months])
+        members = np.array([len(self.month_members[month]) for month in months])
+
+        return {
+            "average_developer_activity": self.calculate_rolling_trend(commits / members, months),
+            "commit_analysis": self.calculate_rolling_trend(commits, months),
+            "developers_and_development_activity": self.calculate_rolling_trend(members, months),
+        }
+
+    def calculate_rolling_trend(self, values, months):
+        if self.conf.moving_window == 1:
+            y = values.astype(float)
+        else:
+            y = pd.Series(values).rolling(self.conf.moving_window, min_periods=1).mean().values
+
+        return self.calculate_trend_values(y, months, self.conf)
@@ -39,11 +39,11 @@ class ExecutiveSummaryView(PermissionRequiredMixin, APIView):
             {
                 **CaveatsWidget(current_org).get_widgets(),
                 **ConnectionsWidget(current_org).get_widgets(),
-                **IRadarWidget(current_org).get_widgets(since, until),
-                **ProcessWidget(current_org).get_widgets(since, until),
-                **SemaScoreWidget(current_org).get_widgets(since, until),
-                **SnykWidget(current_org).get_widgets(since, until),
-                **TeamWidget(current_org).get_widgets(since, until),
+                **IRadarWidget(current_org).get_cached_widgets(since, until),
+                **ProcessWidget(current_org).get_cached_widgets(since, until),
+                **SemaScoreWidget(current_org).get_cached_widgets(since, until),
+                **SnykWidget(current_org).get_cached_widgets(since, until),
+                **TeamWidget(current_org).get_cached_widgets(since, until),
                 "default_time_window_days": settings.DEFAULT_TIME_WINDOW_DAYS,
                 "org_first_date": current_org.get_first_commit_date(),
                 "since": since,
@@ -65,10 +65,10 @@ class ProductDetailView(PermissionRequiredMixin, APIView):
 
         return Response(
             {
-                **CodacyWidget(current_org).get_widgets(since, until),
+                **CodacyWidget(current_org).get_cached_widgets(since, until),
                 **ConnectionsWidget(current_org).get_widgets(ConnectionsWidget.MODULES_PRODUCT),
-                **ProcessWidget(current_org).get_widgets(since, until),
-                **TeamWidget(current_org).get_widgets(since, until),
+                **ProcessWidget(current_org).get_cached_widgets(since, until),
+                **TeamWidget(current_org).get_cached_widgets(since, until),
                 "default_time_window_days": settings.DEFAULT_TIME_WINDOW_DAYS,
                 "org_first_date": current_org.get_first_commit_date(),
                 "since": since,
@@ -86,8 +86,8 @@ class ComplianceDetailView(PermissionRequiredMixin, APIView):
         since, until = get_request_dates(request)
         data = {
             **ConnectionsWidget(current_org).get_widgets(ConnectionsWidget.MODULES_COMPLIANCE),
-            **IRadarWidget(current_org).get_widgets(since, until),
-            **SnykWidget(current_org).get_widgets(since, until),
+            **IRadarWidget(current_org).get_cached_widgets(since, until),
+            **SnykWidget(current_org).get_cached_widgets(since, until),
         }
         integrations = ConnectedIntegrationsService().get_connected_integration_statuses(
             current_org, ConnectedIntegrationsService.GIT_INTEGRATION_MAP_KEYS
@@ -1,9 +1,11 @@
 from datetime import datetime, timedelta
 
-import pandas as pd
+from django.db.models import DateTimeField, ExpressionWrapper, F, Min, Window
+from django.db.models.functions import TruncDate, TruncMonth, TruncWeek
 
 from compass.codebasereports.widgets import BaseWidget
 from mvp.models import DataProviderMemberProjectRecord, DataProviderRecord
+from mvp.services import OrganizationCacheService
 from mvp.utils import (
     get_days,
     get_first_day_week,
@@ -36,10 +38,34 @@ class ChartWidget(BaseWidget):
     # how many months to look back for records to fill gaps
     OLD_RECORDS_MONTHS = 3
 
+    CACHE_NAME_TEMPLATE = "widget_{widget}_{since}_{until}"
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._old_records = None
 
+    def get_cached_widgets(self, since, until):
+        """
+        The widgets are computed at most once per data version of the organization,
+        and shared by the views and the scores calculation
+        """
+        return OrganizationCacheService.get_or_set(
+            self.organization,
+            self.get_cache_name(since, until),
+            lambda: self.get_widgets(since, until),
+        )
+
+    def set_cached_widgets(self, since, until, widgets):
+        OrganizationCacheService.set(self.organization, self.get_cache_name(since, until), widgets)
+
+    @classmethod
+    def get_cache_name(cls, since, until):
+        return cls.CACHE_NAME_TEMPLATE.format(
+            widget=cls.__name__,
+            since=since.strftime(cls.DATE_DAY),
+            until=until.strftime(cls.DATE_DAY),
+        )
+
     def get_since_until(self, days=DAYS_MONTH, months=None, include_today=False):
         now = datetime.utcnow().date()
         until = get_tz_date(now if not include_today else now + timedelta(days=1))
@@ -47,41 +73,55 @@ class ChartWidget(BaseWidget):
 
         return (since, until)
 
-    def get_records(self, field_names, since, until, members=False):
-        model = DataProviderRecord
+    def filter_records(self, field_names, since, until, members=False):
+        model = DataProviderMemberProjectRecord if members else DataProviderRecord
+        return model.objects.filter(
+            project__organization=self.organization,
+            field__name__in=field_names,
+            date_time__gte=since,
+            date_time__lt=until,
+        )
+
+    def get_record_values(self, members=False):
         values = ["field__name", "project__name", "project__id", "value", "date_time"]
         if members:
-            model = DataProviderMemberProjectRecord
             values.extend(["member__id", "member__name"])
 
-        return (
-            model.objects.select_related("project", "field")
-            .filter(
-                project__organization=self.organization,
-                field__name__in=field_names,
-                date_time__gte=since,
-                date_time__lt=until,
-            )
-            .order_by("date_time")
-            .values(*values)
-        )
+        return values
 
-    def sanitize_records(self, records):
+    def get_latest_records(self, field_names, since, until, members=False, aggregate=None):
         """
-        Keep the most recent for each project, field, and day
+        Keep the most recent for each project, field, (member,) and day, or aggregate date if given.
+
+        The database picks the records, so only the ones shown in the charts are loaded. They are sorted by the
+        first record of their day, as the charts series follow the order of the records.
         """
-        sanitized_records = {}
-        for record in records:
-            field_name = record["field__name"]
-            project_id = record["project__id"]
-            member_id = record.get("member__id")
-            day = record["date_time"].strftime(self.DATE_DAY)
-            key = f"{field_name}_{project_id}_{day}"
-            if member_id:
-                key = f"{member_id}_{key}"
-            sanitized_records[key] = record
+        distinct_fields = ["field__name", "project__id", "aggregate_date"]
+        if members:
+            distinct_fields.insert(0, "member__id")
+
+        records = (
+            self.filter_records(field_names, since, until, members)
+            .annotate(aggregate_date=self.get_aggregate_date_expression(aggregate))
+            .annotate(
+                first_date_time=Window(Min("date_time"), partition_by=[F(field) for field in distinct_fields]),
+            )
+            .order_by(*distinct_fields, "-date_time", "-id")
+            .distinct(*distinct_fields)
+            .values(*self.get_record_values(members), "aggregate_date", "first_date_time")
+        )
+
+        return sorted(records, key=lambda record: record["first_date_time"])
+
+    def get_aggregate_date_expression(self, aggregate):
+        if aggregate == self.AGGREGATE_DATE_FORMAT_MONTH:
+            return TruncMonth("date_time")
+
+        if aggregate == self.AGGREGATE_DATE_FORMAT_WEEK:
+            # weeks start on Sunday (see get_first_day_week), while they start on Monday for the database
+            return TruncWeek(ExpressionWrapper(F("date_time") + timedelta(days=1), output_field=DateTimeField()))
 
-        return list(sanitized_records.values())
+        return TruncDate("date_time")
 
     def get_stacked_charts(
         self,
@@ -208,24 +248,23 @@ class ChartWidget(BaseWidget):
 
     def preload_old_records(self, field_names):
         if self._old_records is None:
-            records = self.get_old_records(field_names)
-            if not records:
-                self._old_records = {}
-                return
-
-            df = (
-                pd.DataFrame.from_records(records)
-                .sort_values(by="date_time", ascending=False)
-                .groupby(["field__name", "project__name"])
-                .first()
-            )
-
-            self._old_records = df["value"].to_dict()
+            self._old_records = {
+                (record["field__name"], record["project__name"]): record["value"]
+                for record in self.get_old_records(field_names)
+            }
 
     def get_old_records(self, field_names):
+        """
+        The most recent record of each field and project in the months before the last month
+        """
         since, until = self.get_since_until(self.DAYS_MONTH)
         since_3_months, until = self.get_since_until(self.DAYS_MONTH * (self.OLD_RECORDS_MONTHS + 1))
-        return self.sanitize_records(self.get_records(field_names, since_3_months, since))
+        return (
+            self.filter_records(field_names, since_3_months, since)
+            .order_by("field__name", "project__name", "-date_time", "-id")
+            .distinct("field__name", "project__name")
+            .values("field__name", "project__name", "value")
+        )
 
     def generate_no_data_chart(self, since, until, aggregate=None):
         return {
@@ -39,7 +39,7 @@ class CodacyWidget(ChartWidget):
 
         aggregate = self.AGGREGATE_DATE_FORMAT_WEEK if (until - since).days > self.AGGREGATE_WEEK_THRESHOLD else None
 
-        records = self.sanitize_records(self.get_records(self.RECORD_FIELDS, since, until))
+        records = self.get_latest_records(self.RECORD_FIELDS, since, until, aggregate=aggregate)
 
         charts = self.get_stacked_charts(
             records,
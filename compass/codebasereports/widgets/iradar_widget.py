@@ -41,7 +41,7 @@ class IRadarWidget(SeverityIssuesWidget):
 
         aggregate = self.AGGREGATE_DATE_FORMAT_WEEK if (until - since).days > self.AGGREGATE_WEEK_THRESHOLD else None
 
-        records = self.sanitize_records(self.get_records(self.RECORD_FIELDS, since, until_date))
+        records = self.get_latest_records(self.RECORD_FIELDS, since, until_date, aggregate=aggregate)
 
         charts = self.group_submodules_with_risk(
             self.get_stacked_charts(
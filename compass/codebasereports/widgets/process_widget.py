@@ -47,7 +47,7 @@ class ProcessWidget(GroupSeriesChartWidget):
 
         aggregate = self.AGGREGATE_DATE_FORMAT_WEEK if (until - since).days > self.AGGREGATE_WEEK_THRESHOLD else None
 
-        records = self.sanitize_records(self.get_records(self.RECORD_FIELDS, since, until_date))
+        records = self.get_latest_records(self.RECORD_FIELDS, since, until_date)
 
         charts = self.get_stacked_charts(
             self.group_providers_records(records),
@@ -82,7 +82,7 @@ class ProcessWidget(GroupSeriesChartWidget):
     def get_insights(self):
         last_week, today = self.get_since_until(self.DAYS_WEEK)
         previous_week = last_week - timedelta(days=self.DAYS_WEEK)
-        records = self.sanitize_records(self.get_records(self.RECORD_FIELDS, previous_week, today))
+        records = self.get_latest_records(self.RECORD_FIELDS, previous_week, today)
 
         insight_commits = None
         insight_files = None
@@ -1,7 +1,5 @@
 from datetime import timedelta
 
-from django.core.cache import cache
-
 from compass.codebasereports.insights import (
     HighCveBenchmarkInsight,
     HighSastBenchmarkInsight,
@@ -16,9 +14,6 @@ from mvp.utils import get_tz_date
 
 
 class SnykWidget(SeverityIssuesWidget):
-    CACHE_KEY_TEMPLATE = "snyk_widget_{organization_id}_{since}_{until}"
-    CACHE_TIMEOUT = 86400  # 1 day
-
     RECORD_FIELDS = SnykIntegration.get_issue_count_field_names()
 
     @property
@@ -30,14 +25,7 @@ class SnykWidget(SeverityIssuesWidget):
         return SnykIssueSeverity
 
     def get_widgets(self, since, until):
-        _since = get_tz_date(since)
-        _until = get_tz_date(until)
-        cache_key = self.get_cache_key(self.organization.id, _since, _until)
-
-        return cache.get_or_set(cache_key, lambda: self._get_widgets(_since, _until), self.CACHE_TIMEOUT)
-
-    def _get_widgets(self, since, until):
-        chart_sast, chart_cve, chart_license = self.get_charts(since, until)
+        chart_sast, chart_cve, chart_license = self.get_charts(get_tz_date(since), get_tz_date(until))
 
         current_high_sast_issues, current_high_cve_issues = self.get_current_issues(chart_sast, chart_cve)
 
@@ -58,7 +46,7 @@ class SnykWidget(SeverityIssuesWidget):
 
         aggregate = self.AGGREGATE_DATE_FORMAT_WEEK if (until - since).days > self.AGGREGATE_WEEK_THRESHOLD else None
 
-        records = self.sanitize_records(self.get_records(self.RECORD_FIELDS, since, until))
+        records = self.get_latest_records(self.RECORD_FIELDS, since, until, aggregate=aggregate)
 
         charts = self.get_stacked_charts(
             records,
@@ -109,7 +97,3 @@ class SnykWidget(SeverityIssuesWidget):
                 return series["data"][-1]
 
         return None
-
-    @classmethod
-    def get_cache_key(cls, organization_id, since, until):
-        return cls.CACHE_KEY_TEMPLATE.format(organization_id=organization_id, since=since, until=until)
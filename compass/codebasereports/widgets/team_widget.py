@@ -42,7 +42,7 @@ class TeamWidget(GroupSeriesChartWidget):
 
         aggregate = self.AGGREGATE_DATE_FORMAT_WEEK if (until - since).days > self.AGGREGATE_WEEK_THRESHOLD else None
 
-        records = self.sanitize_records(self.get_records(self.RECORD_FIELDS, since, until_date, members=True))
+        records = self.get_latest_records(self.RECORD_FIELDS, since, until_date, members=True)
 
         charts = self.get_members_stacked_charts(
             self.add_records_developers_last_28_days(self.group_developer_records(records)),
@@ -3,6 +3,7 @@ from django.contrib import admin
 from compass.contextualization.forms import MessageFilterForm
 from compass.contextualization.models import (
     AnomalyInsights,
+    ContextualizationOutput,
     DailyMessage,
     Initiative,
     InitiativeEpic,
@@ -100,6 +101,18 @@ class DailyMessageAdmin(admin.ModelAdmin):
     readonly_fields = ("organization", "created_at", "updated_at")
 
 
+@admin.register(ContextualizationOutput)
+class ContextualizationOutputAdmin(admin.ModelAdmin):
+    list_display = (
+        "organization",
+        "day_interval",
+        "filename",
+        "generated_at",
+    )
+    list_filter = ["organization", "day_interval", "filename"]
+    readonly_fields = ("organization", "created_at", "updated_at")
+
+
 @admin.register(MessageFilter)
 class MessageFilterAdmin(admin.ModelAdmin):
     form = MessageFilterForm
@@ -118,8 +131,9 @@ class TicketCompletenessAdmin(admin.ModelAdmin):
         "llm_category",
         "stage",
         "date",
+        "valid_until",
     )
-    list_filter = ["llm_category", "stage", "date", "project__organization"]
+    list_filter = ["llm_category", "stage", "date", "valid_until", "project__organization"]
     search_fields = ["ticket_id", "project__key"]
     readonly_fields = ("project", "created_at", "updated_at")
 
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contextualization", "0012_initiative_parent_initiativeepic_parent"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ticketcompleteness",
+            name="completeness_hash",
+            field=models.CharField(max_length=64, null=True),
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:09
+
+from django.db import migrations, models
+
+TRACKED_FIELDS = [
+    "name",
+    "description",
+    "assignee",
+    "reporter",
+    "priority",
+    "completeness_score",
+    "raw_completeness_score_evaluation",
+    "completeness_score_explanation",
+    "llm_category",
+    "stage",
+    "quality_category",
+    "completeness_hash",
+]
+BATCH_SIZE = 1000
+
+
+def collapse_ticket_history(apps, schema_editor):
+    """
+    Keeps only the daily rows where the ticket data changed, each one valid until the date of the next one
+    """
+    TicketCompleteness = apps.get_model("contextualization", "TicketCompleteness")
+
+    unchanged_ids = []
+    closed_tickets = []
+    previous = None
+    for ticket in (
+        TicketCompleteness.objects.only("id", "project_id", "ticket_id", "date", *TRACKED_FIELDS)
+        .order_by("project_id", "ticket_id", "date")
+        .iterator(chunk_size=BATCH_SIZE)
+    ):
+        if previous and (previous.project_id, previous.ticket_id) == (ticket.project_id, ticket.ticket_id):
+            if all(getattr(previous, field) == getattr(ticket, field) for field in TRACKED_FIELDS):
+                unchanged_ids.append(ticket.id)
+                continue
+
+            closed_tickets.append(TicketCompleteness(id=previous.id, valid_until=ticket.date))
+        previous = ticket
+
+    for index in range(0, len(unchanged_ids), BATCH_SIZE):
+        TicketCompleteness.objects.filter(id__in=unchanged_ids[index : index + BATCH_SIZE]).delete()
+    TicketCompleteness.objects.bulk_update(closed_tickets, ["valid_until"], batch_size=BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contextualization", "0013_ticketcompleteness_completeness_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ticketcompleteness",
+            name="valid_until",
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.RunPython(collapse_ticket_history, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="ticketcompleteness",
+            index=models.Index(
+                fields=["project", "date", "valid_until"],
+                name="contextuali_project_6ce85f_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="ticketcompleteness",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("valid_until__isnull", True)),
+                fields=("project", "ticket_id"),
+                name="unique_current_ticket_completeness",
+            ),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:25
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("mvp", "0148_repositorydailycomposition"),
+        ("contextualization", "0014_ticketcompleteness_valid_until__manual"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContextualizationOutput",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "day_interval",
+                    models.IntegerField(choices=[(1, "One day"), (7, "One week"), (14, "Two weeks")]),
+                ),
+                ("filename", models.CharField(max_length=255)),
+                ("data", models.JSONField()),
+                ("generated_at", models.DateTimeField()),
+                (
+                    "organization",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="mvp.organization",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("organization", "day_interval", "filename")},
+            },
+        ),
+    ]
@@ -3,7 +3,6 @@ from typing import TypedDict
 
 from django.contrib.postgres.fields import ArrayField
 from django.db import models
-from django_cte import CTE, with_cte
 from multiselectfield import MultiSelectField
 
 from contextualization.models.anomaly_insights import ConfidenceLevel, InsightCategory
@@ -210,6 +209,26 @@ class DailyMessage(TimestampedModel):
         return str(self.date)
 
 
+class ContextualizationOutput(TimestampedModel):
+    """
+    Output of the contextualization pipelines for a day interval, stored at import time so the views don't read
+    the output files
+    """
+
+    organization = models.ForeignKey(Organization, on_delete=models.CASCADE)
+    day_interval = models.IntegerField(choices=DayIntervalChoices.choices)
+    filename = models.CharField(max_length=255)
+    data = models.JSONField()
+    # when the pipeline generated the output
+    generated_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = ["organization", "day_interval", "filename"]
+
+    def __str__(self):
+        return self.filename
+
+
 class MessageFilterData(TypedDict):
     significance_levels: list[str]
     repository_groups: list[str]
@@ -259,23 +278,58 @@ class TicketCompleteness(TimestampedModel):
     llm_category = models.TextField(choices=TicketCategoryChoices.choices)
     stage = models.TextField()
     quality_category = models.TextField(choices=QualityCategoryChoices.choices, null=True)
+    # hash of the ticket fields the score and category were generated from, to reuse them while they don't change
+    completeness_hash = models.CharField(max_length=64, null=True)
 
-    # Date field for unique constraint (one entry per day per project)
+    # the ticket data is valid from date (included) until valid_until (excluded), a new row is only stored when
+    # the tracked fields change, valid_until is null for the current data of the ticket
     date = models.DateField(auto_now_add=True)
+    valid_until = models.DateField(null=True, blank=True)
+
+    TRACKED_FIELDS = [
+        "name",
+        "description",
+        "assignee",
+        "reporter",
+        "priority",
+        "completeness_score",
+        "raw_completeness_score_evaluation",
+        "completeness_score_explanation",
+        "llm_category",
+        "stage",
+        "quality_category",
+        "completeness_hash",
+    ]
 
     class Meta:
         unique_together = ["ticket_id", "project", "date"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "ticket_id"],
+                condition=models.Q(valid_until__isnull=True),
+                name="unique_current_ticket_completeness",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["project", "date", "valid_until"]),
+        ]
+
+    @classmethod
+    def valid_at(cls, at_date: datetime.date) -> models.Q:
+        return models.Q(date__lte=at_date) & (models.Q(valid_until__isnull=True) | models.Q(valid_until__gt=at_date))
 
     @classmethod
     def latest_ticket_data(cls, organization, at_date: datetime.date | None = None):
-        # Select the latest ticket data for each ticket_id and project
+        # Select the ticket data of each ticket_id and project valid at the given date (the current one by default)
         # This queryset is useful for most of the views, besides of the specific ticket time series
         qs = cls.objects.filter(project__organization=organization)
         if at_date:
-            qs = qs.filter(date__lte=at_date)
+            return qs.filter(cls.valid_at(at_date))
+
+        return qs.filter(valid_until__isnull=True)
 
-        cte = CTE(qs.order_by("ticket_id", "project", "-date", "-id").distinct("ticket_id", "project"))
-        return with_cte(cte, select=cte)
+    def has_changes(self, data: dict) -> bool:
+        return any(getattr(self, field) != data[field] for field in self.TRACKED_FIELDS)
 
 
 class AnomalyInsights(TimestampedModel):
@@ -14,10 +14,34 @@ from contextualization.pipelines.jira_anomaly_driven_insights.jira_anomaly_insig
 from mvp.models import JiraProject, Organization, Repository
 
 
+def save_anomaly_insights(anomaly_insights: list[AnomalyInsights]):
+    # re-importing the same insights updates them instead of failing on the unique anomaly id per source
+    with transaction.atomic():
+        AnomalyInsights.objects.bulk_create(
+            anomaly_insights,
+            update_conflicts=True,
+            unique_fields=["anomaly_id", "project"],
+            update_fields=[
+                "anomaly_type",
+                "title",
+                "insight",
+                "evidence",
+                "significance_score",
+                "repository",
+                "confidence_level",
+                "category",
+                "ticket_categories",
+                "source_tickets",
+                "source_commits",
+                "updated_at",
+            ],
+        )
+
+
 class ImportGitAnomalyInsightsTask:
     def import_results(self, organization: Organization, anomaly_insights: GitCombinedInsights):
         insights_per_repo = defaultdict(list)
-        for insight in anomaly_insights.anomaly_insights + anomaly_insights.risk_insights:
+        for insight in anomaly_insights.anomaly_insights:
             insights_per_repo[insight.repo].append(insight)
 
         # naive implementation to avoid data duplication if we re-run the pipeline
@@ -36,37 +60,43 @@ class ImportGitAnomalyInsightsTask:
 
         anomaly_id = int(last_anomaly_insight.anomaly_id.split("-")[-1]) + 1 if last_anomaly_insight else 1
 
-        with transaction.atomic():
-            for repo_name, insights in insights_per_repo.items():
-                try:
-                    repo = Repository.objects.get(organization=organization, id=Repository.decode_id(repo_name))
-                except Repository.DoesNotExist:
-                    logging.exception(f"Repository {repo_name} not found for organization {organization}")
-                    continue
-
-                for insight in insights:
-                    anomaly_insights = [
-                        AnomalyInsights(
-                            anomaly_id=f"AI-GIT-{anomaly_id}",
-                            anomaly_type="git",
-                            title=insight.title,
-                            repository=repo,
-                            insight=insight.insight,
-                            evidence=insight.evidence,
-                            significance_score=insight.significance_score,
-                            confidence_level=insight.confidence_level,
-                            category=insight.category,
-                            source_commits=insight.sources,
-                        )
-                    ]
-                    AnomalyInsights.objects.bulk_create(anomaly_insights)
-                    anomaly_id += 1
+        # the repositories of all the insights are fetched at once
+        repository_ids = {repo_name: Repository.decode_id(repo_name) for repo_name in insights_per_repo}
+        repositories = Repository.objects.filter(organization=organization).in_bulk(
+            [repository_id for repository_id in repository_ids.values() if repository_id]
+        )
+
+        anomaly_insights = []
+        for repo_name, insights in insights_per_repo.items():
+            repo = repositories.get(repository_ids[repo_name])
+            if not repo:
+                logging.error(f"Repository {repo_name} not found for organization {organization}")
+                continue
+
+            for insight in insights:
+                anomaly_insights.append(
+                    AnomalyInsights(
+                        anomaly_id=f"AI-GIT-{anomaly_id}",
+                        anomaly_type="git",
+                        title=insight.title,
+                        repository=repo,
+                        insight=insight.insight,
+                        evidence=insight.evidence,
+                        significance_score=insight.significance_score,
+                        confidence_level=insight.confidence_level,
+                        category=insight.category,
+                        source_commits=insight.sources,
+                    )
+                )
+                anomaly_id += 1
+
+        save_anomaly_insights(anomaly_insights)
 
 
 class ImportJiraAnomalyInsightsTask:
     def import_results(self, organization: Organization, anomaly_insights: JiraCombinedInsights):
         insights_per_project = defaultdict(list)
-        for insight in anomaly_insights.anomaly_insights + anomaly_insights.risk_insights:
+        for insight in anomaly_insights.anomaly_insights:
             insights_per_project[insight.project].append(insight)
 
         last_anomaly_insight = (
@@ -83,29 +113,35 @@ class ImportJiraAnomalyInsightsTask:
 
         anomaly_id = int(last_anomaly_insight.anomaly_id.split("-")[-1]) + 1 if last_anomaly_insight else 1
 
-        with transaction.atomic():
-            for project_name, insights in insights_per_project.items():
-                try:
-                    project = JiraProject.objects.get(organization=organization, key=project_name)
-                except JiraProject.DoesNotExist:
-                    logging.exception(f"Project {project_name} not found for organization {organization}")
-                    continue
-
-                for insight in insights:
-                    anomaly_insights = [
-                        AnomalyInsights(
-                            anomaly_id=f"AI-JIRA-{anomaly_id}",
-                            anomaly_type="jira",
-                            project=project,
-                            title=insight.title,
-                            insight=insight.insight,
-                            evidence=insight.evidence,
-                            significance_score=insight.significance_score,
-                            confidence_level=insight.confidence_level,
-                            category=insight.category,
-                            ticket_categories=insight.ticket_categories,
-                            source_tickets=insight.source,
-                        )
-                    ]
-                    AnomalyInsights.objects.bulk_create(anomaly_insights)
-                    anomaly_id += 1
+        # the projects of all the insights are fetched at once
+        projects = {
+            project.key: project
+            for project in JiraProject.objects.filter(organization=organization, key__in=insights_per_project)
+        }
+
+        anomaly_insights = []
+        for project_name, insights in insights_per_project.items():
+            project = projects.get(project_name)
+            if not project:
+                logging.error(f"Project {project_name} not found for organization {organization}")
+                continue
+
+            for insight in insights:
+                anomaly_insights.append(
+                    AnomalyInsights(
+                        anomaly_id=f"AI-JIRA-{anomaly_id}",
+                        anomaly_type="jira",
+                        project=project,
+                        title=insight.title,
+                        insight=insight.insight,
+                        evidence=insight.evidence,
+                        significance_score=insight.significance_score,
+                        confidence_level=insight.confidence_level,
+                        category=insight.category,
+                        ticket_categories=insight.ticket_categories,
+                        source_tickets=insight.source,
+                    )
+                )
+                anomaly_id += 1
+
+        save_anomaly_insights(anomaly_insights)
@@ -19,6 +19,8 @@ logger = logging.getLogger(__name__)
 
 
 class ImportPipelineBCDataTask:
+    # all the repository groups of the organization are imported in a single transaction
+    @transaction.atomic
     def import_results(
         self, organization: Organization, day_interval: ContextualizationDayInterval, result: PipelineBCResult
     ):
@@ -57,25 +59,24 @@ class ImportPipelineBCDataTask:
             end_date = datetime.fromtimestamp(updated_at).date()
             start_date = (datetime.fromtimestamp(updated_at) - timedelta(days=day_interval.value)).date()
 
-            with transaction.atomic():
-                pinned_initiatives = get_pinned_initiatives(organization)
-                roadmap = Roadmap.objects.create(
-                    summary=roadmap_data.get("summary"),
-                    start_date=start_date,
-                    end_date=end_date,
-                    day_interval=day_interval.value,
-                    organization=organization,
-                    repository_group=repository_group,
-                    raw_roadmap=roadmap_data,
-                    raw_roadmap_reconciliation=reconciliation_roadmap_data,
-                )
-                logger.info("Created roadmap")
+            pinned_initiatives = get_pinned_initiatives(organization)
+            roadmap = Roadmap.objects.create(
+                summary=roadmap_data.get("summary"),
+                start_date=start_date,
+                end_date=end_date,
+                day_interval=day_interval.value,
+                organization=organization,
+                repository_group=repository_group,
+                raw_roadmap=roadmap_data,
+                raw_roadmap_reconciliation=reconciliation_roadmap_data,
+            )
+            logger.info("Created roadmap")
 
-                self.save_initiatives(roadmap, roadmap_data, pinned_initiatives)
-                logger.info("Saved initiatives")
-                if reconciliation_roadmap_data:
-                    self.save_reconcilable_initiatives(roadmap, reconciliation_roadmap_data)
-                logger.info("Saved reconcilable initiatives")
+            self.save_initiatives(roadmap, roadmap_data, pinned_initiatives)
+            logger.info("Saved initiatives")
+            if reconciliation_roadmap_data:
+                self.save_reconcilable_initiatives(roadmap, reconciliation_roadmap_data)
+            logger.info("Saved reconcilable initiatives")
             logger.info(f"Imported data for {repository_group}")
 
         logger.info(f"Imported pipeline bc data for {organization}")
@@ -98,6 +99,7 @@ class ImportPipelineBCDataTask:
         pinned_custom_names = {init.custom_name: init for init in pinned_initiatives}
 
         initiatives = []
+        epics = []
 
         for item in data.get("initiatives", []):
             estimated_end_date = None
@@ -108,7 +110,7 @@ class ImportPipelineBCDataTask:
             initiative_name = item.get("initiative_name")
             matched_initiative = self.match_initiative_by_name(initiative_name, pinned_names, pinned_custom_names)
 
-            initiative = Initiative.objects.create(
+            initiative = Initiative(
                 name=initiative_name,
                 justification=item.get("initiative_description"),
                 percentage=item.get("initiative_percentage"),
@@ -135,17 +137,22 @@ class ImportPipelineBCDataTask:
                 epic_name = epic.get("epic_name")
                 matched_epic = self.match_initiative_by_name(epic_name, pinned_epic_names, pinned_epic_custom_names)
 
-                InitiativeEpic.objects.create(
-                    name=epic_name,
-                    description=epic.get("epic_description"),
-                    percentage=epic.get("epic_percentage", 0),
-                    initiative=initiative,
-                    pinned=matched_epic.pinned if matched_epic else False,
-                    parent=matched_epic,
+                epics.append(
+                    InitiativeEpic(
+                        name=epic_name,
+                        description=epic.get("epic_description"),
+                        percentage=epic.get("epic_percentage", 0),
+                        initiative=initiative,
+                        pinned=matched_epic.pinned if matched_epic else False,
+                        parent=matched_epic,
+                    )
                 )
 
             initiatives.append(initiative)
 
+        # the initiatives get their ids from the insert, so the epics can reference them
+        Initiative.objects.bulk_create(initiatives)
+        InitiativeEpic.objects.bulk_create(epics)
         return initiatives
 
     @staticmethod
@@ -174,11 +181,13 @@ class ImportPipelineBCDataTask:
             if not item.get("needs_reconciliation"):
                 continue
 
-            ReconcilableInitiative.objects.create(
-                name=item.get("work_group"),
-                initiative_type=item.get("work_group_type"),
-                git_activity=item.get("git_activity"),
-                jira_activity=item.get("jira_activity"),
-                roadmap=roadmap,
+            reconcilable_initiatives.append(
+                ReconcilableInitiative(
+                    name=item.get("work_group"),
+                    initiative_type=item.get("work_group_type"),
+                    git_activity=item.get("git_activity"),
+                    jira_activity=item.get("jira_activity"),
+                    roadmap=roadmap,
+                )
             )
-        return reconcilable_initiatives
+        return ReconcilableInitiative.objects.bulk_create(reconcilable_initiatives)
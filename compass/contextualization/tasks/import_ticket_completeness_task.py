@@ -1,53 +1,106 @@
 import logging
 from collections import defaultdict
 
+from django.db import transaction
 from django.utils import timezone
 
 from compass.contextualization.models import JiraProject, TicketCompleteness
-from contextualization.pipelines.pipeline_D_jira_score_completeness.jira_completeness_score import (
-    TickectCompletenessScoreResult,
+from contextualization.pipelines.pipeline_D_jira_score_completeness.schemas import (
+    TicketCompletenessScoreResult,
 )
 from mvp.models import Organization
 
 logger = logging.getLogger(__name__)
 
+BATCH_SIZE = 1000
+
 
 class ImportTicketCompletenessTask:
     def import_results(
         self,
         organization: Organization,
-        ticket_completeness_scores: list[TickectCompletenessScoreResult],
+        ticket_completeness_scores: list[TicketCompletenessScoreResult],
     ):
         tickets_per_project = defaultdict(list)
         for ticket_completeness_score in ticket_completeness_scores:
             tickets_per_project[ticket_completeness_score.project_name].append(ticket_completeness_score)
 
+        # the projects and the current data of their tickets are fetched at once
+        projects = {
+            project.key: project
+            for project in JiraProject.objects.filter(organization=organization, key__in=tickets_per_project)
+        }
+        current_tickets = {
+            (ticket_completeness.project_id, ticket_completeness.ticket_id): ticket_completeness
+            for ticket_completeness in TicketCompleteness.latest_ticket_data(organization).filter(
+                project__in=projects.values()
+            )
+        }
+
+        today = timezone.now().date()
+        now = timezone.now()
+        unchanged_tickets = []
+        closed_tickets = []
+        new_tickets = {}
         for project_name, tickets in tickets_per_project.items():
-            try:
-                project = JiraProject.objects.get(organization=organization, key=project_name)
-            except JiraProject.DoesNotExist:
-                logger.exception(
+            project = projects.get(project_name)
+            if not project:
+                logger.error(
                     f"Project not found for organization",
                     extra={"organization": organization, "project_name": project_name},
                 )
                 continue
 
             for ticket in tickets:
-                TicketCompleteness.objects.update_or_create(
-                    ticket_id=ticket.issue_key,
-                    project=project,
-                    date=timezone.now().date(),
-                    defaults={
-                        "name": ticket.summary,
-                        "description": ticket.description,
-                        "assignee": ticket.assignee,
-                        "stage": ticket.stage_category,
-                        "reporter": None,
-                        "priority": ticket.priority,
-                        "completeness_score": ticket.jira_completeness_score,
-                        "raw_completeness_score_evaluation": ticket.evaluation_jira_completeness_score,
-                        "completeness_score_explanation": ticket.explanation_jira_completeness_score,
-                        "llm_category": ticket.llm_category,
-                        "quality_category": ticket.quality_category,
-                    },
+                data = {
+                    "name": ticket.summary,
+                    "description": ticket.description,
+                    "assignee": ticket.assignee,
+                    "stage": ticket.stage_category,
+                    "reporter": None,
+                    "priority": ticket.priority,
+                    "completeness_score": ticket.jira_completeness_score,
+                    "raw_completeness_score_evaluation": ticket.evaluation_jira_completeness_score,
+                    "completeness_score_explanation": ticket.explanation_jira_completeness_score,
+                    "llm_category": ticket.llm_category,
+                    "quality_category": ticket.quality_category,
+                    "completeness_hash": ticket.completeness_hash,
+                }
+                current_ticket = current_tickets.get((project.id, ticket.issue_key))
+                if current_ticket and not current_ticket.has_changes(data):
+                    # still valid, only the time it was last seen is updated
+                    unchanged_tickets.append(current_ticket.id)
+                    continue
+
+                if current_ticket and current_ticket.date != today:
+                    current_ticket.valid_until = today
+                    current_ticket.updated_at = now
+                    closed_tickets.append(current_ticket)
+                # a change on the same day overwrites the version of the day
+                new_tickets[(project.id, ticket.issue_key)] = TicketCompleteness(
+                    ticket_id=ticket.issue_key, project=project, **data
                 )
+
+        self.save_tickets(unchanged_tickets, closed_tickets, list(new_tickets.values()), now)
+
+    @staticmethod
+    def save_tickets(
+        unchanged_tickets: list[int],
+        closed_tickets: list[TicketCompleteness],
+        new_tickets: list[TicketCompleteness],
+        now,
+    ):
+        """
+        Stores a new version of the tickets whose data changed, closing the validity of their current one
+        """
+        with transaction.atomic():
+            TicketCompleteness.objects.filter(id__in=unchanged_tickets).update(updated_at=now)
+            # closed first, the current version of a ticket is unique
+            TicketCompleteness.objects.bulk_update(closed_tickets, ["valid_until", "updated_at"], batch_size=BATCH_SIZE)
+            TicketCompleteness.objects.bulk_create(
+                new_tickets,
+                batch_size=BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=["ticket_id", "project", "date"],
+                update_fields=[*TicketCompleteness.TRACKED_FIELDS, "updated_at"],
+            )
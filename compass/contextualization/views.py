@@ -1,8 +1,7 @@
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Avg, Case, IntegerField, Q, When
+from django.db.models import Avg, Case, Count, IntegerField, Q, When
 from django.template.loader import render_to_string
 from rest_framework import status
 from rest_framework.pagination import PageNumberPagination
@@ -28,6 +27,7 @@ from compass.contextualization.serializers import (
 )
 from mvp.models import RepositoryGroup
 from mvp.serializers import RepositoryGroupSimpleSerializer
+from mvp.services import OrganizationCacheService
 from mvp.services.contextualization_message_service import (
     ContextualizationMessageService,
 )
@@ -59,18 +59,24 @@ class DailyMessageView(LoginRequiredMixin, APIView):
             repository_groups=repository_groups,
             ticket_categories=ticket_categories,
         )
-        daily_message_raw_json = ContextualizationMessageService.get_filtered_daily_message_data(
-            daily_message.raw_json, message_filter_data
-        )
-
-        template_name = (
-            "mvp/emails/daily_message.html"
-            if request.GET.get("as-email") == "true"
-            else "mvp/daily_message/daily_message.html"
-        )
-        html_content = render_to_string(
-            template_name=template_name,
-            context=get_daily_message_template_context(organization, daily_message_raw_json),
+        as_email = request.GET.get("as-email") == "true"
+        template_name = "mvp/emails/daily_message.html" if as_email else "mvp/daily_message/daily_message.html"
+
+        # each filter is rendered once per daily message, users with the same filters share it
+        signature = ContextualizationMessageService.get_message_filter_signature(message_filter_data)
+        updated_at = daily_message.updated_at.timestamp()
+        html_content = OrganizationCacheService.get_or_set(
+            organization,
+            f"rendered_daily_message_{daily_message.pk}_{updated_at}_{as_email}_{signature}",
+            lambda: render_to_string(
+                template_name=template_name,
+                context=get_daily_message_template_context(
+                    organization,
+                    ContextualizationMessageService.get_cached_filtered_daily_message_data(
+                        organization, daily_message, message_filter_data
+                    ),
+                ),
+            ),
         )
         return Response({"date": daily_message.date, "content": html_content})
 
@@ -178,30 +184,38 @@ class TicketCompletenessStatisticsView(LoginRequiredMixin, APIView):
         organization = request.current_organization
         project_key = request.GET.get("project_key")
 
-        response_data = {}
-        dates = [None, (datetime.now() - timedelta(days=self.HISTORICAL_DAYS)).date()]
-        data_types = ["latest", "historical"]
-        for date, data_type in zip(dates, data_types):
-            query_set = TicketCompleteness.latest_ticket_data(organization=organization, at_date=date)
-            if project_key:
-                query_set = query_set.filter(project__key=project_key)
-
-            ticket_count = query_set.filter(stage__in=["Ready for Work", "Underway"]).count()
-            low_score_underway_count = query_set.filter(
-                stage="Underway",
-                quality_category="Initial",
-            ).count()
-            avg_completeness_score = round(
-                query_set.aggregate(Avg("completeness_score"))["completeness_score__avg"] or 0, 1
+        historical_date = (datetime.now() - timedelta(days=self.HISTORICAL_DAYS)).date()
+        valid_filters = {
+            "latest": Q(valid_until__isnull=True),
+            "historical": TicketCompleteness.valid_at(historical_date),
+        }
+        query_set = TicketCompleteness.objects.filter(project__organization=organization)
+        if project_key:
+            query_set = query_set.filter(project__key=project_key)
+
+        # the statistics of both dates are aggregated in a single query over the ticket versions valid at them
+        aggregates = {}
+        for data_type, valid_filter in valid_filters.items():
+            aggregates[f"{data_type}_active_tickets_count"] = Count(
+                "id", filter=valid_filter & Q(stage__in=["Ready for Work", "Underway"])
             )
+            aggregates[f"{data_type}_low_score_underway_count"] = Count(
+                "id", filter=valid_filter & Q(stage="Underway", quality_category="Initial")
+            )
+            aggregates[f"{data_type}_avg_completeness_score"] = Avg("completeness_score", filter=valid_filter)
+        statistics = query_set.aggregate(**aggregates)
+
+        response_data = {}
+        for data_type in valid_filters:
+            avg_completeness_score = round(statistics[f"{data_type}_avg_completeness_score"] or 0, 1)
 
             if not avg_completeness_score and data_type == "historical":
                 # hide historical trends if no data is available
                 response_data[data_type] = None
             else:
                 response_data[data_type] = {
-                    "active_tickets_count": ticket_count,
-                    "low_score_underway_count": low_score_underway_count,
+                    "active_tickets_count": statistics[f"{data_type}_active_tickets_count"],
+                    "low_score_underway_count": statistics[f"{data_type}_low_score_underway_count"],
                     "avg_completeness_score": avg_completeness_score,
                 }
 
@@ -231,29 +245,33 @@ class TicketCompletenessTrendChartView(LoginRequiredMixin, APIView):
         return Response({"results": results, "organizational_benchmark": organizational_benchmark})
 
     def get_trend_data(self, organization, project_key, date_points):
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [
-                executor.submit(self.get_specific_date_data, date, organization, project_key) for date in date_points
-            ]
-            results = [f.result() for f in futures]
-        return sorted(results, key=lambda x: x["date"])
+        if not date_points:
+            return []
 
-    @staticmethod
-    def get_specific_date_data(date, organization, project_key):
-        queryset = TicketCompleteness.latest_ticket_data(organization=organization, at_date=date)
+        queryset = TicketCompleteness.objects.filter(
+            project__organization=organization,
+            date__lte=max(date_points),
+        ).exclude(valid_until__lte=min(date_points))
         if project_key:
             queryset = queryset.filter(project__key=project_key)
 
-        ticket_count = queryset.count()
-        avg_completeness_score = (
-            queryset.aggregate(Avg("completeness_score"))["completeness_score__avg"] if ticket_count else None
-        )
+        # all the date points are aggregated in a single query over the ticket versions valid at each of them
+        aggregates = {}
+        for index, date in enumerate(date_points):
+            valid_filter = TicketCompleteness.valid_at(date)
+            aggregates[f"ticket_count_{index}"] = Count("id", filter=valid_filter)
+            aggregates[f"avg_completeness_score_{index}"] = Avg("completeness_score", filter=valid_filter)
+        trend_data = queryset.aggregate(**aggregates)
 
-        return {
-            "date": date.strftime("%Y-%m-%d"),
-            "ticket_count": ticket_count,
-            "avg_completeness_score": avg_completeness_score,
-        }
+        results = [
+            {
+                "date": date.strftime("%Y-%m-%d"),
+                "ticket_count": trend_data[f"ticket_count_{index}"],
+                "avg_completeness_score": trend_data[f"avg_completeness_score_{index}"],
+            }
+            for index, date in enumerate(date_points)
+        ]
+        return sorted(results, key=lambda x: x["date"])
 
     def get_dates_to_query(self, from_date, to_date):
         if to_date - from_date <= timedelta(days=14):
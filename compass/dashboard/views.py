@@ -20,6 +20,7 @@ from mvp.services import (
     ConnectedIntegrationsService,
     ContextualizationDayInterval,
     ContextualizationService,
+    OrganizationCacheService,
 )
 from mvp.services.contextualization_message_service import (
     ContextualizationMessageService,
@@ -63,6 +64,21 @@ class DashboardView(PermissionRequiredMixin, APIView):
 
         is_default_date_range = start_date == default_start_date and end_date == default_end_date
 
+        # the default date range moves every day
+        data = OrganizationCacheService.get_or_set(
+            organization,
+            f"{self.__class__.__name__}_{since}_{until}_{default_until}",
+            lambda: self.get_dashboard_data(organization, start_date, end_date),
+        )
+
+        integrations = ConnectedIntegrationsService.get_connected_integration_statuses(
+            organization=organization,
+            integration_map_keys=ConnectedIntegrationsService.GIT_INTEGRATION_MAP_KEYS,
+        )
+
+        return Response({**data, "integrations": integrations})
+
+    def get_dashboard_data(self, organization, start_date, end_date):
         updated_at = ContextualizationService.get_output_data_timestamp(
             organization, ContextualizationService.OUTPUT_FILENAME_COUNT
         )
@@ -91,11 +107,6 @@ class DashboardView(PermissionRequiredMixin, APIView):
         #         justification_data, repositories
         #     )
 
-        integrations = ConnectedIntegrationsService.get_connected_integration_statuses(
-            organization=organization,
-            integration_map_keys=ConnectedIntegrationsService.GIT_INTEGRATION_MAP_KEYS,
-        )
-
         grouped_justification_data, _ = ContextualizationService.load_output_data(
             organization, ContextualizationService.OUTPUT_FILENAME_GROUPED_JUSTIFICATION
         )
@@ -105,7 +116,9 @@ class DashboardView(PermissionRequiredMixin, APIView):
             data = self.enhance_justification(data, repositories)
             grouped_justification_data[group_id] = data
 
-        anomaly_insights = ContextualizationService.read_combined_anomaly_script_output(organization)
+        anomaly_insights, _ = ContextualizationService.load_output_data(
+            organization, ContextualizationService.OUTPUT_FILENAME_COMBINED_ANOMALY_INSIGHTS
+        )
 
         repository_map = {repo.public_id(): repo for repo in repositories}
 
@@ -114,23 +127,18 @@ class DashboardView(PermissionRequiredMixin, APIView):
             normalized_anomaly_insights, repository_map
         )
 
-        return Response(
-            {
-                "updated_at": int(updated_at),
-                "products": products,
-                "chart": chart,
-                "org_first_date": org_first_date,
-                "default_time_window_days": settings.DEFAULT_TIME_WINDOW_DAYS,
-                "integrations": integrations,
-                # "justifications": justification_data,
-                "grouped_justifications": grouped_justification_data,
-                "date_range": (
-                    [int(start_date.timestamp()), int(end_date.timestamp())] if end_date.timestamp() else None
-                ),
-                "repository_groups_url": reverse("repository_groups"),
-                "anomaly_insights": grouped_anomaly_insights,
-            }
-        )
+        return {
+            "updated_at": int(updated_at),
+            "products": products,
+            "chart": chart,
+            "org_first_date": org_first_date,
+            "default_time_window_days": settings.DEFAULT_TIME_WINDOW_DAYS,
+            # "justifications": justification_data,
+            "grouped_justifications": grouped_justification_data,
+            "date_range": ([int(start_date.timestamp()), int(end_date.timestamp())] if end_date.timestamp() else None),
+            "repository_groups_url": reverse("repository_groups"),
+            "anomaly_insights": grouped_anomaly_insights,
+        }
 
     @classmethod
     def get_count_data(cls, organization, since, until):
@@ -427,6 +435,7 @@ class GenerateInsightsView(PermissionRequiredMixin, APIView):
         data = ContextualizationService.execute_pipeline_a_insights(csv_path)
 
         ImportContextualizationDataTask().import_justification_data(organization, since, until, data=data)
+        OrganizationCacheService.bump_data_version(organization)
 
 
 class SIPDashboardView(PermissionRequiredMixin, APIView):
@@ -438,6 +447,15 @@ class SIPDashboardView(PermissionRequiredMixin, APIView):
         until = datetime.utcnow()
         since = until - timedelta(days=settings.DEFAULT_TIME_WINDOW_DAYS)
 
+        data = OrganizationCacheService.get_or_set(
+            organization,
+            f"{self.__class__.__name__}_{until.date()}",
+            lambda: self.get_dashboard_data(organization, since, until),
+        )
+
+        return Response(data)
+
+    def get_dashboard_data(self, organization, since, until):
         scores = SemaScoreWidget(organization).get_scores()
         service = AICompositionService(organization)
         cumulative_charts, _ = service.get_charts(since=since, until=until, daily_charts=True)
@@ -445,16 +463,14 @@ class SIPDashboardView(PermissionRequiredMixin, APIView):
         overall = ai_composition[0] if ai_composition else {}
         initiatives_data = Roadmap.get_initiatives_data(organization)
 
-        return Response(
-            {
-                "overall_ai": {
-                    "percentage": overall.get("whole", 0),
-                    "color": overall.get("color", None),
-                },
-                "score": scores.get("sema_score", 0),
-                "initiatives": initiatives_data,
-            }
-        )
+        return {
+            "overall_ai": {
+                "percentage": overall.get("whole", 0),
+                "color": overall.get("color", None),
+            },
+            "score": scores.get("sema_score", 0),
+            "initiatives": initiatives_data,
+        }
 
 
 class SIPProductRoadmapRadarView(PermissionRequiredMixin, APIView):
@@ -463,6 +479,17 @@ class SIPProductRoadmapRadarView(PermissionRequiredMixin, APIView):
     def get(self, request, *args, **kwargs):
         organization = request.current_organization
 
+        data = OrganizationCacheService.get_or_set(
+            organization,
+            f"{self.__class__.__name__}_{datetime.utcnow().date()}",
+            lambda: self.get_radar_data(organization),
+        )
+
+        integrations = ConnectedIntegrationsService.get_connected_integration_statuses(organization)
+
+        return Response({**data, "integrations": integrations})
+
+    def get_radar_data(self, organization: Organization) -> dict:
         initiatives_data = Roadmap.get_initiatives_data(organization)
         development_activity, development_activity_updated_at = self.get_development_activity(organization)
 
@@ -483,20 +510,15 @@ class SIPProductRoadmapRadarView(PermissionRequiredMixin, APIView):
         updated_ats = [time for time in updated_ats if time]
         updated_at = min(updated_ats) if updated_ats else 0
 
-        integrations = ConnectedIntegrationsService.get_connected_integration_statuses(organization)
-
-        return Response(
-            {
-                "updated_at": updated_at or None,
-                "integrations": integrations,
-                "initiatives": initiatives_data,
-                "development_activity": development_activity,
-                "daily_message": daily_message,
-                "raw_results": raw_results,
-                "ticket_completeness": ticket_completeness,
-                "anomaly_insights": anomaly_insights,
-            }
-        )
+        return {
+            "updated_at": updated_at or None,
+            "initiatives": initiatives_data,
+            "development_activity": development_activity,
+            "daily_message": daily_message,
+            "raw_results": raw_results,
+            "ticket_completeness": ticket_completeness,
+            "anomaly_insights": anomaly_insights,
+        }
 
     def get_initiatives_data(self, organization: Organization) -> tuple[dict, float | None]:
         latest_roadmap = Roadmap.latest_by_org(organization)
@@ -9,8 +9,10 @@ from .github_api import (  # noqa: F401
     GitHubApiConfig,
     GitHubInstallationDoesNotExist,
 )
+from .http_session_pool import HttpSessionPool  # noqa: F401
 from .iradar_rest_api import IRadarRestApi  # noqa: F401
 from .iradar_xls_api import IRadarXlsApi  # noqa: F401
 from .jira_api import JiraApi, JiraApiConfig  # noqa: F401
+from .rate_limiter import RateLimiter  # noqa: F401
 from .snyk_rest_api import SnykRestApi  # noqa: F401
 from .snyk_v1_api import SnykV1Api  # noqa: F401
@@ -1,9 +1,11 @@
 import logging
+import threading
 from dataclasses import dataclass
 from urllib.parse import quote
 
 from azure.devops.connection import Connection
 from azure.devops.exceptions import AzureDevOpsServiceError
+from azure.devops.v7_1.git.git_client import GitClient
 from azure.devops.v7_1.git.models import (
     Comment,
     CommentThread,
@@ -37,6 +39,15 @@ class AzureDevOpsApiConfig:
 
 
 class AzureDevOpsApi(BaseRestApi):
+    COMMITS_PAGE_SIZE = 1000
+
+    # Git client and its token by base URL (the Azure DevOps organization). msrest keeps a session per client and
+    # thread, and sets the credentials on it, so the clients can't share the sessions of HttpSessionPool. Instead,
+    # the client of an organization is reused, along with its keep-alive connections and resolved resource
+    # locations, until its token is refreshed.
+    _git_clients: dict[str, tuple[str, GitClient]] = {}
+    _git_clients_lock = threading.Lock()
+
     def __init__(self, config: AzureDevOpsApiConfig):
         self.base_url = config.base_url
         self.auth_token = config.auth_token
@@ -48,9 +59,18 @@ class AzureDevOpsApi(BaseRestApi):
             creds=BasicAuthentication("", self.auth_token),
         )
 
-    def get_git_client(self):
-        connection = self.get_connection()
-        return connection.clients_v7_1.get_git_client()
+    def get_git_client(self) -> GitClient:
+        with self._git_clients_lock:
+            auth_token, git_client = self._git_clients.get(self.base_url, (None, None))
+            if auth_token != self.auth_token:
+                connection = self.get_connection()
+                git_client = connection.clients_v7_1.get_git_client()
+                # don't close the session after failed requests
+                git_client.config.keep_alive = True
+                # the client of the previous token is replaced
+                self._git_clients[self.base_url] = (self.auth_token, git_client)
+
+        return git_client
 
     def get_repo_url(self, repo_owner, repo_name):
         repo_owner = quote(repo_owner)
@@ -147,13 +167,25 @@ class AzureDevOpsApi(BaseRestApi):
 
         return commits[0] if commits else None
 
-    def list_commits(self, repository_id, project, from_date=None, to_date=None):
+    def list_commits(self, repository_id, project, from_date=None, to_date=None, all_pages=False):
+        """
+        Without all_pages, only the first page (the most recent 100 commits) is returned
+        """
+        search_criteria = GitQueryCommitsCriteria(from_date=from_date, to_date=to_date)
+        top = self.COMMITS_PAGE_SIZE if all_pages else None
+        commits = []
         try:
-            commits = self.git_client.get_commits(
-                repository_id=repository_id,
-                project=project,
-                search_criteria=GitQueryCommitsCriteria(from_date=from_date, to_date=to_date),
-            )
+            while True:
+                page = self.git_client.get_commits(
+                    repository_id=repository_id,
+                    project=project,
+                    search_criteria=search_criteria,
+                    skip=len(commits) if all_pages else None,
+                    top=top,
+                )
+                commits.extend(page)
+                if not all_pages or len(page) < top:
+                    break
         except AzureDevOpsServiceError:
             logger.exception("Error listing commits")
             commits = []
@@ -1,10 +1,16 @@
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
 
 import requests
+from django.conf import settings
 
 from mvp.utils import retry_on_status_code
 
+from .http_session_pool import HttpSessionPool
+from .rate_limiter import RateLimiter
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,7 +21,9 @@ class BaseApi:
         headers = headers if headers else self.get_headers()
         full_url = path.startswith("http")
         url = path if full_url else self.clean_url(f"{self.API_BASE_URL}/{path}")
-        response = requests.request(method=method, url=url, headers=headers, params=params, **kwargs)
+        session = HttpSessionPool.get_session(url)
+        RateLimiter.wait(type(self).__name__)
+        response = session.request(method=method, url=url, headers=headers, params=params, **kwargs)
         try:
             response.raise_for_status()
         except requests.exceptions.RequestException:
@@ -37,5 +45,22 @@ class BaseApi:
         """
         return re.sub(r"(?<!:)/{2}", "/", url)
 
+    def set_url_param(self, url, name, value):
+        parts = urlsplit(url)
+        params = parse_qs(parts.query, keep_blank_values=True)
+        params[name] = [str(value)]
+        return urlunsplit(parts._replace(query=urlencode(params, doseq=True)))
+
+    def map_concurrently(self, function, items):
+        """
+        Like map(), but up to API_MAX_CONCURRENT_PAGES items are processed at the same time, e.g. pages of a
+        paginated endpoint once the number of pages is known. Results keep the order of the items.
+        """
+        if len(items) <= 1:
+            return list(map(function, items))
+
+        with ThreadPoolExecutor(max_workers=settings.API_MAX_CONCURRENT_PAGES) as executor:
+            return list(executor.map(function, items))
+
     def get_headers(self):
         return []
@@ -1,4 +1,5 @@
 import logging
+from urllib.parse import parse_qs, urlsplit
 
 import requests
 
@@ -8,6 +9,9 @@ logger = logging.getLogger(__name__)
 
 
 class BaseRestApi(BaseApi):
+    # query parameter of the page number in "next" and "last" links
+    PAGE_PARAM = "page"
+
     def parse_response(self, response):
         try:
             return response.json(), response.links
@@ -19,6 +23,11 @@ class BaseRestApi(BaseApi):
                 raise
 
     def get_all_pages(self, records, links, data_key=None):
+        page_urls = self.get_page_urls(links)
+        if page_urls:
+            return self.get_pages_concurrently(records, page_urls, data_key=data_key)
+
+        # cursor based pagination, each page has the link to the next one
         while "next" in links:
             next_url = self.get_next_link_url(links["next"])
             data, links = self.parse_response(self.request(next_url))
@@ -26,5 +35,51 @@ class BaseRestApi(BaseApi):
 
         return records
 
+    def iter_pages(self, records, links, data_key=None):
+        """
+        Yields the records of each page, the next page is requested once the previous one was consumed
+        so callers can stop early
+        """
+        yield records
+
+        while "next" in links:
+            next_url = self.get_next_link_url(links["next"])
+            data, links = self.parse_response(self.request(next_url))
+            yield data[data_key] if data_key else data
+
+    def get_pages_concurrently(self, records, page_urls, data_key=None):
+        def get_page(url):
+            data, _ = self.parse_response(self.request(url))
+            return data[data_key] if data_key else data
+
+        for page_records in self.map_concurrently(get_page, page_urls):
+            records.extend(page_records)
+
+        return records
+
+    def get_page_urls(self, links):
+        """
+        URLs of all the remaining pages when the number of pages is known, i.e. there is a "last" link
+        and the links have a page number. Otherwise None, and pages are fetched one after another.
+        """
+        if "next" not in links or "last" not in links:
+            return None
+
+        next_url = self.get_next_link_url(links["next"])
+        last_url = self.get_next_link_url(links["last"])
+        next_page = self.get_page_number(next_url)
+        last_page = self.get_page_number(last_url)
+        if next_page is None or last_page is None or last_page < next_page:
+            return None
+
+        return [self.set_url_param(next_url, self.PAGE_PARAM, page) for page in range(next_page, last_page + 1)]
+
+    def get_page_number(self, url):
+        values = parse_qs(urlsplit(url).query).get(self.PAGE_PARAM) if url else None
+        if not values or not values[0].isdigit():
+            return None
+
+        return int(values[0])
+
     def get_next_link_url(self, next_link):
         return next_link.get("url", None)
@@ -1,4 +1,6 @@
+import math
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Dict, Tuple
 
 import requests
@@ -155,6 +157,14 @@ class BitBucketApi(BaseRestApi):
 
         next_url = response.get("next")
         links = {"next": {"url": next_url}} if next_url else {}
+
+        # "size" is optional, with it the rest of pages can be fetched at the same time
+        size = response.get("size")
+        pagelen = response.get("pagelen")
+        if next_url and size and pagelen:
+            last_page = math.ceil(size / pagelen)
+            links["last"] = {"url": self.set_url_param(next_url, self.PAGE_PARAM, last_page)}
+
         return (response["values"], links)
 
     def list_repos_for_workspace(self, workspace_id, all_pages=False):
@@ -313,6 +323,29 @@ class BitBucketApi(BaseRestApi):
         pull_requests, links = self.parse_response(response)
         return self.get_all_pages(pull_requests, links)
 
+    def get_repository_pull_request_pages(
+        self,
+        repo_owner: str,
+        repo_name: str,
+        state: str = None,
+        updated_since: datetime = None,
+    ):
+        """
+        Pages of the pull requests updated since the given date, most recently updated first
+        """
+        params = {"sort": "-updated_on"}
+        if state:
+            params["state"] = state
+        if updated_since:
+            params["q"] = f"updated_on >= {updated_since.isoformat()}"
+
+        response = self.request(
+            f"/repositories/{repo_owner}/{repo_name}/pullrequests",
+            params=params,
+        )
+        pull_requests, links = self.parse_response(response)
+        return self.iter_pages(pull_requests, links)
+
     def install_webhooks_for_workspace(self, workspace, webhook_secret):
         if self.is_webhook_installed(workspace):
             return None
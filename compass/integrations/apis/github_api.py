@@ -373,6 +373,30 @@ class GitHubApi(BaseRestApi):
 
         return data
 
+    def get_repository_pull_request_pages(
+        self,
+        repo_full_name,
+        state=None,
+        sort=None,
+        direction=None,
+        per_page=PER_PAGE_MAX,
+    ):
+        params = {"per_page": per_page}
+
+        if state:
+            params["state"] = state
+
+        if sort:
+            params["sort"] = sort
+
+        if direction:
+            params["direction"] = direction
+
+        response = self.request(f"/repos/{repo_full_name}/pulls", params)
+
+        data, _links = self.parse_response(response)
+        return self.iter_pages(data, _links)
+
     def get_pull_request_commits(
         self,
         repo_full_name,
@@ -0,0 +1,104 @@
+import logging
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+class HttpSessionPool:
+    """
+    Keeps a requests session per host so that API clients reuse connections (keep-alive) instead of
+    doing a new TCP and TLS handshake on every request.
+
+    Sessions are shared by all the API clients and threads of the process, so they don't keep cookies.
+    Failed connections and reads of idempotent requests are retried transparently, status codes like
+    429 are handled by the API clients.
+    """
+
+    _sessions: dict[str, requests.Session] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_session(cls, url: str) -> requests.Session:
+        parts = urlsplit(url)
+        host = f"{parts.scheme}://{parts.netloc}"
+
+        with cls._lock:
+            session = cls._sessions.get(host)
+            if not session:
+                session = cls.create_session()
+                cls._sessions[host] = session
+
+        return session
+
+    @classmethod
+    def create_session(cls) -> requests.Session:
+        session = requests.Session()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        retry = Retry(
+            total=settings.HTTP_MAX_RETRIES,
+            connect=settings.HTTP_MAX_RETRIES,
+            read=settings.HTTP_MAX_RETRIES,
+            status=0,
+            backoff_factor=0.5,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=settings.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=settings.HTTP_POOL_MAXSIZE,
+            max_retries=retry,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @classmethod
+    def get_stats(cls) -> dict[str, dict[str, int | float]]:
+        """
+        Number of requests and opened connections by host, to check how many connections are reused.
+        """
+        stats = {}
+        with cls._lock:
+            sessions = list(cls._sessions.items())
+
+        for host, session in sessions:
+            num_requests = 0
+            num_connections = 0
+            for adapter in set(session.adapters.values()):
+                for pool_key in adapter.poolmanager.pools.keys():
+                    pool = adapter.poolmanager.pools.get(pool_key)
+                    if pool:
+                        num_requests += pool.num_requests
+                        num_connections += pool.num_connections
+
+            stats[host] = {
+                "requests": num_requests,
+                "connections": num_connections,
+                "reuse_ratio": 1 - num_connections / num_requests if num_requests else 0,
+            }
+
+        return stats
+
+    @classmethod
+    def log_stats(cls):
+        for host, stats in cls.get_stats().items():
+            logger.info(
+                f'"{host}": {stats["requests"]} requests, {stats["connections"]} connections, '
+                f"{stats['reuse_ratio']:.1%} reused"
+            )
+
+    @classmethod
+    def close_all(cls):
+        with cls._lock:
+            sessions = list(cls._sessions.values())
+            cls._sessions.clear()
+
+        for session in sessions:
+            session.close()
@@ -1,6 +1,7 @@
-from io import BytesIO
+from contextlib import contextmanager
+from tempfile import SpooledTemporaryFile
 
-import pandas as pd
+from openpyxl import load_workbook
 
 from compass.integrations.apis import BaseApi
 
@@ -10,23 +11,61 @@ class IRadarXlsApi(BaseApi):
 
     CONTENT_TYPE_XLS = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
 
+    # reports bigger than this are written to a temporary file instead of kept in memory
+    REPORT_MAX_MEMORY_SIZE = 10 * 1024 * 1024
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
     def __init__(self, auth_token):
         self.auth_token = auth_token
 
+    @contextmanager
     def download_report(self, domain, scan_id):
-        response = self.request(f"vendor/download/report/{domain}/{scan_id}/fullreport/xlsx")
-
-        if not response.content or response.headers.get("Content-Type") != self.CONTENT_TYPE_XLS:
-            return None
-
-        content = BytesIO(response.content)
-        with pd.ExcelFile(content) as xlsx:
-            sheet_names = xlsx.sheet_names
-            data = {
-                sheet_name: df.to_dict(orient="records")
-                for sheet_name, df in ((s, pd.read_excel(xlsx, s)) for s in sheet_names)
-            }
-            return data
+        """
+        Streams the XLSX report to a temporary file, yields None if there's no report
+        """
+        with self.request(f"vendor/download/report/{domain}/{scan_id}/fullreport/xlsx", stream=True) as response:
+            if response.headers.get("Content-Type") != self.CONTENT_TYPE_XLS:
+                yield None
+                return
+
+            with SpooledTemporaryFile(max_size=self.REPORT_MAX_MEMORY_SIZE) as report:
+                for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                    report.write(chunk)
+
+                if not report.tell():
+                    yield None
+                    return
+
+                report.seek(0)
+                yield report
+
+    @contextmanager
+    def open_report(self, report):
+        """
+        Opens the workbook in read-only mode, sheets are read row by row so memory doesn't grow with the report size
+        """
+        workbook = load_workbook(report, read_only=True, data_only=True)
+        try:
+            yield workbook
+        finally:
+            workbook.close()
+
+    def iter_sheet_rows(self, workbook, sheet_name, columns):
+        """
+        Yields every non empty row of the sheet as a dict with just the given columns,
+        the first row of the sheet is the header
+        """
+        rows = workbook[sheet_name].iter_rows(values_only=True)
+        header = next(rows, None)
+        if not header:
+            return
+
+        column_indexes = {column: header.index(column) for column in columns if column in header}
+        for row in rows:
+            if all(value is None for value in row):
+                continue
+
+            yield {column: row[index] if index < len(row) else None for column, index in column_indexes.items()}
 
     def get_headers(self):
         return {
@@ -207,16 +207,32 @@ class JiraApi(BaseApi):
         response_json = response.json()
         values = response_json["values"]
 
+        # with the total, the rest of pages can be fetched at the same time
+        if response_json.get("nextPage") and response_json.get("total") is not None:
+            page_urls = [
+                self.set_url_param(response_json["nextPage"], "startAt", start_at)
+                for start_at in range(
+                    response_json["startAt"] + response_json["maxResults"],
+                    response_json["total"],
+                    response_json["maxResults"],
+                )
+            ]
+            for page_values in self.map_concurrently(self.get_page_values, page_urls):
+                values += page_values
+
+            return values
+
         while response_json.get("nextPage"):
-            response = requests.get(
-                response_json["nextPage"],
-                headers=self.get_headers(),
-            )
+            response = self.request(response_json["nextPage"], headers=self.get_headers())
             response_json = response.json()
             values += response_json["values"]
 
         return values
 
+    def get_page_values(self, url):
+        response = self.request(url, headers=self.get_headers())
+        return response.json()["values"]
+
     def get_service_info(self):
         response = self.request(
             path=self.get_path_with_cloud_id("/serverInfo"),
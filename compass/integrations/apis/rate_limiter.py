@@ -0,0 +1,28 @@
+import threading
+import time
+
+from django.conf import settings
+
+
+class RateLimiter:
+    """
+    Spaces out the requests of an API so that all the threads of the process together don't send more than
+    API_MAX_REQUESTS_PER_SECOND[<API class name>] requests per second. APIs without a limit are not delayed.
+    """
+
+    _next_request_at: dict[str, float] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def wait(cls, name: str):
+        max_requests_per_second = float(settings.API_MAX_REQUESTS_PER_SECOND.get(name) or 0)
+        if not max_requests_per_second:
+            return
+
+        with cls._lock:
+            now = time.monotonic()
+            request_at = max(now, cls._next_request_at.get(name, now))
+            cls._next_request_at[name] = request_at + 1 / max_requests_per_second
+
+        if request_at > now:
+            time.sleep(request_at - now)
@@ -30,6 +30,7 @@ from .iradar_integration import (  # noqa: F401
 )
 from .jira_integration import JiraIntegration  # noqa: F401
 from .mailchimp_integration import MailChimpIntegration  # noqa: F401
+from .record_writer import RecordWriter  # noqa: F401
 from .slack_integration import SlackIntegration  # noqa: F401
 from .snyk_integration import (  # noqa: F401
     SnykIntegration,
@@ -18,8 +18,6 @@ from compass.integrations.integrations.git_base_integration import (
 )
 from mvp.models import (
     DataProviderConnection,
-    DataProviderMemberProjectRecord,
-    DataProviderRecord,
     ModuleChoices,
     Organization,
     Repository,
@@ -94,8 +92,7 @@ class AzureDevOpsIntegration(GitBaseIntegration):
         projects = self.fetch_projects()
         logger.info(f"{len(projects)} repositories found")
 
-        for project in projects:
-            self.process_project(project)
+        self.process_projects(self.process_project, projects)
 
         self.update_last_fetched(connection)
 
@@ -125,35 +122,16 @@ class AzureDevOpsIntegration(GitBaseIntegration):
         return projects
 
     def process_project(self, project):
-        repo_id = project.external_id
-        repo_name = project.name
-        project_name = project.meta["project"]["name"]
-        since, until = self.get_since_until(project)
-
-        # Skip since X 23:59:59 until X+1 00:00:00
-        if (until - since).total_seconds() <= 1:
-            return
-
-        since_until_days = self.get_since_until_days(since, until)
-        logger.info(f"Retrieving commit activity for repository '{repo_name}' since {since} until {until}")
-
-        for since, until in since_until_days:
-            date = until - timedelta(seconds=1)
-            commit_count, file_change_count, developers = self.get_stats(project_name, repo_id, since, until)
-
-            self.record_project_stats(project, commit_count, file_change_count, date)
-
-            for developer in developers.values():
-                self.record_developer_stats(project, developer, date)
+        self.process_commit_stats(project)
 
     def record_project_stats(self, project, commit_count, file_change_count, date):
-        DataProviderRecord.objects.create(
+        self.add_record(
             project=project,
             field=self.fields[self.FIELD_COMMIT_COUNT],
             value=commit_count,
             date_time=date,
         )
-        DataProviderRecord.objects.create(
+        self.add_record(
             project=project,
             field=self.fields[self.FIELD_FILE_CHANGE_COUNT],
             value=file_change_count,
@@ -165,7 +143,7 @@ class AzureDevOpsIntegration(GitBaseIntegration):
         developer_name = developer["data"]["name"]
         member = self.get_or_update_member(self.organization, developer_name, developer_id, developer["data"])
 
-        DataProviderMemberProjectRecord.objects.create(
+        self.add_member_record(
             member=member,
             project=project,
             field=self.fields[self.FIELD_COMMIT_COUNT],
@@ -173,67 +151,31 @@ class AzureDevOpsIntegration(GitBaseIntegration):
             date_time=date,
         )
 
-    def get_stats(self, project_name, repo_id, since, until):
-        num_commits, first_commit, last_commit, developers = self.get_commits(project_name, repo_id, since, until)
-
-        files_changed = (
-            self.get_num_files_changed_between_commits(repo_id, first_commit, last_commit) if num_commits else 0
-        )
-
-        return num_commits, files_changed, developers
-
-    def get_commits(self, project_name, repo_id, since, until):
-        from_date = Serializer().query("to_date", since, "iso-8601")
+    def list_project_commits(self, project, since, until):
+        from_date = Serializer().query("from_date", since, "iso-8601")
         to_date = Serializer().query("to_date", until, "iso-8601")
-        commits = self.api.list_commits(repo_id, project_name, from_date, to_date)
-
-        num_commits = 0
-        last_commit = None
-        first_commit = None
-        developers = {}
-
-        for commit in commits:
-            author = commit.author
-            if not author:
-                continue
-
-            num_commits += 1
-
-            # Commits are returned in reverse chronological order
-            if not last_commit:
-                last_commit = commit.commit_id
-
-            first_commit = commit.commit_id
+        return self.api.list_commits(
+            project.external_id, project.meta["project"]["name"], from_date, to_date, all_pages=True
+        )
 
-            developer_email = author.email
+    def parse_commit(self, commit):
+        author = commit.author
+        if not author:
+            return None
 
-            # email might be empty, using composite key
-            key = developer_email, author.name
-            if key not in developers:
-                developers[key] = {
-                    "data": author.as_dict(),
-                    "commit_count": 1,
-                }
-            else:
-                developers[key]["commit_count"] += 1
+        # from_date and to_date filter by the committer date
+        date = commit.committer.date if commit.committer and commit.committer.date else author.date
+        # email might be empty, using composite key
+        return commit.commit_id, date, (author.email, author.name), author.as_dict()
 
-        return num_commits, first_commit, last_commit, developers
+    def get_project_num_files_changed(self, project, base, head):
+        return self.get_num_files_changed_between_commits(project.external_id, base, head)
 
     def get_num_files_changed_between_commits(self, repo_id, base, head):
         files = self.api.get_diff_files(repo_id, base, head)
 
         return len(files) if files else 0
 
-    def get_since_until_days(self, since, until):
-        days = []
-
-        while until > since:
-            since_day = max([until - timedelta(days=1), since])
-            days.insert(0, (since_day, until))
-            until = since_day
-
-        return days
-
     def get_or_create_fields(self):
         fields = [
             self.FIELD_COMMIT_COUNT,
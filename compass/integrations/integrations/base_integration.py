@@ -1,3 +1,4 @@
+import threading
 from abc import ABC, abstractmethod
 from datetime import datetime
 
@@ -14,7 +15,9 @@ from mvp.models import (
     DataProviderProject,
     DataProviderRecord,
 )
-from mvp.utils import get_since_until_last_record_months
+from mvp.utils import get_since_until_last_record_months, run_concurrently
+
+from .record_writer import RecordWriter
 
 
 class ProviderSingleton:
@@ -38,6 +41,9 @@ class ProviderSingleton:
 class BaseIntegration(ABC):
     NUM_MONTHS_FETCH_NEW_PROJECT = 1
 
+    # Projects fetched at the same time by process_projects(), FETCH_DATA_MAX_CONCURRENT_PROJECTS if not set
+    MAX_CONCURRENT_PROJECTS = None
+
     @property
     @abstractmethod
     def modules(self):
@@ -55,6 +61,10 @@ class BaseIntegration(ABC):
 
     def __init__(self):
         self._provider = None
+        # each thread buffers its own records
+        self._thread_data = threading.local()
+        self._record_writers = []
+        self._record_writers_lock = threading.Lock()
 
     @property
     def provider(self):
@@ -108,6 +118,41 @@ class BaseIntegration(ABC):
             member.save()
         return member
 
+    @property
+    def record_writer(self):
+        record_writer = getattr(self._thread_data, "record_writer", None)
+        if record_writer is None:
+            record_writer = RecordWriter(settings.INTEGRATION_RECORDS_BATCH_SIZE)
+            self._thread_data.record_writer = record_writer
+            with self._record_writers_lock:
+                self._record_writers.append(record_writer)
+        return record_writer
+
+    def add_record(self, project, field, value, date_time):
+        """
+        Records are buffered and written in batches, call flush_records() once a project is processed
+        """
+        self.record_writer.add_record(project, field, value, date_time)
+
+    def add_member_record(self, member, project, field, value, date_time):
+        self.record_writer.add_member_record(member, project, field, value, date_time)
+
+    def flush_records(self):
+        self.record_writer.flush()
+
+    def get_num_records_written(self):
+        with self._record_writers_lock:
+            return sum(writer.num_created + writer.num_updated for writer in self._record_writers)
+
+    def process_projects(self, function, projects):
+        """
+        Calls function(project) for every project, several at the same time if enabled. The function must
+        flush its records, as records are buffered by thread.
+        """
+        run_concurrently(
+            function, projects, self.MAX_CONCURRENT_PROJECTS or settings.FETCH_DATA_MAX_CONCURRENT_PROJECTS
+        )
+
     def get_since_until(self, project, fields=None, member=None, return_last_record=False):
         """
         From NUM_MONTHS_FETCH_NEW_PROJECT months ago (first day of monty) until today,
@@ -145,6 +190,7 @@ class BaseIntegration(ABC):
             return None
 
     def update_last_fetched(self, connection):
+        self.flush_records()
         connection.last_fetched_at = timezone.make_aware(datetime.utcnow())
         connection.save()
 
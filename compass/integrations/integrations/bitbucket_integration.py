@@ -2,7 +2,7 @@ import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterator, Optional, Tuple
 from urllib.parse import quote_plus
 
 import requests
@@ -19,8 +19,6 @@ from compass.integrations.integrations.git_base_integration import (
 )
 from mvp.models import (
     DataProviderConnection,
-    DataProviderMemberProjectRecord,
-    DataProviderRecord,
     ModuleChoices,
     Repository,
     RepositoryPullRequest,
@@ -57,6 +55,9 @@ class BitBucketIntegration(GitBaseIntegration):
     # TODO: set to 12 when there's a backwards strategy
     NUM_MONTHS_FETCH_NEW_PROJECT = 3
 
+    # Tokens are refreshed when they expire, which can't be done by several threads at the same time
+    MAX_CONCURRENT_PROJECTS = 1
+
     WEBHOOK_REQUEST_HEADER_ID = "X-Request-Uuid"
     WEBHOOK_EVENT_KEY = "X-Event-Key"
 
@@ -91,8 +92,7 @@ class BitBucketIntegration(GitBaseIntegration):
         projects = self.fetch_projects()
         logger.info(f"{len(projects)} repositories found")
 
-        for project in projects:
-            self.process_project(project)
+        self.process_projects(self.process_project, projects)
 
         self.update_last_fetched(connection)
 
@@ -142,14 +142,16 @@ class BitBucketIntegration(GitBaseIntegration):
             for developer in stats["developers"].values():
                 self.record_developer_stats(project, developer, stats["date"])
 
+        self.flush_records()
+
     def record_project_stats(self, project, stats):
-        DataProviderRecord.objects.create(
+        self.add_record(
             project=project,
             field=self.fields[self.FIELD_COMMIT_COUNT],
             value=stats["commit_count"],
             date_time=stats["date"],
         )
-        DataProviderRecord.objects.create(
+        self.add_record(
             project=project,
             field=self.fields[self.FIELD_FILE_CHANGE_COUNT],
             value=stats["file_change_count"],
@@ -163,7 +165,7 @@ class BitBucketIntegration(GitBaseIntegration):
 
         member = self.get_or_update_member(self.organization, developer_name, developer_id, developer["data"])
 
-        DataProviderMemberProjectRecord.objects.create(
+        self.add_member_record(
             member=member,
             project=project,
             field=self.fields[self.FIELD_COMMIT_COUNT],
@@ -182,9 +184,36 @@ class BitBucketIntegration(GitBaseIntegration):
         return stats_by_day
 
     def get_commits_by_day(self, workspace, repo_name, since, until):
+        stats = {}
+        for commit in self.iter_commits(workspace, repo_name, since, until):
+            date = datetime.strptime(commit["date"], BitBucketApi.DATE_FORMAT)
+            day = date.strftime(self.DAY_FORMAT)
+
+            if day not in stats:
+                stats[day] = {
+                    "date": date,
+                    "commit_count": 1,
+                    "first_commit": commit["hash"],
+                    "last_commit": commit["hash"],
+                    "developers": {},
+                }
+            else:
+                stats[day]["commit_count"] += 1
+                stats[day]["first_commit"] = commit["hash"]
+
+            developer = commit["author"]
+            developer_name = developer["raw"]
+            if developer_name not in stats[day]["developers"]:
+                stats[day]["developers"][developer_name] = {
+                    "data": developer,
+                    "commit_count": 1,
+                }
+
+        return stats
+
+    def iter_commits(self, workspace, repo_name, since, until):
         commits, links = self.api.list_commits(workspace, repo_name, return_links=True)
 
-        stats = {}
         while commits:
             for commit in commits:
                 date = datetime.strptime(commit["date"], BitBucketApi.DATE_FORMAT)
@@ -195,36 +224,28 @@ class BitBucketIntegration(GitBaseIntegration):
                     continue
 
                 if date <= since:
-                    return stats
-
-                day = date.strftime(self.DAY_FORMAT)
-
-                if day not in stats:
-                    stats[day] = {
-                        "date": date,
-                        "commit_count": 1,
-                        "first_commit": commit["hash"],
-                        "last_commit": commit["hash"],
-                        "developers": {},
-                    }
-                else:
-                    stats[day]["commit_count"] += 1
-                    stats[day]["first_commit"] = commit["hash"]
-
-                developer = commit["author"]
-                developer_name = developer["raw"]
-                if developer_name not in stats[day]["developers"]:
-                    stats[day]["developers"][developer_name] = {
-                        "data": developer,
-                        "commit_count": 1,
-                    }
+                    return
+
+                yield commit
 
             if "next" not in links:
                 break
 
             commits, links = self.api.parse_response(self.api.request(links["next"]["url"]))
 
-        return stats
+    def list_project_commits(self, project, since, until):
+        return list(self.iter_commits(project.meta["workspace"]["slug"], project.meta["slug"], since, until))
+
+    def parse_commit(self, commit):
+        author = commit["author"]
+        user = author.get("user")
+        date = datetime.strptime(commit["date"], BitBucketApi.DATE_FORMAT)
+        return commit["hash"], date, user["uuid"] if user else author["raw"], author
+
+    def get_project_num_files_changed(self, project, base, head):
+        return self.get_num_files_changed_between_commits(
+            project.meta["workspace"]["slug"], project.meta["slug"], base, head
+        )
 
     def filter_commits(self, commits, since, until):
         filtered_commits = []
@@ -602,6 +623,24 @@ class BitBucketIntegration(GitBaseIntegration):
             state=state,
         )
 
+    def get_repository_pull_request_pages(
+        self,
+        repository: GitRepositoryData,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        state: Optional[str] = None,
+    ) -> Iterator[list[dict]]:
+        yield from self.api.get_repository_pull_request_pages(
+            repo_owner=repository.owner,
+            repo_name=repository.name,
+            state=state,
+            updated_since=since,
+        )
+
+    def get_pull_request_updated_at(self, pull_request_data) -> Optional[datetime]:
+        updated_on = pull_request_data.get("updated_on")
+        return datetime.fromisoformat(updated_on) if updated_on else None
+
     @staticmethod
     def is_connection_connected(connection: DataProviderConnection) -> bool:
         return (
@@ -5,7 +5,7 @@ from django.utils import timezone
 
 from compass.integrations.apis import CodacyApi
 from compass.integrations.integrations import BaseIntegration
-from mvp.models import DataProviderConnection, DataProviderRecord, ModuleChoices
+from mvp.models import DataProviderConnection, ModuleChoices
 from mvp.utils import get_class_constants
 
 logger = logging.getLogger(__name__)
@@ -145,36 +145,40 @@ class CodacyIntegration(BaseIntegration):
         return projects
 
     def fetch_statistics(self, projects):
-        for project in projects:
-            since, until = self.get_since_until(project)
+        self.process_projects(self.fetch_project_statistics, projects)
 
-            # Skip since X 23:59:59 until X+1 00:00:00
-            if (until - since).total_seconds() <= 1:
-                continue
+    def fetch_project_statistics(self, project):
+        since, until = self.get_since_until(project)
+
+        # Skip since X 23:59:59 until X+1 00:00:00
+        if (until - since).total_seconds() <= 1:
+            return
+
+        logger.info(f"Retrieving statistics for project '{project.name}' since {since} until {until}")
 
-            logger.info(f"Retrieving statistics for project '{project.name}' since {since} until {until}")
+        stats_by_day = self.get_stats_by_day(project, since, until)
 
-            stats_by_day = self.get_stats_by_day(project, since, until)
+        for stat in stats_by_day.values():
+            for api_key, field_name in self.MAPPING_FIELDS.items():
+                if api_key in stat:
+                    self.record_stat(project, field_name, stat[api_key], stat["created_at"])
 
-            for stat in stats_by_day.values():
-                for api_key, field_name in self.MAPPING_FIELDS.items():
-                    if api_key in stat:
-                        self.record_stat(project, field_name, stat[api_key], stat["created_at"])
+            if "issuesPerCategory" in stat:
+                for issuesCategory in stat["issuesPerCategory"]:
+                    categoryId = issuesCategory["categoryId"]
 
-                if "issuesPerCategory" in stat:
-                    for issuesCategory in stat["issuesPerCategory"]:
-                        categoryId = issuesCategory["categoryId"]
+                    try:
+                        category = CodacyIssueCategory.get_by_id(categoryId)["field"]
+                    except ValueError:
+                        continue
 
-                        try:
-                            category = CodacyIssueCategory.get_by_id(categoryId)["field"]
-                        except ValueError:
-                            continue
+                    value = issuesCategory["numberOfIssues"]
+                    self.record_stat(project, category, value, stat["created_at"])
 
-                        value = issuesCategory["numberOfIssues"]
-                        self.record_stat(project, category, value, stat["created_at"])
+        self.flush_records()
 
     def record_stat(self, project, field_name, value, created_at):
-        DataProviderRecord.objects.create(
+        self.add_record(
             project=project,
             field=self.fields[field_name],
             value=value,
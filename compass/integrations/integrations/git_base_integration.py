@@ -1,11 +1,12 @@
+import bisect
 import logging
 import os
 import subprocess
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 from mvp.models import DataProviderConnection, Organization, Repository, RepositoryPullRequest
 
@@ -79,6 +80,11 @@ class GitBaseIntegration(BaseIntegration, ABC):
 
     WEBHOOK_REQUEST_HEADER_ID = None
 
+    # Commit stats are fetched in windows of days, listing the commits of each window in a single paginated
+    # pass. The window size adapts to the activity of the repository to list about this many commits each time.
+    COMMIT_STATS_WINDOW_COMMITS = 2000
+    COMMIT_STATS_WINDOW_MAX_DAYS = 31
+
     def __init__(self):
         super().__init__()
         self.api = None
@@ -172,6 +178,25 @@ class GitBaseIntegration(BaseIntegration, ABC):
     ) -> list[dict]:
         pass
 
+    def get_repository_pull_request_pages(
+        self,
+        repository: GitRepositoryData,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        state: Optional[str] = None,
+    ) -> Iterator[list[dict]]:
+        """
+        Pull requests of the repository by pages. Providers that can list them by last update override it
+        to stop after the pages updated before since, by default all of them are returned in one page.
+        """
+        yield self.get_repository_pull_requests(repository, since=since, until=until, state=state)
+
+    def get_pull_request_updated_at(self, pull_request_data) -> Optional[datetime]:
+        """
+        Last update of a pull request returned by get_repository_pull_request_pages, None if unknown
+        """
+        return None
+
     @staticmethod
     @abstractmethod
     def get_connected_repositories_with_integration(connection: DataProviderConnection):
@@ -207,6 +232,108 @@ class GitBaseIntegration(BaseIntegration, ABC):
         # TODO: implement if needed.
         return []
 
+    @abstractmethod
+    def list_project_commits(self, project, since: datetime, until: datetime) -> list:
+        """
+        All the commits of the project (repository) between both dates, in reverse chronological order
+        """
+
+    @abstractmethod
+    def parse_commit(self, commit) -> Optional[Tuple[str, datetime, str | tuple, dict]]:
+        """
+        Sha, date, developer id and developer data of a commit, or None if it's not counted
+        """
+
+    @abstractmethod
+    def get_project_num_files_changed(self, project, base: str, head: str) -> int:
+        pass
+
+    def process_commit_stats(self, project):
+        since, until = self.get_since_until(project)
+
+        # Skip since X 23:59:59 until X+1 00:00:00
+        if (until - since).total_seconds() <= 1:
+            return
+
+        days = self.get_since_until_days(since, until)
+        logger.info(f"Retrieving commit activity for repository '{project.name}' since {since} until {until}")
+
+        window_days = self.COMMIT_STATS_WINDOW_MAX_DAYS
+        while days:
+            window, days = days[:window_days], days[window_days:]
+            commits = self.list_project_commits(project, window[0][0], window[-1][1])
+
+            for (_, day_until), stats in zip(window, self.get_commit_stats_by_day(commits, window)):
+                date = day_until - timedelta(seconds=1)
+
+                # A single commit is compared with itself, there's no need to call the API
+                file_change_count = (
+                    self.get_project_num_files_changed(project, stats["first_commit"], stats["last_commit"])
+                    if stats["first_commit"] != stats["last_commit"]
+                    else 0
+                )
+                self.record_project_stats(project, stats["commit_count"], file_change_count, date)
+
+                for developer in stats["developers"].values():
+                    self.record_developer_stats(project, developer, date)
+
+            # Days are recorded in order, so an interrupted fetch continues from the last recorded day
+            self.flush_records()
+            window_days = self.get_next_window_days(len(window), len(commits))
+
+    def get_commit_stats_by_day(self, commits, days) -> list[dict]:
+        """
+        Buckets the commits of a window by the (since, until) days of the window
+        """
+        stats_by_day = [{"commit_count": 0, "first_commit": None, "last_commit": None, "developers": {}} for _ in days]
+        day_starts = [day_since for day_since, _ in days]
+
+        for commit in commits:
+            parsed_commit = self.parse_commit(commit)
+            if not parsed_commit:
+                continue
+
+            sha, date, developer_id, developer_data = parsed_commit
+            index = bisect.bisect_right(day_starts, date) - 1
+            if index < 0 or date >= days[index][1]:
+                continue
+
+            stats = stats_by_day[index]
+            stats["commit_count"] += 1
+
+            # Commits are returned in reverse chronological order
+            if not stats["last_commit"]:
+                stats["last_commit"] = sha
+
+            stats["first_commit"] = sha
+
+            if developer_id not in stats["developers"]:
+                stats["developers"][developer_id] = {
+                    "data": developer_data,
+                    "commit_count": 1,
+                }
+            else:
+                stats["developers"][developer_id]["commit_count"] += 1
+
+        return stats_by_day
+
+    def get_next_window_days(self, num_days, num_commits):
+        if not num_commits:
+            return self.COMMIT_STATS_WINDOW_MAX_DAYS
+
+        window_days = num_days * self.COMMIT_STATS_WINDOW_COMMITS // num_commits
+        return max(1, min(window_days, self.COMMIT_STATS_WINDOW_MAX_DAYS))
+
+    def get_since_until_days(self, since, until):
+        days = []
+
+        while until > since:
+            since_day = max([until - timedelta(days=1), since])
+            days.insert(0, (since_day, until))
+            until = since_day
+
+        return days
+
     @staticmethod
     def _get_branch_from_local_repo(repository: Repository) -> str | None:
         try:
@@ -1,7 +1,7 @@
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
 from urllib.parse import quote_plus
 
 from django.utils import timezone
@@ -20,8 +20,6 @@ from compass.integrations.integrations import (
 )
 from mvp.models import (
     DataProviderConnection,
-    DataProviderMemberProjectRecord,
-    DataProviderRecord,
     ModuleChoices,
     Repository,
     RepositoryPullRequest,
@@ -79,8 +77,7 @@ class GitHubIntegration(GitBaseIntegration):
         projects = self.fetch_projects(repositories)
         logger.info(f"{len(projects)} repositories found")
 
-        for project in projects:
-            self.process_project(project)
+        self.process_projects(self.process_project, projects)
 
     def fetch_projects(self, repositories):
         projects = []
@@ -99,37 +96,16 @@ class GitHubIntegration(GitBaseIntegration):
         return projects
 
     def process_project(self, project):
-        repo_name = project.meta["name"]
-        repo_owner = project.meta["owner"]["login"]
-        default_branch = project.meta["default_branch"]
-        since, until = self.get_since_until(project)
-
-        # Skip since X 23:59:59 until X+1 00:00:00
-        if (until - since).total_seconds() <= 1:
-            return
-
-        since_until_days = self.get_since_until_days(since, until)
-        logger.info(f"Retrieving commit activity for repository '{repo_name}' since {since} until {until}")
-
-        for since, until in since_until_days:
-            date = until - timedelta(seconds=1)
-            commit_count, file_change_count, developers = self.get_stats(
-                repo_owner, repo_name, default_branch, since, until
-            )
-
-            self.record_project_stats(project, commit_count, file_change_count, date)
-
-            for developer in developers.values():
-                self.record_developer_stats(project, developer, date)
+        self.process_commit_stats(project)
 
     def record_project_stats(self, project, commit_count, file_change_count, date):
-        DataProviderRecord.objects.create(
+        self.add_record(
             project=project,
             field=self.fields[self.FIELD_COMMIT_COUNT],
             value=commit_count,
             date_time=date,
         )
-        DataProviderRecord.objects.create(
+        self.add_record(
             project=project,
             field=self.fields[self.FIELD_FILE_CHANGE_COUNT],
             value=file_change_count,
@@ -141,7 +117,7 @@ class GitHubIntegration(GitBaseIntegration):
         developer_name = developer["data"]["login"]
         member = self.get_or_update_member(self.organization, developer_name, developer_id, developer["data"])
 
-        DataProviderMemberProjectRecord.objects.create(
+        self.add_member_record(
             member=member,
             project=project,
             field=self.fields[self.FIELD_COMMIT_COUNT],
@@ -149,66 +125,35 @@ class GitHubIntegration(GitBaseIntegration):
             date_time=date,
         )
 
-    def get_stats(self, owner_name, repo_name, branch, since, until):
-        num_commits, first_commit, last_commit, developers = self.get_commits(
-            owner_name, repo_name, branch, since, until
+    def list_project_commits(self, project, since, until):
+        return self.api.list_commits(
+            project.meta["owner"]["login"],
+            project.meta["name"],
+            project.meta["default_branch"],
+            since,
+            until,
+            all_pages=True,
         )
 
-        files_changed = (
-            self.get_num_files_changed_between_commits(owner_name, repo_name, first_commit, last_commit)
-            if num_commits
-            else 0
-        )
-
-        return num_commits, files_changed, developers
-
-    def get_commits(self, owner_name, repo_name, branch, since, until):
-        commits = self.api.list_commits(owner_name, repo_name, branch, since, until, all_pages=True)
-
-        num_commits = 0
-        last_commit = None
-        first_commit = None
-        developers = {}
-
-        for commit in commits:
-            author = commit["author"] if commit["author"] else commit["committer"]
-            if not author or author.get("type") == "Bot":
-                continue
-
-            num_commits += 1
-
-            # Commits are returned in reverse chronological order
-            if not last_commit:
-                last_commit = commit["sha"]
-
-            first_commit = commit["sha"]
+    def parse_commit(self, commit):
+        author = commit["author"] if commit["author"] else commit["committer"]
+        if not author or author.get("type") == "Bot":
+            return None
 
-            developer_id = author["id"]
-            if developer_id not in developers:
-                developers[developer_id] = {
-                    "data": author,
-                    "commit_count": 1,
-                }
-            else:
-                developers[developer_id]["commit_count"] += 1
+        # since and until filter by the committer date
+        date = self.parse_date(commit["commit"]["committer"]["date"])
+        return commit["sha"], date, author["id"], author
 
-        return num_commits, first_commit, last_commit, developers
+    def get_project_num_files_changed(self, project, base, head):
+        return self.get_num_files_changed_between_commits(
+            project.meta["owner"]["login"], project.meta["name"], base, head
+        )
 
     def get_num_files_changed_between_commits(self, owner_name, repo_name, base, head):
         comparison = self.api.compare_commits(owner_name, repo_name, base, head)
 
         return len(comparison) if comparison else 0
 
-    def get_since_until_days(self, since, until):
-        days = []
-
-        while until > since:
-            since_day = max([until - timedelta(days=1), since])
-            days.insert(0, (since_day, until))
-            until = since_day
-
-        return days
-
     def get_or_create_fields(self):
         fields = [
             self.FIELD_COMMIT_COUNT,
@@ -416,6 +361,27 @@ class GitHubIntegration(GitBaseIntegration):
             repo_full_name, since=since, until=until, state=state, all_pages=True
         )
 
+    def get_repository_pull_request_pages(
+        self,
+        repository: GitRepositoryData,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        state: Optional[str] = None,
+    ) -> Iterator[list[dict]]:
+        repo_full_name = f"{repository.owner}/{repository.name}"
+        pages = self.api.get_repository_pull_request_pages(
+            repo_full_name, state=state, sort="updated", direction="desc"
+        )
+        for pull_requests in pages:
+            yield pull_requests
+
+            # the next pages were updated before the last pull request of this one
+            if since and pull_requests and self.get_pull_request_updated_at(pull_requests[-1]) < since:
+                return
+
+    def get_pull_request_updated_at(self, pull_request_data) -> Optional[datetime]:
+        return self.parse_date(pull_request_data["updated_at"])
+
     @staticmethod
     def is_connection_connected(connection: DataProviderConnection) -> bool:
         return connection.data and connection.data.get("installation_ids")
@@ -5,7 +5,7 @@ from django.utils import timezone
 
 from compass.integrations.apis import IRadarRestApi, IRadarXlsApi
 from compass.integrations.integrations import BaseIntegration
-from mvp.models import DataProviderConnection, DataProviderRecord, ModuleChoices
+from mvp.models import DataProviderConnection, ModuleChoices
 from mvp.utils import get_class_constants
 
 logger = logging.getLogger(__name__)
@@ -70,6 +70,8 @@ class IRadarIntegration(BaseIntegration):
 
     FIELD_KEY_TOTAL = "total"
 
+    CVE_SEVERITY_COLUMN = "Severity"
+
     # TODO: add other types that have severity
     SEVERITY_ISSUE_TYPES = [
         IRadarIssueType.CVE,
@@ -129,42 +131,53 @@ class IRadarIntegration(BaseIntegration):
             if scan_date <= since or scan_date > until:
                 continue
 
-            report = self.api_xls.download_report(scan["domain"], scan["scanid"])
-            if report:
-                self.process_report(report, scan_date, project)
+            with self.api_xls.download_report(scan["domain"], scan["scanid"]) as report:
+                if report:
+                    self.process_report(report, scan_date, project)
 
     def process_report(self, report, scan_date, project):
         logger.info(f"Processing report for target '{project.name}' on {scan_date}")
 
-        self.process_cve_issues(report, scan_date, project)
-        self.process_submodules_total_issues(report, scan_date, project)
+        with self.api_xls.open_report(report) as workbook:
+            self.process_cve_issues(workbook, scan_date, project)
+            self.process_submodules_total_issues(workbook, scan_date, project)
 
-    def process_cve_issues(self, report, scan_date, project):
+    def process_cve_issues(self, workbook, scan_date, project):
         data_key = self.DATA_KEYS_MAP[IRadarIssueType.CVE]
-        if data_key not in report:
+        if data_key not in workbook.sheetnames:
             return
 
         cve_issue_count = dict.fromkeys(self.SEVERITY_LEVELS, 0)
-        for cve_issue in report[data_key]:
-            if str(cve_issue["Severity"]) == "nan":
+        for cve_issue in self.api_xls.iter_sheet_rows(workbook, data_key, [self.CVE_SEVERITY_COLUMN]):
+            severity = cve_issue.get(self.CVE_SEVERITY_COLUMN)
+            if not severity:
                 continue
 
-            severity = getattr(IRadarIssueSeverity, cve_issue["Severity"].upper())
-            cve_issue_count[severity] += 1
+            cve_issue_count[getattr(IRadarIssueSeverity, str(severity).upper())] += 1
+
+        self.record_cve_issues(cve_issue_count, scan_date, project)
+
+    def process_submodules_total_issues(self, workbook, scan_date, project):
+        total_issue_count = {}
+        for issue_type, data_key in self.DATA_KEYS_MAP.items():
+            # rows are counted without reading any column
+            rows = self.api_xls.iter_sheet_rows(workbook, data_key, []) if data_key in workbook.sheetnames else []
+            total_issue_count[issue_type] = sum(1 for _ in rows)
 
+        self.record_submodules_total_issues(total_issue_count, scan_date, project)
+
+    def record_cve_issues(self, cve_issue_count, scan_date, project):
         for severity, count in cve_issue_count.items():
-            DataProviderRecord.objects.create(
+            self.add_record(
                 project=project,
                 field=self.fields[IRadarIssueType.CVE][severity],
                 value=count,
                 date_time=scan_date,
             )
 
-    def process_submodules_total_issues(self, report, scan_date, project):
-        for issue_type, data_key in self.DATA_KEYS_MAP.items():
-            total_issues = len(report.get(data_key, []))
-
-            DataProviderRecord.objects.create(
+    def record_submodules_total_issues(self, total_issue_count, scan_date, project):
+        for issue_type, total_issues in total_issue_count.items():
+            self.add_record(
                 project=project,
                 field=self.fields[issue_type][self.FIELD_KEY_TOTAL],
                 value=total_issues,
@@ -0,0 +1,113 @@
+import logging
+
+from django.db import transaction
+from django.utils import timezone
+
+from mvp.models import DataProviderMemberProjectRecord, DataProviderRecord
+
+logger = logging.getLogger(__name__)
+
+
+class RecordWriter:
+    """
+    Buffers DataProviderRecord and DataProviderMemberProjectRecord rows and writes them with bulk queries.
+
+    A record is identified by its (member), project, field and date. Adding the same record twice keeps
+    the last value, and records that already exist in the database are updated instead of duplicated,
+    so fetching the same days again doesn't create new rows.
+    """
+
+    def __init__(self, batch_size=1000):
+        self.batch_size = batch_size
+        self._records = {DataProviderRecord: {}, DataProviderMemberProjectRecord: {}}
+        self.num_created = 0
+        self.num_updated = 0
+
+    def __len__(self):
+        return sum(len(records) for records in self._records.values())
+
+    def add_record(self, project, field, value, date_time):
+        self.add(DataProviderRecord(project=project, field=field, value=value, date_time=date_time))
+
+    def add_member_record(self, member, project, field, value, date_time):
+        self.add(
+            DataProviderMemberProjectRecord(
+                member=member, project=project, field=field, value=value, date_time=date_time
+            )
+        )
+
+    def add(self, record):
+        if timezone.is_naive(record.date_time):
+            record.date_time = timezone.make_aware(record.date_time)
+
+        self._records[type(record)][self.get_key(record)] = record
+
+        if len(self) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not len(self):
+            return
+
+        with transaction.atomic():
+            for model, records in self._records.items():
+                if records:
+                    self.write(model, records)
+                    records.clear()
+
+    def write(self, model, records):
+        existing = self.get_existing_records(model, records.values())
+
+        new_records = []
+        updated_records = []
+        for key, record in records.items():
+            pk, value = existing.get(key, (None, None))
+            if pk is None:
+                new_records.append(record)
+            elif value != record.value:
+                record.pk = pk
+                record.updated_at = timezone.now()
+                updated_records.append(record)
+
+        model.objects.bulk_create(new_records, batch_size=self.batch_size)
+        model.objects.bulk_update(updated_records, ["value", "updated_at"], batch_size=self.batch_size)
+
+        self.num_created += len(new_records)
+        self.num_updated += len(updated_records)
+        logger.debug(f"{model.__name__}: {len(new_records)} created, {len(updated_records)} updated")
+
+    def get_existing_records(self, model, records):
+        """
+        Primary key and value of the stored records with the same keys, in a single query
+        narrowed down by the projects, fields and dates of the batch
+        """
+        records = list(records)
+        filters = {
+            "project_id__in": {record.project_id for record in records},
+            "field_id__in": {record.field_id for record in records},
+            "date_time__range": (
+                min(record.date_time for record in records),
+                max(record.date_time for record in records),
+            ),
+        }
+        key_fields = ["project_id", "field_id", "date_time"]
+        if model is DataProviderMemberProjectRecord:
+            filters["member_id__in"] = {record.member_id for record in records}
+            key_fields = ["member_id", *key_fields]
+
+        keys = set(self.get_key(record) for record in records)
+        existing = {}
+        for pk, value, *key in model.objects.filter(**filters).values_list("pk", "value", *key_fields):
+            key = tuple(key)
+            if key in keys:
+                existing[key] = (pk, value)
+
+        return existing
+
+    @staticmethod
+    def get_key(record):
+        key = (record.project_id, record.field_id, record.date_time)
+        if isinstance(record, DataProviderMemberProjectRecord):
+            return (record.member_id, *key)
+
+        return key
@@ -1,9 +1,10 @@
+import hashlib
 import logging
 from datetime import datetime
 
-import pandas as pd
 import requests
 from bs4 import BeautifulSoup
+from django.core.cache import cache
 from django.utils import timezone
 from sentry_sdk import capture_message
 
@@ -11,7 +12,6 @@ from compass.integrations.apis import SnykRestApi, SnykV1Api
 from compass.integrations.integrations import BaseIntegration
 from mvp.models import (
     DataProviderConnection,
-    DataProviderRecord,
     License,
     LicenseCategoryChoices,
     ModuleChoices,
@@ -60,14 +60,19 @@ class SnykIntegration(BaseIntegration):
 
     SEVERITY_LICENSE_LEVELS = list(get_class_constants(SnykLicenseSeverity).values())
 
+    # SPDX ids of license URLs rarely change, they are shared by all the processes
+    SPDX_LICENSE_ID_CACHE_KEY = "snyk_spdx_license_id_{url_hash}"
+    SPDX_LICENSE_ID_CACHE_TIMEOUT = 60 * 60 * 24 * 30
+
     @property
     def modules(self):
         return [ModuleChoices.CODE_SECURITY, ModuleChoices.OPEN_SOURCE]
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._licenses_df = None
+        self._license_categories = None
         self._spdx_url_license_map = {}
+        self._license_title_categories = {}
 
     def fetch_data(self, connection):
         self.init_connection(connection)
@@ -95,26 +100,30 @@ class SnykIntegration(BaseIntegration):
         return projects
 
     def fetch_issue_count(self, projects):
-        for project in projects:
-            since, until = self.get_since_until(project)
+        self.process_projects(self.fetch_project_issue_count, projects)
 
-            # Skip since X 23:59:59 until X+1 00:00:00
-            if (until - since).total_seconds() <= 1:
-                continue
+    def fetch_project_issue_count(self, project):
+        since, until = self.get_since_until(project)
+
+        # Skip since X 23:59:59 until X+1 00:00:00
+        if (until - since).total_seconds() <= 1:
+            return
+
+        logger.info(f"Retrieving issues for project '{project.name}' since {since} until {until}")
 
-            logger.info(f"Retrieving issues for project '{project.name}' since {since} until {until}")
+        issue_counts = self.get_historic_issue_counts(project.external_id, since, until, project)
 
-            issue_counts = self.get_historic_issue_counts(project.external_id, since, until, project)
+        for issue_count in issue_counts.values():
+            for issue_type, issue_types in issue_count["counts"].items():
+                for level, value in issue_types.items():
+                    self.add_record(
+                        project=project,
+                        field=self.fields[issue_type][level],
+                        value=value,
+                        date_time=issue_count["created_at"],
+                    )
 
-            for issue_count in issue_counts.values():
-                for issue_type, issue_types in issue_count["counts"].items():
-                    for level, value in issue_types.items():
-                        DataProviderRecord.objects.create(
-                            project=project,
-                            field=self.fields[issue_type][level],
-                            value=value,
-                            date_time=issue_count["created_at"],
-                        )
+        self.flush_records()
 
     def get_historic_issue_counts(self, project_id, since, until, project):
         counts_by_day = {}
@@ -139,6 +148,9 @@ class SnykIntegration(BaseIntegration):
 
     def get_project_counts_per_day(self, project_id, snapshots, since, until):
         project_counts = {}
+        # license issue counts by snapshot signature, see get_snapshot_license_signature()
+        license_counts = {}
+
         for snapshot in snapshots:
             created_at = timezone.make_aware(datetime.strptime(snapshot["created"], SnykV1Api.DATE_FORMAT))
             if created_at <= since or created_at > until:
@@ -160,11 +172,14 @@ class SnykIntegration(BaseIntegration):
             # We implement a custom count for license issues
             license_issues = snapshot_counts.get(SnykIssueType.LICENSE)
             num_license_issues = sum(license_issues.values()) if license_issues else 0
-            snapshot_counts[SnykIssueType.LICENSE] = (
-                self.count_snapshot_license_issues(project_id, snapshot["id"])
-                if num_license_issues
-                else dict.fromkeys(self.SEVERITY_LICENSE_LEVELS, 0)
-            )
+            if not num_license_issues:
+                snapshot_counts[SnykIssueType.LICENSE] = dict.fromkeys(self.SEVERITY_LICENSE_LEVELS, 0)
+            else:
+                # Most daily snapshots don't change the dependencies, their license issues are counted once
+                signature = self.get_snapshot_license_signature(snapshot)
+                if signature not in license_counts:
+                    license_counts[signature] = self.count_snapshot_license_issues(project_id, snapshot["id"])
+                snapshot_counts[SnykIssueType.LICENSE] = dict(license_counts[signature])
 
             project_counts[day] = {
                 "counts": snapshot_counts,
@@ -173,6 +188,17 @@ class SnykIntegration(BaseIntegration):
 
         return project_counts
 
+    def get_snapshot_license_signature(self, snapshot):
+        """
+        Snapshots with the same number of dependencies and license issues by Snyk severity are considered
+        to have the same license issues
+        """
+        license_issue_count = snapshot["issueCounts"].get(SnykIssueType.LICENSE) or {}
+        return (
+            snapshot.get("totalDependencies"),
+            tuple(sorted(license_issue_count.items())),
+        )
+
     def count_snapshot_license_issues(self, project_id, snapshot_id):
         issues = self.api_v1.snapshot_issues(self.snyk_org_id, project_id, snapshot_id, types=[SnykIssueType.LICENSE])
 
@@ -194,27 +220,44 @@ class SnykIntegration(BaseIntegration):
         )
 
     def get_license_category(self, license_data):
-        licenses_df = self.get_licenses_df()
+        license_name = license_data["title"]
+        if license_name not in self._license_title_categories:
+            self._license_title_categories[license_name] = self.find_license_category(license_data)
+
+        return self._license_title_categories[license_name]
+
+    def find_license_category(self, license_data):
+        license_categories = self.get_license_categories()
 
         license_name = license_data["title"]
         slug = license_name.lower().replace(" license", "").replace(" ", "-")
-        row = licenses_df[licenses_df["slug"] == slug]
-        if not row.empty:
-            return row["category"].iloc[0]
+        if slug in license_categories["slug"]:
+            return license_categories["slug"][slug]
 
         license_url = license_data["url"]
-        spdx = self.fetch_spdx_license_id(license_url)
-        row = licenses_df[licenses_df["spdx"] == spdx]
-        if not row.empty:
-            return row["category"].iloc[0]
+        spdx = self.get_spdx_license_id(license_url)
+        if spdx in license_categories["spdx"]:
+            return license_categories["spdx"][spdx]
 
         capture_message(f"License not found: {license_name}")
         return None
 
-    def fetch_spdx_license_id(self, url):
+    def get_spdx_license_id(self, url):
         if url in self._spdx_url_license_map:
             return self._spdx_url_license_map[url]
 
+        # an empty string is cached for the URLs without SPDX id
+        url_hash = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        cache_key = self.SPDX_LICENSE_ID_CACHE_KEY.format(url_hash=url_hash)
+        spdx = cache.get(cache_key)
+        if spdx is None:
+            spdx = self.fetch_spdx_license_id(url) or ""
+            cache.set(cache_key, spdx, self.SPDX_LICENSE_ID_CACHE_TIMEOUT)
+
+        self._spdx_url_license_map[url] = spdx or None
+        return self._spdx_url_license_map[url]
+
+    def fetch_spdx_license_id(self, url):
         response = requests.get(url)
         response.raise_for_status()
 
@@ -227,11 +270,19 @@ class SnykIntegration(BaseIntegration):
             capture_message(f"Could not find SPDX license ID for URL: {url}")
             return None
 
-    def get_licenses_df(self):
-        if self._licenses_df is None:
-            self._licenses_df = pd.DataFrame.from_records(License.objects.all().values())
+    def get_license_categories(self):
+        """
+        License categories by slug and by SPDX id
+        """
+        if self._license_categories is None:
+            license_categories = {"slug": {}, "spdx": {}}
+            for slug, spdx, category in License.objects.values_list("slug", "spdx", "category"):
+                license_categories["slug"][slug] = category
+                license_categories["spdx"][spdx] = category
+
+            self._license_categories = license_categories
 
-        return self._licenses_df
+        return self._license_categories
 
     def get_or_create_fields(self):
         fields = {}
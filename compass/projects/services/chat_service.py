@@ -103,7 +103,7 @@ class ChatService(ContextualizationService):
             data_dir=cls.get_contextualization_directory(organization),
             suffix=cls.SCRIPT_OUTPUT_SUFFIX_GIT_INITIATIVES_COMBINED,
         )
-        return cls.load_output_data(organization, script_output_path)
+        return cls.load_output_file(organization, script_output_path)
 
     @classmethod
     def reset_chat(cls, organization: Organization, user: CustomUser) -> ChatHistory:
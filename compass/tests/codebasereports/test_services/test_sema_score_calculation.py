@@ -1,15 +1,19 @@
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
+from django.core.cache import cache
 from django.test import TestCase
 
 from compass.codebasereports.services import SemaScoreCalculator, SemaScoreService
-from mvp.models import Organization, ReferenceMetric, ScoreRecord
+from compass.codebasereports.widgets import SnykWidget, TeamWidget
+from mvp.models import MetricsChoices, Organization, ReferenceMetric, ScoreRecord
 from mvp.services import OrganizationSegmentService
 from mvp.utils import get_tz_date
 
 
 class SemaScoreCalculationTests(TestCase):
     def setUp(self):
+        cache.clear()
         # TODO: use fixtures
         self.organization = Organization.objects.create(name="TestOrg")
         segment = OrganizationSegmentService(self.organization).segment()
@@ -40,3 +44,41 @@ class SemaScoreCalculationTests(TestCase):
         # TODO: create connections and check num records is > 1
         yesterday = get_tz_date(datetime.utcnow().date() - timedelta(days=1))
         pass
+
+    def test_get_scores_by_day(self):
+        days = [get_tz_date(datetime(2024, 1, day).date()) for day in (1, 2, 3)]
+        # reference percentiles 25, 50 and 75 are 12.5, 25 and 37.5
+        values_by_day = {
+            days[0]: {MetricsChoices.HIGH_RISK_IN_FILE: 10, MetricsChoices.DEVELOPERS_RETENTION_RATIO: 40},
+            days[1]: {MetricsChoices.HIGH_RISK_IN_FILE: 20},
+        }
+
+        def get_metric_value(metric, date):
+            return values_by_day.get(date, {}).get(metric)
+
+        calculator = SemaScoreCalculator(self.organization)
+        with patch.object(calculator.provider, "get_metric_value", side_effect=get_metric_value):
+            scores = calculator.get_scores_by_day(days)
+
+        # (10 * 1 + 25 * 0) / 35, 10 / 10 and 0 / 25
+        self.assertEqual(scores[0], (29, 100, 0))
+        self.assertEqual(scores[1], (67, 67, None))
+        self.assertEqual(scores[2], (None, None, None))
+
+    def test_populate_widgets(self):
+        score_service = SemaScoreService(self.organization)
+        provider = score_service.calculator.provider
+        provider.get_metric_value(MetricsChoices.HIGH_RISK_IN_FILE, get_tz_date(provider.until))
+
+        with patch.object(SnykWidget, "get_widgets") as mock_snyk_widgets:
+            with patch.object(TeamWidget, "get_widgets", return_value={}) as mock_team_widgets:
+                score_service.populate_widgets()
+                TeamWidget(self.organization).get_cached_widgets(provider.since, provider.until)
+
+        # the widgets loaded for the scores are not computed again
+        mock_snyk_widgets.assert_not_called()
+        mock_team_widgets.assert_called_once()
+        self.assertEqual(
+            SnykWidget(self.organization).get_cached_widgets(provider.since, provider.until),
+            provider.get_loaded_widgets(SnykWidget),
+        )
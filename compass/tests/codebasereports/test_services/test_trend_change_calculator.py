@@ -0,0 +1,59 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+from django.test import SimpleTestCase
+
+from compass.codebasereports.services import RollingTrendChangeCalculator, TrendChangeCalculator
+from compass.codebasereports.services.trend_change_calculator import TrendChangeConfig
+
+
+class RollingTrendChangeCalculatorTests(SimpleTestCase):
+    def setUp(self):
+        rnd = random.Random(1)
+        start = datetime(2022, 1, 1, tzinfo=timezone.utc)
+        records = []
+        for day in range(500):
+            for member in range(5):
+                if rnd.random() < 0.3 + (day % 90) / 300:
+                    records.append(
+                        {
+                            "date_time": start + timedelta(days=day),
+                            "member__external_id": f"member-{member}",
+                            "commits": rnd.randint(1, 9),
+                        }
+                    )
+        self.records = pd.DataFrame.from_records(records)
+        self.start = start
+
+    def assert_same_evaluations(self, conf):
+        rolling_calculator = RollingTrendChangeCalculator(self.records, conf)
+        calculator = TrendChangeCalculator()
+
+        for day in range(180, 500, 7):
+            until = self.start + timedelta(days=day)
+            since = until - timedelta(days=180)
+            window = self.records[(self.records["date_time"] >= since) & (self.records["date_time"] <= until)]
+
+            self.assertEqual(
+                rolling_calculator.evaluate(since, until),
+                {
+                    "average_developer_activity": calculator.average_developer_activity(window, conf),
+                    "commit_analysis": calculator.commit_analysis(window, conf),
+                    "developers_and_development_activity": calculator.developers_and_development_activity(window, conf),
+                },
+            )
+
+    def test_evaluate(self):
+        self.assert_same_evaluations(TrendChangeConfig())
+
+    def test_evaluate_moving_window(self):
+        self.assert_same_evaluations(TrendChangeConfig(moving_window=2))
+
+    def test_evaluate_without_records(self):
+        calculator = RollingTrendChangeCalculator(self.records)
+
+        self.assertIsNone(calculator.evaluate(self.start - timedelta(days=30), self.start - timedelta(days=1)))
+        # moving the window backwards starts over
+        self.assertIsNotNone(calculator.evaluate(self.start, self.start + timedelta(days=60)))
+        self.assertIsNone(calculator.evaluate(self.start - timedelta(days=30), self.start - timedelta(days=1)))
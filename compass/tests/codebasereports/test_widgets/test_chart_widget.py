@@ -0,0 +1,68 @@
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from compass.codebasereports.widgets import CodacyWidget
+from compass.integrations.integrations import CodacyIntegration
+from mvp.models import DataProviderField, DataProviderProject, DataProviderRecord, Organization
+from mvp.services import OrganizationCacheService
+
+
+class ChartWidgetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.organization = Organization.objects.create(name="TestOrg")
+        provider = CodacyIntegration().provider
+        field = DataProviderField.objects.create(provider=provider, name=CodacyIntegration.FIELD_COMPLEXITY_TOTAL)
+        self.projects = [
+            DataProviderProject.objects.create(
+                provider=provider, organization=self.organization, name=name, external_id=name
+            )
+            for name in ("Project B", "Project A")
+        ]
+        # Sunday
+        self.since = datetime(2024, 6, 2, tzinfo=timezone.utc)
+        for project_index, project in enumerate(self.projects):
+            for day in range(14):
+                for hour in (8, 16):
+                    DataProviderRecord.objects.create(
+                        project=project,
+                        field=field,
+                        value=day * 100 + hour + project_index,
+                        date_time=self.since + timedelta(days=day, hours=hour + project_index),
+                    )
+
+        self.widget = CodacyWidget(self.organization)
+
+    def test_get_latest_records(self):
+        records = self.widget.get_latest_records(self.widget.RECORD_FIELDS, self.since, self.since + timedelta(days=14))
+
+        self.assertEqual(len(records), 2 * 14)
+        # the first records are the ones of the project with the first record
+        self.assertEqual([record["project__name"] for record in records[:2]], ["Project B", "Project A"])
+        self.assertEqual([record["value"] for record in records[:2]], [16, 17])
+
+    def test_get_latest_records_aggregate(self):
+        records = self.widget.get_latest_records(
+            self.widget.RECORD_FIELDS,
+            self.since,
+            self.since + timedelta(days=14),
+            aggregate=CodacyWidget.AGGREGATE_DATE_FORMAT_WEEK,
+        )
+
+        # one record per project and week, starting on Sunday
+        self.assertEqual([record["value"] for record in records], [616, 617, 1316, 1317])
+
+    def test_get_cached_widgets(self):
+        since, until = date(2024, 6, 2), date(2024, 6, 16)
+        with patch.object(CodacyWidget, "get_widgets", autospec=True, side_effect=CodacyWidget.get_widgets) as mock:
+            widgets = CodacyWidget(self.organization).get_cached_widgets(since, until)
+            self.assertEqual(CodacyWidget(self.organization).get_cached_widgets(since, until), widgets)
+            self.assertEqual(mock.call_count, 1)
+
+            # new data is computed again
+            OrganizationCacheService.bump_data_version(self.organization)
+            CodacyWidget(self.organization).get_cached_widgets(since, until)
+            self.assertEqual(mock.call_count, 2)
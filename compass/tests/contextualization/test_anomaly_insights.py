@@ -0,0 +1,153 @@
+from datetime import timedelta
+
+from django.test import TestCase
+
+from compass.contextualization.models import AnomalyInsights
+from compass.contextualization.tasks.import_anomaly_insights import (
+    ImportGitAnomalyInsightsTask,
+    ImportJiraAnomalyInsightsTask,
+    save_anomaly_insights,
+)
+from compass.integrations.integrations import GitHubIntegration
+from contextualization.models.anomaly_insights import (
+    BlindSpot,
+    GitCombinedInsights,
+    GitInsight,
+    JiraCombinedInsights,
+    JiraInsight,
+)
+from contextualization.pipelines.insights_aggregation_pipeline.schemas import SkipMeetingInsights
+from mvp.models import JiraProject, Organization, Repository
+
+
+class ImportAnomalyInsightsTests(TestCase):
+    def setUp(self):
+        self.organization = Organization.objects.create(name="Test Org")
+        self.repository = Repository.objects.create(
+            organization=self.organization,
+            provider=GitHubIntegration().provider,
+            external_id="1",
+            owner="org",
+            name="repo",
+        )
+        self.project = JiraProject.objects.create(
+            organization=self.organization, name="Project", key="PRJ", external_id="1"
+        )
+
+    def get_git_insights(self, *titles, repo=None):
+        return GitCombinedInsights(
+            anomaly_insights=[
+                GitInsight(
+                    repo=repo or self.repository.public_id(),
+                    category="quality_impact",
+                    title=title,
+                    insight="Insight",
+                    evidence="Evidence",
+                    significance_score=8,
+                    confidence_level="High",
+                    sources=["abc123"],
+                    resolution="Resolution",
+                    messages=[],
+                    blind_spot=BlindSpot(location="Location", resolution="Resolution"),
+                )
+                for title in titles
+            ]
+        )
+
+    def get_jira_insights(self, *titles, project="PRJ"):
+        return JiraCombinedInsights(
+            anomaly_insights=[
+                JiraInsight(
+                    project=project,
+                    category="scope_impact",
+                    title=title,
+                    insight="Insight",
+                    evidence="Evidence",
+                    significance_score=6,
+                    confidence_level="Medium",
+                    source=["PRJ-1"],
+                    ticket_categories=["Story"],
+                )
+                for title in titles
+            ],
+            skip_meeting_insights=SkipMeetingInsights(anomaly_insights=[]),
+        )
+
+    def move_insights_back(self, days):
+        for insight in AnomalyInsights.objects.all():
+            insight.created_at -= timedelta(days=days)
+            insight.save()
+
+    def test_import_git_insights(self):
+        ImportGitAnomalyInsightsTask().import_results(self.organization, self.get_git_insights("First", "Second"))
+        # the insights of repositories of other organizations are ignored
+        ImportGitAnomalyInsightsTask().import_results(self.organization, self.get_git_insights("Other", repo="x"))
+
+        self.assertEqual(
+            list(
+                AnomalyInsights.objects.order_by("anomaly_id").values_list(
+                    "anomaly_id", "anomaly_type", "title", "repository", "source_commits"
+                )
+            ),
+            [
+                ("AI-GIT-1", "git", "First", self.repository.id, ["abc123"]),
+                ("AI-GIT-2", "git", "Second", self.repository.id, ["abc123"]),
+            ],
+        )
+
+        # re-importing on the same day doesn't duplicate the insights
+        ImportGitAnomalyInsightsTask().import_results(self.organization, self.get_git_insights("First", "Second"))
+        self.assertEqual(AnomalyInsights.objects.count(), 2)
+
+        # the next day's insights continue the ids
+        self.move_insights_back(1)
+        ImportGitAnomalyInsightsTask().import_results(self.organization, self.get_git_insights("Third"))
+        self.assertEqual(AnomalyInsights.objects.get(title="Third").anomaly_id, "AI-GIT-3")
+
+    def test_import_jira_insights(self):
+        ImportJiraAnomalyInsightsTask().import_results(self.organization, self.get_jira_insights("First", "Second"))
+        ImportJiraAnomalyInsightsTask().import_results(
+            self.organization, self.get_jira_insights("Other", project="OTHER")
+        )
+
+        self.assertEqual(
+            list(
+                AnomalyInsights.objects.order_by("anomaly_id").values_list(
+                    "anomaly_id", "anomaly_type", "title", "project", "ticket_categories", "source_tickets"
+                )
+            ),
+            [
+                ("AI-JIRA-1", "jira", "First", self.project.id, ["Story"], ["PRJ-1"]),
+                ("AI-JIRA-2", "jira", "Second", self.project.id, ["Story"], ["PRJ-1"]),
+            ],
+        )
+
+        ImportJiraAnomalyInsightsTask().import_results(self.organization, self.get_jira_insights("First", "Second"))
+        self.assertEqual(AnomalyInsights.objects.count(), 2)
+
+    def test_save_anomaly_insights_updates_existing(self):
+        ImportJiraAnomalyInsightsTask().import_results(self.organization, self.get_jira_insights("First"))
+        insight = AnomalyInsights.objects.get()
+
+        save_anomaly_insights(
+            [
+                AnomalyInsights(
+                    anomaly_id=insight.anomaly_id,
+                    anomaly_type="jira",
+                    project=self.project,
+                    title="Updated",
+                    insight="Updated insight",
+                    evidence=insight.evidence,
+                    significance_score=9,
+                    confidence_level=insight.confidence_level,
+                    category=insight.category,
+                )
+            ]
+        )
+
+        updated_insight = AnomalyInsights.objects.get()
+        self.assertEqual(updated_insight.id, insight.id)
+        self.assertEqual(
+            (updated_insight.title, updated_insight.insight, updated_insight.significance_score),
+            ("Updated", "Updated insight", 9),
+        )
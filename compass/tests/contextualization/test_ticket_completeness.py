@@ -0,0 +1,107 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from compass.contextualization.models import TicketCompleteness
+from compass.contextualization.tasks.import_ticket_completeness_task import ImportTicketCompletenessTask
+from compass.contextualization.views import TicketCompletenessTrendChartView
+from contextualization.pipelines.pipeline_D_jira_score_completeness.schemas import TicketCompletenessScoreResult
+from mvp.models import JiraProject, Organization
+
+
+class TicketCompletenessHistoryTests(TestCase):
+    def setUp(self):
+        self.organization = Organization.objects.create(name="Test Org")
+        self.project = JiraProject.objects.create(
+            organization=self.organization, name="Project", key="PRJ", external_id="1"
+        )
+        self.today = timezone.now().date()
+
+    def import_scores(self, scores):
+        ImportTicketCompletenessTask().import_results(
+            self.organization,
+            [
+                TicketCompletenessScoreResult(
+                    issue_key=issue_key,
+                    summary="Summary",
+                    priority="High",
+                    jira_completeness_score=score,
+                    evaluation_jira_completeness_score="evaluation",
+                    explanation_jira_completeness_score="explanation",
+                    stage_category="Ready for Work",
+                    llm_category="Story",
+                    project_name="PRJ",
+                    quality_category="Advanced",
+                )
+                for issue_key, score in scores.items()
+            ],
+        )
+
+    def move_history_back(self, days):
+        for ticket in TicketCompleteness.objects.all():
+            ticket.date -= timedelta(days=days)
+            if ticket.valid_until:
+                ticket.valid_until -= timedelta(days=days)
+            ticket.save()
+
+    def test_import_stores_changes_only(self):
+        self.import_scores({"PRJ-1": 50, "PRJ-2": 60})
+        self.move_history_back(10)
+        self.import_scores({"PRJ-1": 50, "PRJ-2": 70})
+        # a change on the same day replaces the version of the day
+        self.import_scores({"PRJ-1": 50, "PRJ-2": 80})
+
+        self.assertEqual(
+            list(
+                TicketCompleteness.objects.order_by("ticket_id", "date").values_list(
+                    "ticket_id", "completeness_score", "date", "valid_until"
+                )
+            ),
+            [
+                ("PRJ-1", 50, self.today - timedelta(days=10), None),
+                ("PRJ-2", 60, self.today - timedelta(days=10), self.today),
+                ("PRJ-2", 80, self.today, None),
+            ],
+        )
+        self.assertEqual(
+            sorted(
+                TicketCompleteness.latest_ticket_data(self.organization).values_list("completeness_score", flat=True)
+            ),
+            [50, 80],
+        )
+        self.assertEqual(
+            sorted(
+                TicketCompleteness.latest_ticket_data(
+                    self.organization, at_date=self.today - timedelta(days=1)
+                ).values_list("completeness_score", flat=True)
+            ),
+            [50, 60],
+        )
+
+    def test_trend_data(self):
+        self.import_scores({"PRJ-1": 40})
+        self.move_history_back(10)
+        self.import_scores({"PRJ-1": 60, "PRJ-2": 80})
+        self.move_history_back(5)
+
+        date_points = [self.today - timedelta(days=days) for days in (20, 12, 5, 0)]
+        results = TicketCompletenessTrendChartView().get_trend_data(self.organization, "PRJ", date_points)
+
+        self.assertEqual(
+            results,
+            [
+                {"date": date_points[0].strftime("%Y-%m-%d"), "ticket_count": 0, "avg_completeness_score": None},
+                {"date": date_points[1].strftime("%Y-%m-%d"), "ticket_count": 1, "avg_completeness_score": 40.0},
+                {"date": date_points[2].strftime("%Y-%m-%d"), "ticket_count": 2, "avg_completeness_score": 70.0},
+                {"date": date_points[3].strftime("%Y-%m-%d"), "ticket_count": 2, "avg_completeness_score": 70.0},
+            ],
+        )
+
+    def test_trend_data_without_date_points(self):
+        self.import_scores({"PRJ-1": 40})
+
+        view = TicketCompletenessTrendChartView()
+        date_points = view.get_dates_to_query(self.today, self.today - timedelta(days=1))
+
+        self.assertEqual(view.get_trend_data(self.organization, "PRJ", date_points), [])
@@ -0,0 +1,35 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from compass.integrations.apis import AzureDevOpsApi, AzureDevOpsApiConfig
+
+
+class TestAzureDevOpsApi(SimpleTestCase):
+    def setUp(self):
+        AzureDevOpsApi._git_clients.clear()
+
+    def tearDown(self):
+        AzureDevOpsApi._git_clients.clear()
+
+    def test_git_clients_are_reused_until_the_token_changes(self):
+        # the resource area of the git client is resolved on the server, skip it
+        with patch("azure.devops.connection.Connection._get_resource_areas", return_value=[]):
+            api = AzureDevOpsApi(AzureDevOpsApiConfig(base_url="https://dev.azure.com/org", auth_token="token"))
+            same_api = AzureDevOpsApi(AzureDevOpsApiConfig(base_url="https://dev.azure.com/org", auth_token="token"))
+            refreshed_api = AzureDevOpsApi(
+                AzureDevOpsApiConfig(base_url="https://dev.azure.com/org", auth_token="refreshed")
+            )
+            other_api = AzureDevOpsApi(AzureDevOpsApiConfig(base_url="https://dev.azure.com/other", auth_token="token"))
+
+        self.assertIs(api.git_client, same_api.git_client)
+        self.assertIsNot(api.git_client, refreshed_api.git_client)
+        self.assertTrue(api.git_client.config.keep_alive)
+        # the client of the previous token isn't kept
+        self.assertEqual(
+            AzureDevOpsApi._git_clients,
+            {
+                "https://dev.azure.com/org": ("refreshed", refreshed_api.git_client),
+                "https://dev.azure.com/other": ("token", other_api.git_client),
+            },
+        )
@@ -0,0 +1,88 @@
+from unittest.mock import Mock, patch
+from urllib.parse import parse_qs, urlsplit
+
+from django.test import SimpleTestCase
+
+from compass.integrations.apis import BaseRestApi, BitBucketApi, BitBucketApiConfig, JiraApi, JiraApiConfig
+
+
+class TestBaseRestApiPagination(SimpleTestCase):
+    def setUp(self):
+        self.api = BaseRestApi()
+        self.api.API_BASE_URL = "https://api.github.com"
+
+    def get_response(self, url):
+        page = self.api.get_page_number(url)
+        return Mock(json=Mock(return_value=[page * 10, page * 10 + 1]), links={})
+
+    def test_get_all_pages_concurrently_with_last_link(self):
+        links = {
+            "next": {"url": "https://api.github.com/repos?per_page=2&page=2"},
+            "last": {"url": "https://api.github.com/repos?per_page=2&page=5"},
+        }
+
+        with patch.object(self.api, "request", side_effect=self.get_response) as mock_request:
+            records = self.api.get_all_pages([10, 11], links)
+
+        self.assertEqual(records, [10, 11, 20, 21, 30, 31, 40, 41, 50, 51])
+        self.assertEqual(mock_request.call_count, 4)
+
+    def test_get_all_pages_sequentially_without_last_link(self):
+        responses = [
+            Mock(json=Mock(return_value=[3]), links={"next": {"url": "https://api.github.com/repos?cursor=c"}}),
+            Mock(json=Mock(return_value=[4]), links={}),
+        ]
+        links = {"next": {"url": "https://api.github.com/repos?cursor=b"}}
+
+        with patch.object(self.api, "request", side_effect=responses):
+            records = self.api.get_all_pages([1, 2], links)
+
+        self.assertEqual(records, [1, 2, 3, 4])
+
+    def test_bitbucket_last_link_from_size(self):
+        api = BitBucketApi(BitBucketApiConfig(workspace="workspace", access_token="token", refresh_token="token"))
+        response = {
+            "values": [1],
+            "size": 25,
+            "pagelen": 10,
+            "next": "https://api.bitbucket.org/2.0/repositories/workspace?page=2",
+        }
+
+        _, links = api.parse_response(response)
+
+        self.assertEqual(
+            api.get_page_urls(links),
+            [
+                "https://api.bitbucket.org/2.0/repositories/workspace?page=2",
+                "https://api.bitbucket.org/2.0/repositories/workspace?page=3",
+            ],
+        )
+
+
+class TestJiraApiPagination(SimpleTestCase):
+    def setUp(self):
+        self.api = JiraApi(JiraApiConfig(access_token="token", refresh_token="token", cloud_id="cloud"))
+
+    def get_response(self, url, **kwargs):
+        start_at = int(parse_qs(urlsplit(url).query)["startAt"][0])
+        return Mock(json=Mock(return_value={"values": [start_at]}))
+
+    def test_parse_paginated_response_requests_pages_through_request(self):
+        response = Mock(
+            json=Mock(
+                return_value={
+                    "values": [0],
+                    "startAt": 0,
+                    "maxResults": 1,
+                    "total": 3,
+                    "nextPage": "https://api.atlassian.com/ex/jira/cloud/rest/api/3/project/search?startAt=1",
+                }
+            )
+        )
+
+        # pages go through request() so they are rate limited, retried and raise on errors
+        with patch.object(self.api, "request", side_effect=self.get_response) as mock_request:
+            values = self.api.parse_paginated_response(response)
+
+        self.assertEqual(values, [0, 1, 2])
+        self.assertEqual(mock_request.call_count, 2)
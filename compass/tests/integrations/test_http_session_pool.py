@@ -0,0 +1,38 @@
+import threading
+from http.server import ThreadingHTTPServer
+
+from django.test import SimpleTestCase
+
+from compass.integrations.apis import BaseApi, HttpSessionPool
+from mvp.management.commands.benchmark_http_sessions import JsonRequestHandler
+
+
+class TestHttpSessionPool(SimpleTestCase):
+    def setUp(self):
+        HttpSessionPool.close_all()
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), JsonRequestHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        HttpSessionPool.close_all()
+
+    def test_get_session_by_host(self):
+        session = HttpSessionPool.get_session("https://api.github.com/repos")
+
+        self.assertIs(HttpSessionPool.get_session("https://api.github.com/orgs"), session)
+        self.assertIsNot(HttpSessionPool.get_session("https://api.bitbucket.org/2.0"), session)
+
+    def test_base_api_reuses_connections(self):
+        api = BaseApi()
+        api.API_BASE_URL = self.base_url
+
+        for _ in range(3):
+            self.assertEqual(api.request("data").json(), {"data": []})
+
+        stats = HttpSessionPool.get_stats()[self.base_url]
+        self.assertEqual((stats["requests"], stats["connections"]), (3, 1))
+        self.assertAlmostEqual(stats["reuse_ratio"], 2 / 3)
@@ -1,10 +1,14 @@
 import logging
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
 
 from django.test import TestCase
+from django.utils import timezone
 from parameterized import parameterized
 
 from api.tests.mixins import WebhooksDataTestMixin
 from compass.integrations.integrations import GitHubIntegration, PullRequestData
+from mvp.models import DataProviderMemberProjectRecord, DataProviderRecord, Organization
 
 
 class TestGitHubIntegration(WebhooksDataTestMixin, TestCase):
@@ -59,3 +63,63 @@ class TestGitHubIntegration(WebhooksDataTestMixin, TestCase):
             ),
         )
         self.assertEqual(data.merge_commit_sha, pull_request["merge_commit_sha"])
+
+
+class TestGitHubIntegrationCommitStats(TestCase):
+    def setUp(self):
+        self.integration = GitHubIntegration()
+        self.integration.organization = Organization.objects.create(name="TestOrg")
+        self.integration.fields = self.integration.get_or_create_fields()
+        self.integration.api = MagicMock()
+        self.integration.api.compare_commits.return_value = [{"filename": "a.py"}, {"filename": "b.py"}]
+        self.project = self.integration.get_or_update_project(
+            self.integration.organization,
+            "repo",
+            "1",
+            {"name": "repo", "owner": {"login": "owner"}, "default_branch": "main"},
+        )
+        self.since = timezone.make_aware(datetime(2024, 1, 1))
+        self.until = self.since + timedelta(days=60)
+
+    def get_commit(self, sha, date, author_id=1):
+        return {
+            "sha": sha,
+            "author": {"id": author_id, "login": f"developer-{author_id}", "type": "User"},
+            "committer": None,
+            "commit": {"committer": {"date": date.strftime("%Y-%m-%dT%H:%M:%SZ")}},
+        }
+
+    def test_process_commit_stats_by_window(self):
+        # reverse chronological order, as returned by the API
+        commits = [
+            self.get_commit("d", self.since + timedelta(days=40, hours=3)),
+            self.get_commit("c", self.since + timedelta(days=1, hours=12), author_id=2),
+            self.get_commit("b", self.since + timedelta(days=1, hours=10)),
+            self.get_commit("a", self.since + timedelta(hours=5)),
+        ]
+        self.integration.api.list_commits.side_effect = lambda owner, repo, branch, since, until, **kwargs: [
+            commit for commit in commits if since <= self.integration.parse_commit(commit)[1] <= until
+        ]
+
+        with patch.object(self.integration, "get_since_until", return_value=(self.since, self.until)):
+            self.integration.process_commit_stats(self.project)
+
+        # two windows of 31 and 29 days, and a compare only for the day with more than one commit
+        self.assertEqual(self.integration.api.list_commits.call_count, 2)
+        self.integration.api.compare_commits.assert_called_once_with("owner", "repo", "b", "c")
+
+        records = DataProviderRecord.objects.filter(project=self.project)
+        commit_counts = records.filter(field=self.integration.fields[GitHubIntegration.FIELD_COMMIT_COUNT])
+        self.assertEqual(commit_counts.count(), 60)
+        self.assertEqual(
+            {record.date_time.day: record.value for record in commit_counts if record.value},
+            {1: 1, 2: 2, 10: 1},
+        )
+        file_change_counts = records.filter(field=self.integration.fields[GitHubIntegration.FIELD_FILE_CHANGE_COUNT])
+        self.assertEqual(file_change_counts.get(date_time__date="2024-01-02").value, 2)
+        self.assertEqual(DataProviderMemberProjectRecord.objects.filter(project=self.project).count(), 4)
+
+    def test_next_window_days(self):
+        self.assertEqual(self.integration.get_next_window_days(31, 0), GitHubIntegration.COMMIT_STATS_WINDOW_MAX_DAYS)
+        self.assertEqual(self.integration.get_next_window_days(10, 10000), 2)
+        self.assertEqual(self.integration.get_next_window_days(1, 100000), 1)
@@ -0,0 +1,63 @@
+from datetime import datetime
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase
+from django.utils import timezone
+from openpyxl import Workbook
+
+from compass.integrations.apis import IRadarXlsApi
+from compass.integrations.integrations import IRadarIntegration, IRadarIssueSeverity, IRadarIssueType
+from mvp.models import DataProviderRecord, Organization
+
+
+class TestIRadarIntegrationReport(TestCase):
+    def setUp(self):
+        self.integration = IRadarIntegration()
+        self.integration.fields = self.integration.get_or_create_fields()
+        self.integration.api_xls = IRadarXlsApi("token")
+        organization = Organization.objects.create(name="TestOrg")
+        self.project = self.integration.get_or_update_project(organization, "domain.com", "1", {})
+        self.scan_date = timezone.make_aware(datetime(2024, 1, 1))
+
+    def get_report(self):
+        workbook = Workbook()
+        cves = workbook.active
+        cves.title = IRadarIntegration.DATA_KEYS_MAP[IRadarIssueType.CVE]
+        cves.append(["Name", "Severity", "Description"])
+        cves.append(["CVE-1", "High", "..."])
+        cves.append(["CVE-2", "high", "..."])
+        cves.append(["CVE-3", None, "..."])
+        cves.append([None, None, None])
+        cves.append(["CVE-4", "Critical", "..."])
+
+        leaks = workbook.create_sheet(IRadarIntegration.DATA_KEYS_MAP[IRadarIssueType.GITLEAK])
+        leaks.append(["Repository"])
+        leaks.append(["repository"])
+
+        report = BytesIO()
+        workbook.save(report)
+        return report.getvalue()
+
+    def get_value(self, field):
+        return DataProviderRecord.objects.get(project=self.project, field=field).value
+
+    def test_process_report(self):
+        response = MagicMock(headers={"Content-Type": IRadarXlsApi.CONTENT_TYPE_XLS})
+        response.__enter__.return_value = response
+        content = self.get_report()
+        response.iter_content.return_value = [content[:1000], content[1000:]]
+
+        with patch.object(IRadarXlsApi, "request", return_value=response):
+            with self.integration.api_xls.download_report("domain.com", 1) as report:
+                self.integration.process_report(report, self.scan_date, self.project)
+
+        self.integration.flush_records()
+
+        fields = self.integration.fields
+        self.assertEqual(self.get_value(fields[IRadarIssueType.CVE][IRadarIssueSeverity.HIGH]), 2)
+        self.assertEqual(self.get_value(fields[IRadarIssueType.CVE][IRadarIssueSeverity.CRITICAL]), 1)
+        self.assertEqual(self.get_value(fields[IRadarIssueType.CVE][IRadarIssueSeverity.LOW]), 0)
+        self.assertEqual(self.get_value(fields[IRadarIssueType.CVE][IRadarIntegration.FIELD_KEY_TOTAL]), 4)
+        self.assertEqual(self.get_value(fields[IRadarIssueType.GITLEAK][IRadarIntegration.FIELD_KEY_TOTAL]), 1)
+        self.assertEqual(self.get_value(fields[IRadarIssueType.TAKEOVER][IRadarIntegration.FIELD_KEY_TOTAL]), 0)
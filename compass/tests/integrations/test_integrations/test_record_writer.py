@@ -0,0 +1,67 @@
+from datetime import datetime, timezone
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from compass.integrations.integrations import GitHubIntegration, RecordWriter
+from mvp.models import (
+    DataProviderMemberProjectRecord,
+    DataProviderRecord,
+    Organization,
+)
+
+
+class TestRecordWriter(TestCase):
+    def setUp(self):
+        self.integration = GitHubIntegration()
+        organization = Organization.objects.create(name="TestOrg")
+        self.project = self.integration.get_or_update_project(organization, "repo", "1", {})
+        self.member = self.integration.get_or_update_member(organization, "developer", "2", {})
+        self.field = self.integration.get_or_create_field(GitHubIntegration.FIELD_COMMIT_COUNT)
+        self.dates = [datetime(2024, 1, day, 23, 59, 59, tzinfo=timezone.utc) for day in range(1, 11)]
+
+    def add_records(self, writer, value):
+        for date in self.dates:
+            writer.add_record(self.project, self.field, value, date)
+            writer.add_member_record(self.member, self.project, self.field, value, date)
+
+    def test_flush_writes_in_bulk(self):
+        writer = RecordWriter()
+        self.add_records(writer, 1)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(len(writer), 20)
+            self.assertEqual(len(queries), 0)
+
+            writer.flush()
+
+        # a single insert per model
+        inserts = [query for query in queries if query["sql"].startswith("INSERT")]
+        self.assertEqual(len(inserts), 2)
+        self.assertEqual(len(writer), 0)
+        self.assertEqual(DataProviderRecord.objects.filter(project=self.project).count(), 10)
+        self.assertEqual(DataProviderMemberProjectRecord.objects.filter(project=self.project).count(), 10)
+
+    def test_flush_is_idempotent(self):
+        writer = RecordWriter()
+        self.add_records(writer, 1)
+        writer.flush()
+
+        self.add_records(writer, 1)
+        writer.add_record(self.project, self.field, 5, self.dates[0])
+        writer.flush()
+
+        records = DataProviderRecord.objects.filter(project=self.project)
+        self.assertEqual(records.count(), 10)
+        self.assertEqual(records.get(date_time=self.dates[0]).value, 5)
+        self.assertEqual(DataProviderMemberProjectRecord.objects.filter(project=self.project).count(), 10)
+        self.assertEqual(writer.num_created, 20)
+        self.assertEqual(writer.num_updated, 1)
+
+    def test_flush_when_batch_is_full(self):
+        writer = RecordWriter(batch_size=8)
+        self.add_records(writer, 1)
+
+        self.assertEqual(len(writer), 4)
+        self.assertEqual(DataProviderRecord.objects.filter(project=self.project).count(), 8)
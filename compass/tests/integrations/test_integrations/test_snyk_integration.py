@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from compass.integrations.apis import SnykV1Api
+from compass.integrations.integrations import SnykIntegration, SnykLicenseSeverity
+from mvp.models import License, LicenseCategoryChoices
+
+
+class TestSnykIntegrationLicenseCount(TestCase):
+    def setUp(self):
+        cache.clear()
+        License.objects.create(
+            slug="gpl-3.0", short_name="GPL-3.0", spdx="GPL-3.0-only", category=LicenseCategoryChoices.COPYLEFT
+        )
+        License.objects.create(slug="mit", short_name="MIT", spdx="MIT", category=LicenseCategoryChoices.PERMISSIVE)
+
+        self.integration = SnykIntegration()
+        self.integration.snyk_org_id = "org"
+        self.integration.api_v1 = MagicMock()
+        self.integration.api_v1.snapshot_issues.return_value = [
+            {"issueType": "license", "issueData": {"title": "GPL-3.0 license", "url": "https://snyk.io/gpl"}},
+            {"issueType": "license", "issueData": {"title": "MIT license", "url": "https://snyk.io/mit"}},
+            {"issueType": "license", "issueData": {"title": "Unknown license", "url": "https://snyk.io/unknown"}},
+        ]
+        self.since = timezone.make_aware(datetime(2024, 1, 1))
+
+    def get_snapshot(self, day, num_dependencies, num_license_issues):
+        return {
+            "id": f"snapshot-{day}",
+            "created": (self.since + timedelta(days=day, hours=12)).strftime(SnykV1Api.DATE_FORMAT),
+            "totalDependencies": num_dependencies,
+            "issueCounts": {"vuln": {"high": 1}, "license": {"medium": num_license_issues}},
+        }
+
+    @patch.object(SnykIntegration, "fetch_spdx_license_id", return_value=None)
+    def test_unchanged_snapshots_reuse_license_counts(self, mock_fetch_spdx_license_id):
+        snapshots = [
+            self.get_snapshot(4, num_dependencies=11, num_license_issues=3),
+            self.get_snapshot(3, num_dependencies=10, num_license_issues=3),
+            self.get_snapshot(2, num_dependencies=10, num_license_issues=3),
+            self.get_snapshot(1, num_dependencies=10, num_license_issues=3),
+        ]
+
+        counts = self.integration.get_project_counts_per_day(
+            "project", snapshots, self.since, self.since + timedelta(days=5)
+        )
+
+        self.assertEqual(len(counts), 4)
+        self.assertEqual(self.integration.api_v1.snapshot_issues.call_count, 2)
+        # the SPDX id of a license URL is fetched once
+        mock_fetch_spdx_license_id.assert_called_once_with("https://snyk.io/unknown")
+        for day_counts in counts.values():
+            self.assertEqual(
+                day_counts["counts"]["license"],
+                {
+                    SnykLicenseSeverity.LOW: 1,
+                    SnykLicenseSeverity.MEDIUM: 1,
+                    SnykLicenseSeverity.MEDIUM_HIGH: 0,
+                    SnykLicenseSeverity.HIGH: 1,
+                },
+            )
+
+    @patch.object(SnykIntegration, "fetch_spdx_license_id", return_value="MIT")
+    def test_spdx_license_id_is_cached_between_integrations(self, mock_fetch_spdx_license_id):
+        license_data = {"title": "Expat license", "url": "https://snyk.io/expat"}
+
+        self.assertEqual(self.integration.get_license_category(license_data), LicenseCategoryChoices.PERMISSIVE)
+        self.assertEqual(SnykIntegration().get_license_category(license_data), LicenseCategoryChoices.PERMISSIVE)
+
+        mock_fetch_spdx_license_id.assert_called_once()
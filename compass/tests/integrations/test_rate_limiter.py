@@ -0,0 +1,38 @@
+import time
+
+from django.test import SimpleTestCase, override_settings
+
+from compass.integrations.apis import RateLimiter
+from mvp.utils import run_concurrently
+
+
+class TestRateLimiter(SimpleTestCase):
+    @override_settings(API_MAX_REQUESTS_PER_SECOND={"TestApi": "50"})
+    def test_wait_spaces_out_requests_of_all_threads(self):
+        request_times = []
+
+        def request(_):
+            RateLimiter.wait("TestApi")
+            request_times.append(time.monotonic())
+
+        run_concurrently(request, range(10), max_workers=5)
+
+        request_times.sort()
+        self.assertEqual(len(request_times), 10)
+        # 9 intervals of 20 ms
+        self.assertGreaterEqual(request_times[-1] - request_times[0], 0.17)
+
+    def test_wait_without_limit(self):
+        start_time = time.monotonic()
+        for _ in range(100):
+            RateLimiter.wait("UnlimitedApi")
+
+        self.assertLess(time.monotonic() - start_time, 0.1)
+
+    def test_run_concurrently_raises_first_error(self):
+        def process(item):
+            if item == 3:
+                raise ValueError(item)
+
+        with self.assertRaises(ValueError):
+            run_concurrently(process, range(10), max_workers=3)
@@ -1,3 +1,5 @@
+from threading import Lock
+
 from langchain_core.rate_limiters import InMemoryRateLimiter
 
 from contextualization.conf.config import get_config
@@ -5,17 +7,30 @@ from contextualization.conf.rate_limit import ChatGemini, RateLimitedChatAnthrop
 
 DEFAULT_MAX_TOKENS = 2000
 
+# the LLM clients of the process share the rate limiter of their provider, so the pipelines of several
+# organizations running at the same time stay within the same requests budget
+_rate_limiters: dict[tuple[str, float], InMemoryRateLimiter] = {}
+_rate_limiters_lock = Lock()
+
+
+def get_rate_limiter(name: str, requests_per_second: float) -> InMemoryRateLimiter:
+    key = (name, requests_per_second)
+    with _rate_limiters_lock:
+        if key not in _rate_limiters:
+            _rate_limiters[key] = InMemoryRateLimiter(
+                requests_per_second=requests_per_second,
+                check_every_n_seconds=0.1,  # Frequency to check if a request can be made
+                max_bucket_size=10,  # Maximum burst size
+            )
+        return _rate_limiters[key]
+
 
 def get_llm(max_tokens: int = DEFAULT_MAX_TOKENS, big_text: bool = False):
     llm_config = get_config(big_text)
     model = llm_config.model
     temperature = llm_config.temperature
 
-    rate_limiter = InMemoryRateLimiter(
-        requests_per_second=llm_config.request_per_second,
-        check_every_n_seconds=0.1,  # Frequency to check if a request can be made
-        max_bucket_size=10,  # Maximum burst size
-    )
+    rate_limiter = get_rate_limiter(llm_config.name, llm_config.request_per_second)
     if llm_config.name == "claude":
         return RateLimitedChatAnthropic(
             model=model,
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import os
@@ -64,6 +65,26 @@ logger = logging.getLogger(__name__)
 token_limit = conf["llms"][llm_name]["token_limit"]
 batch_threshold = conf["llms"][llm_name]["batch_threshold"]
 
+# pages of Jira search results fetched at the same time once the total is known
+jira_max_concurrent_pages = 4
+jira_default_retry_after_seconds = 60
+
+
+class JiraRateLimitError(Exception):
+    def __init__(self, api_url: str, retry_after: int):
+        super().__init__(api_url)
+        self.retry_after = retry_after
+
+
+def wait_jira_retry(retry_state) -> float:
+    """
+    Waits for the Retry-After of a rate limited request, and exponentially for the request errors
+    """
+    error = retry_state.outcome.exception()
+    if isinstance(error, JiraRateLimitError):
+        return error.retry_after
+    return wait_exponential(multiplier=1, min=60, max=60 * 3)(retry_state)
+
 
 @instrumented
 async def git_topic_assign_to_git_data(
@@ -175,8 +196,8 @@ async def project_exists(
 
 @retry(
     stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=60, max=60 * 3),
-    retry=retry_if_exception_type(httpx.RequestError),
+    wait=wait_jira_retry,
+    retry=retry_if_exception_type((httpx.RequestError, JiraRateLimitError)),
     reraise=True,
 )
 async def _fetch_data_jira_api(
@@ -193,6 +214,13 @@ async def _fetch_data_jira_api(
     else:
         response = await client.get(api_url, auth=(user, confluence_token), headers=headers)
 
+    # https://developer.atlassian.com/cloud/jira/platform/rate-limiting/
+    if response.status_code == 429:
+        retry_after = response.headers.get("Retry-After", "")
+        retry_after = int(retry_after) if retry_after.isdigit() else jira_default_retry_after_seconds
+        logger.warning(f"JIRA API rate limit reached, retrying after {retry_after}s")
+        raise JiraRateLimitError(api_url, retry_after)
+
     try:
         response.raise_for_status()
     except httpx.HTTPStatusError:
@@ -226,7 +254,6 @@ async def get_jira_data_contextualization(
         as_of_date = datetime.strptime(start_date, "%Y-%m-%d").date()
 
         max_results = 100
-        start_at = 0
         total_issues = []
 
         fields_to_fetch = "key,summary,description,issues,status,issuetype,priority,assignee,created,updated,priority,components,labels,attachment,issuelinks"
@@ -252,26 +279,42 @@ async def get_jira_data_contextualization(
         project_list = ",".join([f'"{p}"' for p in project_names_that_exist])
         client = httpx.AsyncClient(timeout=30)
 
-        while True:
-            # Ensures proper quoting
-            jql_query = f"""project IN ({project_list})
-                AND (
-                    status CHANGED DURING ("{start_date}", "{end_date}")
-                    OR (status IN ("IN PROGRESS", "TO DO") AND updated >= "{start_date}" AND updated <= "{end_date}")
-                    OR (created >= "{start_date}" AND created <= "{end_date}")
-                )"""
+        # Ensures proper quoting
+        jql_query = f"""project IN ({project_list})
+            AND (
+                status CHANGED DURING ("{start_date}", "{end_date}")
+                OR (status IN ("IN PROGRESS", "TO DO") AND updated >= "{start_date}" AND updated <= "{end_date}")
+                OR (created >= "{start_date}" AND created <= "{end_date}")
+            )"""
 
+        semaphore = asyncio.Semaphore(jira_max_concurrent_pages)
+
+        async def fetch_page(start_at: int) -> dict | None:
             api_url = (
                 f"{jira_url}/rest/api/2/search?"
                 f"jql={quote(jql_query)}"
                 f"&fields={fields_to_fetch}"
                 f"&maxResults={max_results}&startAt={start_at}&expand=changelog"
             )
-            data = await _fetch_data_jira_api(client, api_url, jira_access_token, user, confluence_token)
-            if data is None:
-                return pd.DataFrame()
+            async with semaphore:
+                return await _fetch_data_jira_api(client, api_url, jira_access_token, user, confluence_token)
+
+        data = await fetch_page(0)
+        if data is None:
+            return pd.DataFrame()
+
+        # the first page has the total, the rest of pages are fetched at the same time.
+        # Jira may return less results than requested, so use its page size.
+        page_size = data["maxResults"] or max_results
+        pages = [data]
+        pages += await asyncio.gather(
+            *[fetch_page(start_at) for start_at in range(data["startAt"] + page_size, data["total"], page_size)]
+        )
+        if any(page is None for page in pages):
+            return pd.DataFrame()
 
-            for issue in data.get("issues", []):
+        for page in pages:
+            for issue in page.get("issues", []):
                 updated_date = dateutil_parser.parse(issue["fields"].get("updated", "")).date()
 
                 if updated_date >= as_of_date and issue["fields"].get("status", {}).get("name") not in [
@@ -281,11 +324,6 @@ async def get_jira_data_contextualization(
                 ]:
                     total_issues.append(issue)
 
-            if data["startAt"] + len(data["issues"]) >= data["total"]:
-                break
-
-            start_at += max_results  # Increment pagination
-
         logger.info(
             f"Total amount of issues fetched: {len(total_issues)}",
             extra={"issues_count": len(total_issues)},
@@ -26,6 +26,7 @@ from contextualization.pipelines.pipeline_D_jira_score_completeness.prompts.stag
 from contextualization.pipelines.pipeline_D_jira_score_completeness.schemas import (
     JiraTicketData,
     PipelineDResult,
+    PreviousTicketScore,
     QualitySummary,
     TicketCompletenessScoreResult,
     categorize_quality,
@@ -62,6 +63,34 @@ def dataframe_to_jira_tickets(df: pd.DataFrame) -> list[JiraTicketData]:
     return tickets
 
 
+def reuse_previous_scores(
+    jira_tickets: list[JiraTicketData], previous_scores: dict[str, PreviousTicketScore]
+) -> list[JiraTicketData]:
+    """
+    Assigns the previous score and category to the tickets whose scored fields didn't change.
+    Returns the rest of the tickets, which have to be scored and categorised.
+    """
+    tickets_to_score = []
+    for ticket in jira_tickets:
+        ticket.completeness_hash = ticket.get_completeness_hash()
+        previous_score = previous_scores.get(ticket.issue_key)
+        if not previous_score or previous_score.completeness_hash != ticket.completeness_hash:
+            tickets_to_score.append(ticket)
+            continue
+
+        ticket.jira_completeness_score = previous_score.jira_completeness_score
+        ticket.evaluation_jira_completeness_score = previous_score.evaluation_jira_completeness_score
+        ticket.explanation_jira_completeness_score = previous_score.explanation_jira_completeness_score
+        ticket.quality_category = categorize_quality(ticket.jira_completeness_score)
+        ticket.llm_category = previous_score.llm_category
+
+    logger.info(
+        "Reusing Jira completeness scores of unchanged tickets",
+        extra={"jira_ticket_count": len(jira_tickets), "reused_count": len(jira_tickets) - len(tickets_to_score)},
+    )
+    return tickets_to_score
+
+
 @instrumented
 async def assign_jira_completeness_score(jira_tickets: list[JiraTicketData]) -> list[JiraTicketData]:
     logger.info("Processing Jira completeness score", extra={"jira_ticket_count": len(jira_tickets)})
@@ -222,6 +251,7 @@ async def run_jira_completeness_score_pipeline(
     start_date: str | None = None,
     end_date: str | None = None,
     jira_project_names: list[str] | None = None,
+    previous_scores: dict[str, PreviousTicketScore] | None = None,
 ) -> PipelineDResult | None:
     logger.info(
         f"Running pipeline D with params: {jira_url=} {confluence_user=} confluence_token=<REDACTED> "
@@ -252,11 +282,13 @@ async def run_jira_completeness_score_pipeline(
         # Convert DataFrame to pydantic models
         jira_tickets = dataframe_to_jira_tickets(df)
 
-        scored_tickets = await assign_jira_completeness_score(jira_tickets)
-
-        staged_tickets = await assign_stages_from_ticket_statuses(scored_tickets)
+        # only the new and changed tickets are sent to the language model
+        tickets_to_score = reuse_previous_scores(jira_tickets, previous_scores or {})
+        if tickets_to_score:
+            await assign_jira_completeness_score(tickets_to_score)
+            await categorise_jira_tickets(tickets_to_score)
 
-        llm_categorised_tickets = await categorise_jira_tickets(staged_tickets)
+        llm_categorised_tickets = await assign_stages_from_ticket_statuses(jira_tickets)
 
         # keeping backward compatibility with anomaly insights pipeline
         jira_data_df = pd.DataFrame(
@@ -278,6 +310,7 @@ async def run_jira_completeness_score_pipeline(
                 project_name=ticket.project_name,
                 assignee=ticket.assignee,
                 quality_category=ticket.quality_category,
+                completeness_hash=ticket.completeness_hash,
             )
             ticket_completeness_scores.append(score_result)
 
@@ -1,3 +1,4 @@
+import hashlib
 import logging
 from datetime import datetime
 from enum import StrEnum
@@ -53,6 +54,19 @@ class TicketCompletenessScoreResult(BaseModel):
     project_name: str
     assignee: str | None = None
     quality_category: QualityCategory
+    completeness_hash: str | None = None
+
+
+class PreviousTicketScore(BaseModel):
+    """
+    Score and category of a ticket from a previous run, reused while its scored fields hash the same
+    """
+
+    completeness_hash: str
+    jira_completeness_score: int
+    evaluation_jira_completeness_score: str
+    explanation_jira_completeness_score: str
+    llm_category: TicketCategory
 
 
 class StageSummary(BaseModel):
@@ -136,6 +150,7 @@ class JiraTicketData(BaseModel):
     stage_category: StageCategory | None = None
     llm_category: TicketCategory | None = None
     quality_category: QualityCategory | None = None
+    completeness_hash: str | None = None
 
     # necessary for jira_anomaly_driven_insights pipeline
     parsed_changelog: list[dict] | None = None
@@ -174,6 +189,13 @@ class JiraTicketData(BaseModel):
 
         return formatted_ticket
 
+    def get_completeness_hash(self) -> str:
+        """
+        Hash of the inputs the completeness score and the category are generated from
+        """
+        inputs = [self.format_ticket_for_completeness_score(), self.description or ""]
+        return hashlib.sha256("\n".join(inputs).encode()).hexdigest()
+
 
 class PipelineDResult(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -0,0 +1,259 @@
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.core.cache.backends.filebased import FileBasedCache
+
+logger = logging.getLogger(__name__)
+
+
+class LRUFileBasedCache(FileBasedCache):
+    """
+    File based cache that evicts the least recently used entries instead of random ones.
+
+    It's shared by all the processes in the server (web, crons, commands), unlike a local memory cache.
+
+    Reads update the modification time of the entry file, which is used to sort entries when culling.
+    """
+
+    def get(self, key, default=None, version=None):
+        missing = object()
+        value = super().get(key, missing, version)
+        if value is missing:
+            return default
+
+        self._touch_file(self._key_to_file(key, version))
+        return value
+
+    def _cull(self):
+        filelist = self._list_cache_files()
+        num_entries = len(filelist)
+        if num_entries < self._max_entries:
+            return  # return early if no culling is required
+
+        if self._cull_frequency == 0:
+            return self.clear()  # Clear the cache when CULL_FREQUENCY = 0
+
+        # Delete the least recently used entries
+        filelist = sorted(filelist, key=self._get_file_mtime)
+        for fname in filelist[: int(num_entries / self._cull_frequency)]:
+            self._delete(fname)
+
+    def _touch_file(self, fname):
+        try:
+            os.utime(fname)
+        except FileNotFoundError:
+            # The file may have been removed by another process.
+            pass
+
+    def _get_file_mtime(self, fname):
+        try:
+            return os.path.getmtime(fname)
+        except FileNotFoundError:
+            return 0
+
+
+class TieredCache(BaseCache):
+    """
+    Two tier cache: a small in-process LRU cache in front of a shared cache.
+
+    Most reads are served from the process memory. Entries are kept there for LOCAL_TIMEOUT seconds at most,
+    so changes made by other processes are seen after that.
+
+    `get_or_set` calculates each missing value once: threads of the process wait for the one calculating it,
+    and other processes wait for it too, polling the shared cache until LOCK_TIMEOUT.
+
+    Options:
+        SHARED_CACHE: alias of the shared cache in settings.CACHES.
+        LOCAL_MAX_ENTRIES: max number of entries in the process memory.
+        LOCAL_TIMEOUT: max number of seconds an entry is kept in the process memory.
+        LOCK_TIMEOUT: max number of seconds to wait for another process calculating a value.
+        STATS_INTERVAL: number of reads between hit ratio logs, 0 to disable them.
+    """
+
+    LOCK_KEY_SUFFIX = ":lock"
+    LOCK_POLL_INTERVAL = 0.1
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self._shared_alias = options.get("SHARED_CACHE", "shared")
+        self._local_max_entries = int(options.get("LOCAL_MAX_ENTRIES", 1000))
+        self._local_timeout = int(options.get("LOCAL_TIMEOUT", 10))
+        self._lock_timeout = int(options.get("LOCK_TIMEOUT", 60))
+        self._stats_interval = int(options.get("STATS_INTERVAL", 10000))
+
+        self._local = OrderedDict()
+        self._local_lock = threading.Lock()
+        self._flights = {}
+        self._flights_lock = threading.Lock()
+        self._stats = {"local_hits": 0, "shared_hits": 0, "misses": 0}
+
+    @property
+    def shared(self):
+        return caches[self._shared_alias]
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self.shared.add(key, value, self._get_timeout(timeout), version)
+        if added:
+            self._set_local(key, value, timeout, version)
+        return added
+
+    def get(self, key, default=None, version=None):
+        value = self._get_local(key, version)
+        if value is not self._missing_key:
+            self._count("local_hits")
+            return value
+
+        value = self.shared.get(key, self._missing_key, version)
+        if value is self._missing_key:
+            self._count("misses")
+            return default
+
+        self._count("shared_hits")
+        self._set_local(key, value, DEFAULT_TIMEOUT, version)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.shared.set(key, value, self._get_timeout(timeout), version)
+        self._set_local(key, value, timeout, version)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.shared.touch(key, self._get_timeout(timeout), version)
+
+    def delete(self, key, version=None):
+        self._delete_local(key, version)
+        return self.shared.delete(key, version)
+
+    def has_key(self, key, version=None):
+        return self._get_local(key, version) is not self._missing_key or self.shared.has_key(key, version)
+
+    def clear(self):
+        with self._local_lock:
+            self._local.clear()
+        self.shared.clear()
+
+    def get_or_set(self, key, default, timeout=DEFAULT_TIMEOUT, version=None):
+        value = self.get(key, self._missing_key, version)
+        if value is not self._missing_key:
+            return value
+
+        with self._single_flight(self.make_and_validate_key(key, version)):
+            # another thread may have calculated it meanwhile
+            value = self.get(key, self._missing_key, version)
+            if value is not self._missing_key:
+                return value
+
+            return self._calculate(key, default, timeout, version)
+
+    def get_stats(self):
+        stats = dict(self._stats)
+        reads = sum(stats.values())
+        stats["reads"] = reads
+        stats["local_hit_ratio"] = stats["local_hits"] / reads if reads else 0
+        stats["hit_ratio"] = (stats["local_hits"] + stats["shared_hits"]) / reads if reads else 0
+        return stats
+
+    def _calculate(self, key, default, timeout, version):
+        lock_key = f"{key}{self.LOCK_KEY_SUFFIX}"
+        locked = self.shared.add(lock_key, os.getpid(), self._lock_timeout, version)
+        try:
+            if not locked:
+                value = self._wait_for_value(key, version)
+                if value is not self._missing_key:
+                    return value
+
+            if callable(default):
+                default = default()
+            self.add(key, default, timeout, version)
+            return default
+        finally:
+            if locked:
+                self.shared.delete(lock_key, version)
+
+    def _wait_for_value(self, key, version):
+        lock_key = f"{key}{self.LOCK_KEY_SUFFIX}"
+        until = time.monotonic() + self._lock_timeout
+        while time.monotonic() < until:
+            time.sleep(self.LOCK_POLL_INTERVAL)
+            value = self.shared.get(key, self._missing_key, version)
+            if value is not self._missing_key or not self.shared.has_key(lock_key, version):
+                return value
+
+        logger.warning(f'Timed out waiting for cache key "{key}" to be calculated by another process')
+        return self._missing_key
+
+    @contextmanager
+    def _single_flight(self, key):
+        with self._flights_lock:
+            lock, num_threads = self._flights.get(key, (None, 0))
+            lock = lock or threading.Lock()
+            self._flights[key] = (lock, num_threads + 1)
+
+        try:
+            with lock:
+                yield
+        finally:
+            with self._flights_lock:
+                lock, num_threads = self._flights[key]
+                if num_threads == 1:
+                    del self._flights[key]
+                else:
+                    self._flights[key] = (lock, num_threads - 1)
+
+    def _get_local(self, key, version):
+        key = self.make_and_validate_key(key, version)
+        with self._local_lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return self._missing_key
+
+            expires_at, pickled = entry
+            if expires_at <= time.monotonic():
+                del self._local[key]
+                return self._missing_key
+
+            self._local.move_to_end(key)
+
+        # values are stored pickled so that callers can't modify cached objects
+        return pickle.loads(pickled)
+
+    def _set_local(self, key, value, timeout, version):
+        timeout = self._get_timeout(timeout)
+        local_timeout = self._local_timeout if timeout is None else min(timeout, self._local_timeout)
+        if local_timeout <= 0:
+            self._delete_local(key, version)
+            return
+
+        key = self.make_and_validate_key(key, version)
+        pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._local_lock:
+            self._local[key] = (time.monotonic() + local_timeout, pickled)
+            self._local.move_to_end(key)
+            while len(self._local) > self._local_max_entries:
+                self._local.popitem(last=False)
+
+    def _delete_local(self, key, version=None):
+        key = self.make_and_validate_key(key, version)
+        with self._local_lock:
+            self._local.pop(key, None)
+
+    def _get_timeout(self, timeout):
+        return self.default_timeout if timeout is DEFAULT_TIMEOUT else timeout
+
+    def _count(self, name):
+        self._stats[name] += 1
+
+        reads = sum(self._stats.values())
+        if self._stats_interval and reads % self._stats_interval == 0:
+            stats = self.get_stats()
+            logger.info(
+                f"Cache hit ratio {stats['hit_ratio']:.1%} (local {stats['local_hit_ratio']:.1%}) "
+                f"in {reads} reads of process {os.getpid()}"
+            )
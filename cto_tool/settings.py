@@ -46,9 +46,20 @@ SITE_DOMAIN = env("SITE_DOMAIN")
 
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
-        "LOCATION": "django_cache",
-    }
+        "BACKEND": "cto_tool.cache.TieredCache",
+        "OPTIONS": {
+            "SHARED_CACHE": "shared",
+            "LOCAL_MAX_ENTRIES": env.int("CACHE_LOCAL_MAX_ENTRIES", default=1000),
+            "LOCAL_TIMEOUT": env.int("CACHE_LOCAL_TIMEOUT", default=10),
+        },
+    },
+    "shared": {
+        "BACKEND": "cto_tool.cache.LRUFileBasedCache",
+        "LOCATION": env("CACHE_DIRECTORY", default=os.path.join(BASE_DIR, "cache")),
+        "OPTIONS": {
+            "MAX_ENTRIES": env.int("CACHE_MAX_ENTRIES", default=10000),
+        },
+    },
 }
 
 INSTALLED_APPS = [
@@ -257,6 +268,8 @@ EMAIL_HOST_PASSWORD = env("EMAIL_HOST_PASSWORD", default="")
 DEFAULT_FROM_EMAIL = env("DEFAULT_FROM_EMAIL", default="")
 ANALYSIS_COMPLETE_EMAIL = env("ANALYSIS_COMPLETE_EMAIL", default="")
 SUPPORT_EMAIL = env("SUPPORT_EMAIL")
+# Emails sent at once through the same connection
+EMAIL_BATCH_SIZE = env.int("EMAIL_BATCH_SIZE", default=100)
 
 # Custom settings
 
@@ -305,6 +318,10 @@ OTEL_EXPORTER_OTLP_ENDPOINT = env("OTEL_EXPORTER_OTLP_ENDPOINT", default="")
 
 TESTING = len(sys.argv) > 1 and sys.argv[1] == "test"
 
+if TESTING:
+    # don't share cached data between test runs
+    CACHES["shared"] = {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+
 if TESTING and not env.bool("ENABLE_TEST_LOGGING", default=False):
     logging.disable(logging.WARN)
 
@@ -506,6 +523,27 @@ JIRA_OAUTH_REDIRECT_URL = env(
 )
 
 
+# Connection pools of the integration API clients, see HttpSessionPool
+HTTP_POOL_CONNECTIONS = env.int("HTTP_POOL_CONNECTIONS", default=4)
+HTTP_POOL_MAXSIZE = env.int("HTTP_POOL_MAXSIZE", default=10)
+HTTP_MAX_RETRIES = env.int("HTTP_MAX_RETRIES", default=3)
+# Pages of paginated endpoints fetched at the same time when the number of pages is known
+API_MAX_CONCURRENT_PAGES = env.int("API_MAX_CONCURRENT_PAGES", default=4)
+# Records fetched by the integrations are written in batches of this size, see RecordWriter
+INTEGRATION_RECORDS_BATCH_SIZE = env.int("INTEGRATION_RECORDS_BATCH_SIZE", default=1000)
+# Requests per second by API class name, e.g. "GitHubApi=10,SnykV1Api=2", see RateLimiter
+API_MAX_REQUESTS_PER_SECOND = env.dict("API_MAX_REQUESTS_PER_SECOND", default={})
+# fetch_data: connections fetched at the same time, in total and by provider
+FETCH_DATA_MAX_WORKERS = env.int("FETCH_DATA_MAX_WORKERS", default=1)
+FETCH_DATA_MAX_WORKERS_PER_PROVIDER = env.int("FETCH_DATA_MAX_WORKERS_PER_PROVIDER", default=2)
+# Projects (repositories) of a connection fetched at the same time
+FETCH_DATA_MAX_CONCURRENT_PROJECTS = env.int("FETCH_DATA_MAX_CONCURRENT_PROJECTS", default=1)
+# send_daily_message_email: organizations whose messages are rendered at the same time
+DAILY_MESSAGE_EMAIL_MAX_WORKERS = env.int("DAILY_MESSAGE_EMAIL_MAX_WORKERS", default=4)
+# experiment_contextualization_script: organizations contextualized at the same time
+CONTEXTUALIZATION_MAX_WORKERS = env.int("CONTEXTUALIZATION_MAX_WORKERS", default=1)
+
+
 # Slack webhook URL
 SLACK_WEBHOOK_ORGANIZATIONS = env.list("SLACK_WEBHOOK_ORGANIZATIONS", default=[])
 SLACK_WEBHOOK_URL = env("SLACK_WEBHOOK_URL", default="")
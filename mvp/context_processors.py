@@ -1,11 +1,16 @@
+from datetime import datetime, timezone
+
 from django.conf import settings
 
 from mvp.models import SystemMessage
 
 
 def active_system_messages(request):
-    # Because we use SQL for cache, the number of queries will be the same, so skip caching
-    messages = SystemMessage.objects.active()
+    # cached messages are filtered again because they may start or expire meanwhile
+    now = datetime.now(timezone.utc)
+    messages = [
+        message for message in SystemMessage.get_cached_not_expired() if message.starts_at <= now <= message.expires_at
+    ]
     return {"active_system_messages": messages}
 
 
@@ -0,0 +1,92 @@
+import logging
+import random
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from mvp.services import AICompositionService
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Benchmarks the AI composition charts calculation with random data, without touching the database."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--repositories",
+            type=int,
+            default=300,
+            help="Number of repositories.",
+        )
+
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=365,
+            help="Number of days of the date range.",
+        )
+
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=5,
+            help="Number of times the calculation is repeated.",
+        )
+
+    def handle(self, *args, **options):
+        service = AICompositionService(organization=None)
+
+        until = timezone.now().date()
+        since = until - timedelta(days=options["days"])
+        dates, since_data, until_data, aggregate = service.get_dates(since, until, add_previous_date=True)
+        commits = self.get_random_commits(options["repositories"], since_data, until_data)
+
+        timings = []
+        for _ in range(options["iterations"]):
+            start_time = time.perf_counter()
+
+            by_repository = service.get_commits_by_repository(commits, dates, aggregate)
+            by_date = service.get_lines_by_date(by_repository)
+            service.build_charts(by_date, dates, "benchmark", daily_charts=True)
+            service.calculate_daily_num_lines_by_repository(
+                {repository_id: lines[1:] for repository_id, lines in by_repository.items()}, dates[1:]
+            )
+
+            timings.append(time.perf_counter() - start_time)
+
+        logger.info(
+            f"{options['repositories']} repositories, {options['days']} days ({len(commits)} rows, "
+            f"{len(dates)} dates): best {min(timings) * 1000:.0f} ms, "
+            f"average {sum(timings) / len(timings) * 1000:.0f} ms"
+        )
+
+    def get_random_commits(self, num_repositories, since, until):
+        """
+        One row per repository and day, like the daily composition rollup, sorted by date.
+        """
+        commits = []
+        for repository_id in range(1, num_repositories + 1):
+            num_lines = random.randint(1000, 100000)
+            ai_num_lines = 0
+            blended_num_lines = 0
+
+            day = since
+            while day < until:
+                num_lines += random.randint(0, 500)
+                ai_num_lines = min(num_lines, ai_num_lines + random.randint(0, 100))
+                blended_num_lines = min(ai_num_lines, blended_num_lines + random.randint(0, 50))
+                commits.append(
+                    {
+                        "repository_id": repository_id,
+                        "date": day,
+                        "code_num_lines": num_lines,
+                        "code_ai_num_lines": ai_num_lines,
+                        "code_ai_blended_num_lines": blended_num_lines,
+                    }
+                )
+                day += timedelta(days=1)
+
+        return sorted(commits, key=lambda commit: commit["date"])
@@ -0,0 +1,66 @@
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from django.core.management.base import BaseCommand
+
+from compass.integrations.apis import HttpSessionPool
+
+logger = logging.getLogger(__name__)
+
+
+class JsonRequestHandler(BaseHTTPRequestHandler):
+    # keep-alive needs HTTP/1.1
+    protocol_version = "HTTP/1.1"
+    # headers and body are sent separately, don't wait for the ACK of the headers
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        body = b'{"data": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Command(BaseCommand):
+    help = "Benchmarks API requests with and without pooled sessions against a local HTTP server."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=1000,
+            help="Number of requests.",
+        )
+
+    def handle(self, *args, **options):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), JsonRequestHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/data"
+
+        try:
+            without_pool = self.time_requests(lambda: requests.get(url), options["requests"])
+            with_pool = self.time_requests(lambda: HttpSessionPool.get_session(url).get(url), options["requests"])
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        logger.info(
+            f"{options['requests']} requests: {without_pool * 1000:.0f} ms without pooled sessions, "
+            f"{with_pool * 1000:.0f} ms with pooled sessions"
+        )
+        HttpSessionPool.log_stats()
+
+    def time_requests(self, request, num_requests):
+        start_time = time.perf_counter()
+        for _ in range(num_requests):
+            request().raise_for_status()
+
+        return time.perf_counter() - start_time
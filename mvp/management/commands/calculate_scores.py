@@ -7,6 +7,7 @@ from sentry_sdk.crons import monitor
 from compass.codebasereports.services import SemaScoreService
 from mvp.mixins import InstrumentedCommandMixin, SingleInstanceCommandMixin
 from mvp.models import Organization
+from mvp.services import OrganizationCacheService
 from mvp.utils import traceback_on_debug
 
 logger = logging.getLogger(__name__)
@@ -68,6 +69,8 @@ class Command(
             logger.info(f'Successfully deleted scores for "{organization}"')
 
         success = score_service.calculate_daily_scores()
+        OrganizationCacheService.bump_data_version(organization)
+        score_service.populate_widgets()
 
         if success:
             logger.info(f'Successfully calculated scores for "{organization}"')
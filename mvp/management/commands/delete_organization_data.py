@@ -4,7 +4,7 @@ import os.path
 from django.core.management import CommandError
 from django.core.management.base import BaseCommand
 
-from compass.contextualization.models import DailyMessage
+from compass.contextualization.models import ContextualizationOutput, DailyMessage
 from compass.dashboard.models import GitDiffRepositoryGroupInsight
 from compass.integrations.integrations import get_git_provider_integration
 from mvp.models import (
@@ -159,6 +159,7 @@ class Command(BaseCommand):
         self.delete_object(DataProviderProject, organization=organization)
         self.delete_object(ScoreRecord, organization=organization)
         self.delete_object(DailyMessage, organization=organization)
+        self.delete_object(ContextualizationOutput, organization=organization)
         self.delete_object_loop(Repository, organization=organization)
         self.delete_object(RepositoryGroup, organization=organization)
         self.delete_object(Rule, organization=organization)
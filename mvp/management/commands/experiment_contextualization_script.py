@@ -1,6 +1,7 @@
 import logging
 import os
 
+from django.conf import settings
 from django.core.management.base import BaseCommand
 from opentelemetry import trace
 from sentry_sdk.crons import monitor
@@ -15,8 +16,14 @@ from compass.contextualization.tasks.import_ticket_completeness_task import Impo
 from mvp.mixins import InstrumentedCommandMixin
 from mvp.models import Organization
 from mvp.opentelemetry_utils import start_span_in_linked_trace
-from mvp.services import ContextualizationDayInterval, ContextualizationResults, ContextualizationService
+from mvp.services import (
+    ContextualizationDayInterval,
+    ContextualizationResults,
+    ContextualizationService,
+    OrganizationCacheService,
+)
 from mvp.tasks import ImportContextualizationDataTask
+from mvp.utils import run_concurrently
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
@@ -76,16 +83,23 @@ class Command(InstrumentedCommandMixin, BaseCommand):
             help="Do not execute the scripts, only print the output.",
         )
 
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=settings.CONTEXTUALIZATION_MAX_WORKERS,
+            help="Number of organizations processed at the same time.",
+        )
+
     @monitor(monitor_slug="experiment_contextualization_script")
     def handle(self, *args, **options):
         day_interval_value = options["day_interval"]
-        day_interval = ContextualizationDayInterval(day_interval_value)
+        self.day_interval = ContextualizationDayInterval(day_interval_value)
         organization_ids = options.get("orgids", None)
-        pipelines = options.get("pipelines")
+        pipelines = self.pipelines = options.get("pipelines")
         skip_orgids = options.get("skip_orgids", None)
-        dry_run = options.get("dry_run", False)
-        by_group = options.get("by_group", False)
-        import_only = options.get("import_only", False)
+        self.dry_run = options.get("dry_run", False)
+        self.by_group = options.get("by_group", False)
+        self.import_only = options.get("import_only", False)
 
         invalid_pipelines = set(pipelines) - set(self.service.ALL_PIPELINES)
         if invalid_pipelines:
@@ -100,27 +114,42 @@ class Command(InstrumentedCommandMixin, BaseCommand):
             organizations = sorted(organizations, key=lambda org: org.id in priority_organization_ids, reverse=True)
 
         logger.info("Running contextualization pipelines")
-        for index, organization in enumerate(organizations):
+        # the organizations share the LLM rate limiters, so more workers don't exceed the requests budget
+        run_concurrently(self.process_organization, organizations, options["workers"])
+
+    def process_organization(self, organization: Organization):
+        with self.service.organization_lock(organization) as acquired:
+            if not acquired:
+                logger.warning(
+                    "Organization is already being processed by another run, skipping it",
+                    extra={"organization": organization},
+                )
+                return
+
             results = self.service.process_organization(
                 organization,
-                day_interval=day_interval,
-                pipelines=pipelines,
-                by_group=by_group,
-                import_only=import_only,
-                dry_run=dry_run,
+                day_interval=self.day_interval,
+                pipelines=self.pipelines,
+                by_group=self.by_group,
+                import_only=self.import_only,
+                dry_run=self.dry_run,
             )
 
-            if dry_run:
-                continue
+            if self.dry_run:
+                return
 
             if results is None:
                 logger.warning(
                     f"No data was generated for organization",
                     extra={"organization": organization},
                 )
-                continue
+                return
 
-            self.import_results(organization, day_interval, pipelines, results)
+            imported = self.import_results(organization, self.day_interval, self.pipelines, results)
+            if imported and not self.import_only:
+                # the next run starts over instead of resuming this one
+                _, end_date = self.service.get_start_and_end_date(self.day_interval)
+                self.service.get_checkpoints(organization, self.day_interval, end_date, self.by_group).clear()
 
     @start_span_in_linked_trace(tracer, "Importing contextualization data from saved JSONs to database")
     def import_results(
@@ -129,17 +158,21 @@ class Command(InstrumentedCommandMixin, BaseCommand):
         day_interval: ContextualizationDayInterval,
         pipelines: list[str],
         results: ContextualizationResults,
-    ):
+    ) -> bool:
+        """
+        Returns whether all the results were imported
+        """
+        imported = True
         if day_interval == ContextualizationService.DEFAULT_DAY_INTERVAL:
             if self.service.PIPELINE_A in pipelines:
                 try:
-                    imported = ImportContextualizationDataTask().run(organization)
-                    if not imported:
+                    if not ImportContextualizationDataTask().run(organization):
                         logger.warning(
                             "No data was imported for pipeline A",
                             extra={"organization": organization, "day_interval": day_interval.value},
                         )
                 except Exception:
+                    imported = False
                     logger.exception(
                         "Error on importing pipeline A",
                         extra={"organization": organization, "day_interval": day_interval.value},
@@ -151,6 +184,7 @@ class Command(InstrumentedCommandMixin, BaseCommand):
                         organization, day_interval, results.pipeline_b_and_c_result
                     )
                 except Exception:
+                    imported = False
                     logger.exception(
                         "Error importing pipeline bc",
                         extra={"organization": organization},
@@ -159,6 +193,7 @@ class Command(InstrumentedCommandMixin, BaseCommand):
             try:
                 ImportDailyMessageTask().import_results(organization)
             except Exception:
+                imported = False
                 logger.exception(
                     "Error saving daily message data to db",
                     extra={"organization": organization},
@@ -181,12 +216,16 @@ class Command(InstrumentedCommandMixin, BaseCommand):
                         results.pipeline_jira_anomaly_insights_result,
                     )
             except Exception:
+                imported = False
                 logger.exception(
                     "Error saving ticket completeness data to db",
                     extra={"organization": organization},
                 )
 
+        OrganizationCacheService.bump_data_version(organization)
+
         logger.info(
             f'Successfully generated data for "{organization}"',
             extra={"organization": organization},
         )
+        return imported
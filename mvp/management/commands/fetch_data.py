@@ -1,13 +1,20 @@
 import logging
+import threading
+import time
+from collections import defaultdict
+from itertools import chain, zip_longest
 
+from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
 from sentry_sdk import capture_exception, push_scope
 from sentry_sdk.crons import monitor
 
+from compass.integrations.apis import HttpSessionPool
 from compass.integrations.integrations import IntegrationFactory
 from mvp.mixins import InstrumentedCommandMixin, SingleInstanceCommandMixin
 from mvp.models import DataProviderConnection, Organization
-from mvp.utils import traceback_on_debug
+from mvp.services import OrganizationCacheService
+from mvp.utils import run_concurrently, traceback_on_debug
 
 logger = logging.getLogger(__name__)
 
@@ -21,44 +28,103 @@ class Command(
 
     @monitor(monitor_slug="fetch_data")
     def add_arguments(self, parser):
-        parser.add_argument("provider", type=str, help="Name of the provider to fetch data from.")
+        parser.add_argument("provider", type=str, nargs="+", help="Name of the providers to fetch data from.")
 
         parser.add_argument(
             "--orgid",
             type=int,
             help="Narrow execution just to given organization ID.",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=settings.FETCH_DATA_MAX_WORKERS,
+            help="Number of connections fetched at the same time.",
+        )
+        parser.add_argument(
+            "--workers-per-provider",
+            type=int,
+            default=settings.FETCH_DATA_MAX_WORKERS_PER_PROVIDER,
+            help="Number of connections of the same provider fetched at the same time.",
+        )
 
     def handle(self, *args, **options):
-        provider_name = options["provider"]
-
-        try:
-            integration = IntegrationFactory().get_integration(provider_name)
-        except ValueError:
-            raise CommandError(f'Provider "{provider_name}" does not exist. Check casing and spelling.')
+        provider_names = options["provider"]
 
         organization_id = options.get("orgid", 0)
+        organization = None
         if organization_id:
             try:
                 organization = Organization.objects.get(id=organization_id)
             except Organization.DoesNotExist:
                 raise CommandError(f'Organization with ID "{organization_id}" does not exist.')
 
+        connections_by_provider = {
+            provider_name: self.get_connections(provider_name, organization) for provider_name in provider_names
+        }
+
+        for provider_name, provider_connections in connections_by_provider.items():
+            if not provider_connections:
+                message = f'There are no "{provider_name}" connections'
+                if organization:
+                    message += f' for "{organization}"'
+
+                if len(provider_names) == 1:
+                    raise CommandError(message)
+                logger.warning(message)
+
+        # Round robin between providers, so that workers don't wait for the same provider
+        connections = [
+            connection
+            for connection in chain.from_iterable(zip_longest(*connections_by_provider.values()))
+            if connection
+        ]
+
+        self.provider_semaphores = defaultdict(
+            lambda: threading.BoundedSemaphore(max(options["workers_per_provider"], 1))
+        )
+        self.provider_semaphores_lock = threading.Lock()
+        self.report = defaultdict(lambda: {"connections": 0, "errors": 0, "seconds": 0.0, "records": 0})
+        self.report_lock = threading.Lock()
+
+        start_time = time.perf_counter()
+        run_concurrently(self.process_provider_connection, connections, options["workers"])
+
+        self.log_report(time.perf_counter() - start_time)
+        HttpSessionPool.log_stats()
+
+    def get_connections(self, provider_name, organization):
+        try:
+            integration = IntegrationFactory().get_integration(provider_name)
+        except ValueError:
+            raise CommandError(f'Provider "{provider_name}" does not exist. Check casing and spelling.')
+
         qs = DataProviderConnection.objects.filter(provider=integration.provider, data__isnull=False)
 
-        if organization_id:
+        if organization:
             qs = qs.filter(organization=organization)
 
-        connections = qs.all()
+        return list(qs.select_related("organization", "provider"))
+
+    def process_provider_connection(self, connection):
+        provider_name = connection.provider.name
+        with self.provider_semaphores_lock:
+            semaphore = self.provider_semaphores[provider_name]
 
-        if not connections:
-            message = f'There are no "{provider_name}" connections'
-            if organization_id:
-                message += f' for "{organization}"'
-            raise CommandError(message)
+        with semaphore:
+            # integrations keep the state of the connection being fetched, so each connection has its own
+            integration = IntegrationFactory().get_integration(provider_name)
+
+            start_time = time.perf_counter()
+            success = self.process_connection(connection, integration)
+            seconds = time.perf_counter() - start_time
 
-        for connection in connections:
-            self.process_connection(connection, integration)
+        with self.report_lock:
+            report = self.report[provider_name]
+            report["connections"] += 1
+            report["errors"] += 0 if success else 1
+            report["seconds"] += seconds
+            report["records"] += integration.get_num_records_written()
 
     def process_connection(self, connection, integration):
         if not connection.is_connected():
@@ -78,6 +144,8 @@ class Command(
 
         try:
             integration.fetch_data(connection)
+            # the cached widgets of the organization are computed again with the new data
+            OrganizationCacheService.bump_data_version(organization)
 
             logger.info(f'Successfully fetched data for "{organization}" from "{provider.name}"')
         except Exception as error:
@@ -89,3 +157,17 @@ class Command(
                 capture_exception(error)
 
             logger.warning(f'Error fetching data for "{organization}" from "{provider.name}"')
+            return False
+
+        return True
+
+    def log_report(self, total_seconds):
+        for provider_name, report in self.report.items():
+            records_per_second = report["records"] / report["seconds"] if report["seconds"] else 0
+            logger.info(
+                f'"{provider_name}": {report["connections"]} connections ({report["errors"]} not fetched) '
+                f"in {report['seconds']:.1f} s, {report['records']} records written ({records_per_second:.1f}/s)"
+            )
+
+        num_connections = sum(report["connections"] for report in self.report.values())
+        logger.info(f"Fetched {num_connections} connections in {total_seconds:.1f} s")
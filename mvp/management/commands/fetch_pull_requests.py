@@ -1,11 +1,10 @@
 import logging
-import time
 from datetime import timedelta
 
 import requests
 from django.core.management.base import BaseCommand
 from django.utils import timezone
-from sentry_sdk import capture_exception, push_scope
+from sentry_sdk import capture_exception, capture_message, push_scope
 from sentry_sdk.crons import monitor
 
 from api.tasks import ProcessPullRequestTask
@@ -31,8 +30,15 @@ logger = logging.getLogger(__name__)
 class Command(SingleInstanceCommandMixin, InstrumentedCommandMixin, BaseCommand):
     help = "Fetch pull requests from git providers that were not received through webhooks, and process them."
 
-    API_RATE_LIMIT_DELAY_SECONDS = 1
     PR_THRESHOLD_MINUTES = 10
+    # the pull requests updated shortly before the last one fetched are fetched again,
+    # in case the provider returns updates out of order
+    PR_WATERMARK_OVERLAP = timedelta(hours=1)
+    # repositories without access are skipped for this long, doubled on each new denial up to the maximum
+    NO_ACCESS_BACKOFF = timedelta(hours=6)
+    NO_ACCESS_MAX_BACKOFF = timedelta(days=7)
+    # the pull requests that fail hold the watermark back until they were updated this long ago, then they're skipped
+    FAILED_PR_RETRY_PERIOD = timedelta(days=1)
 
     def add_arguments(self, parser):
         super().add_arguments(parser)
@@ -96,16 +102,21 @@ class Command(SingleInstanceCommandMixin, InstrumentedCommandMixin, BaseCommand)
 
         repositories = integration.get_connected_repositories_with_integration(connection)
 
-        num_processed = 0
-        for repository_data, integration in repositories:
-            num_processed += self.process_repository(organization, integration, repository_data)
+        # the requests of the repositories processed at the same time are spaced out by the API rate limiter
+        num_processed = []
+        integration.process_projects(
+            lambda repository: num_processed.append(
+                self.process_repository(organization, repository[1], repository[0])
+            ),
+            repositories,
+        )
 
         integration.get_missing_pull_requests(
             repository_data=[repo[0] for repo in repositories],
             organization=organization,
         )
 
-        return num_processed
+        return sum(num_processed)
 
     def process_repository(
         self,
@@ -118,61 +129,186 @@ class Command(SingleInstanceCommandMixin, InstrumentedCommandMixin, BaseCommand)
             logger.warning(f"Repository '{repository_data.owner}/{repository_data.name}' not found in database")
             return 0
 
+        now = timezone.now()
+        if repository.pull_requests_no_access_until and repository.pull_requests_no_access_until > now:
+            logger.info(
+                f"Skipping repository '{repository.full_name()}' - no access until "
+                f"{repository.pull_requests_no_access_until}"
+            )
+            return 0
+
         logger.info(f"Fetching PRs for repository '{repository.full_name()}'...")
 
-        # TODO: save last date of processed pull request after polling in the database
-        # to avoid processing PRs multiple times.
-        # This is tricky because we have to make sure we didn't miss any PRs in the past.
-        since = organization.created_at
-        until = timezone.now() - timedelta(minutes=self.PR_THRESHOLD_MINUTES)
+        # the pull requests updated since the last poll, the first poll fetches them since the organization was created
+        if repository.pull_requests_fetched_until:
+            since = repository.pull_requests_fetched_until - self.PR_WATERMARK_OVERLAP
+        else:
+            since = organization.created_at
+        until = now - timedelta(minutes=self.PR_THRESHOLD_MINUTES)
 
-        try:
-            time.sleep(self.API_RATE_LIMIT_DELAY_SECONDS)
-            pull_requests = integration.get_repository_pull_requests(
-                repository_data, since=since, until=until, state="all"
+        pages = integration.get_repository_pull_request_pages(repository_data, since=since, until=until, state="all")
+        num_processed = 0
+        fetched_until = repository.pull_requests_fetched_until
+        failed_at = None
+        while True:
+            try:
+                pull_requests = next(pages, None)
+            except Exception as error:
+                self.handle_fetch_error(integration, repository, repository_data, error)
+                return num_processed
+
+            if pull_requests is None:
+                break
+
+            page_num_processed, page_fetched_until, page_failed_at = self.process_pull_requests(
+                integration, repository, repository_data, pull_requests, since, until
             )
-        except Exception as error:
-            # There's no access to the repository
-            if isinstance(error, requests.exceptions.HTTPError) and error.response.status_code == 403:
-                logger.warning(f"Skipping repository '{repository.full_name()}' - no access")
-                # TODO: mark repo as "inactive" in the database to avoid fetching it again
-                return 0
+            num_processed += page_num_processed
+            if page_fetched_until and (not fetched_until or page_fetched_until > fetched_until):
+                fetched_until = page_fetched_until
+            if page_failed_at and (not failed_at or page_failed_at < failed_at):
+                failed_at = page_failed_at
+
+        if not num_processed:
+            logger.info(f"No new PRs found for repository '{repository.full_name()}'")
+
+        # the pull requests that failed are fetched again by the next poll
+        if failed_at and (not fetched_until or fetched_until >= failed_at):
+            fetched_until = failed_at - timedelta(seconds=1)
+
+        # the watermark only moves once all the pages were processed
+        repository.pull_requests_fetched_until = fetched_until
+        repository.pull_requests_no_access_until = None
+        repository.pull_requests_no_access_count = 0
+        repository.save(
+            update_fields=[
+                "pull_requests_fetched_until",
+                "pull_requests_no_access_until",
+                "pull_requests_no_access_count",
+            ]
+        )
 
-            with push_scope() as scope:
-                scope.set_extra("provider", integration.provider.name)
-                scope.set_extra("repository", repository.full_name())
-                scope.set_extra("organization", repository.organization.name)
-                scope.set_extra("repository_data", repository_data)
+        return num_processed
 
-                logger.exception("Failed to fetch Pull Requests")
-                traceback_on_debug()
-                capture_exception(error)
-            return 0
+    def process_pull_requests(
+        self,
+        integration: GitBaseIntegration,
+        repository: Repository,
+        repository_data: GitRepositoryData,
+        pull_requests: list[dict],
+        since,
+        until,
+    ):
+        """
+        Processes the pull requests of a page updated between since and until, if the provider tells when.
+        Returns the number of pull requests processed, the last update of the pull requests stored or skipped
+        and the first update of the pull requests that failed.
+        """
+        page_pull_requests = []
+        for pull_request_data in pull_requests:
+            updated_at = integration.get_pull_request_updated_at(pull_request_data)
+            if updated_at and not since <= updated_at <= until:
+                continue
 
-        if not pull_requests:
-            logger.info(f"No PRs found for repository '{repository.full_name()}'")
-            return 0
+            parsed = self.parse_pull_request(integration, repository, repository_data, pull_request_data)
+            page_pull_requests.append((updated_at, parsed))
+
+        # one query for the pull requests of the page that already exist
+        existing_pr_numbers = set(
+            RepositoryPullRequest.objects.filter(
+                repository=repository,
+                pr_number__in=[int(parsed[0].pr_number) for _, parsed in page_pull_requests if parsed],
+            ).values_list("pr_number", flat=True)
+        )
 
         num_processed = 0
-        for pull_request_data in pull_requests:
-            processed = self.process_pull_request(integration, repository, repository_data, pull_request_data)
-            if processed:
-                num_processed += 1
+        fetched_until, failed_at = None, None
+        for updated_at, parsed in page_pull_requests:
+            if not parsed:
+                stored = False
+            elif int(parsed[0].pr_number) in existing_pr_numbers:
+                logger.info(
+                    f"Skipping PR#{parsed[0].pr_number} for repository '{repository.full_name()}' -  already exists"
+                )
+                stored = True
+            else:
+                data, is_open = parsed
+                processed = self.process_pull_request(integration, repository, data, is_open)
+                num_processed += int(processed)
+                # closed pull requests are stored without being processed
+                stored = processed or not is_open
+
+            if not updated_at:
+                continue
+            if not stored:
+                if updated_at >= until - self.FAILED_PR_RETRY_PERIOD:
+                    failed_at = min(failed_at, updated_at) if failed_at else updated_at
+                    continue
+                self.skip_failed_pull_request(repository, parsed, updated_at)
+            fetched_until = max(fetched_until, updated_at) if fetched_until else updated_at
+
+        return num_processed, fetched_until, failed_at
+
+    def skip_failed_pull_request(self, repository: Repository, parsed, updated_at):
+        pr_number = parsed[0].pr_number if parsed else None
+        logger.warning(f"Skipping PR#{pr_number} for repository '{repository.full_name()}' - failed since {updated_at}")
+        with push_scope() as scope:
+            scope.set_extra("repository", repository.full_name())
+            scope.set_extra("organization", repository.organization.name)
+            scope.set_extra("pr_number", pr_number)
+            scope.set_extra("updated_at", updated_at)
+            capture_message("Skipping Pull Request that keeps failing")
+
+    def handle_fetch_error(
+        self,
+        integration: GitBaseIntegration,
+        repository: Repository,
+        repository_data: GitRepositoryData,
+        error: Exception,
+    ):
+        # There's no access to the repository
+        if isinstance(error, requests.exceptions.HTTPError) and error.response.status_code == 403:
+            self.mark_no_access(repository)
+            logger.warning(
+                f"Skipping repository '{repository.full_name()}' - no access until "
+                f"{repository.pull_requests_no_access_until}"
+            )
+            return
 
-        return num_processed
+        with push_scope() as scope:
+            scope.set_extra("provider", integration.provider.name)
+            scope.set_extra("repository", repository.full_name())
+            scope.set_extra("organization", repository.organization.name)
+            scope.set_extra("repository_data", repository_data)
+
+            logger.exception("Failed to fetch Pull Requests")
+            traceback_on_debug()
+            capture_exception(error)
+
+    def mark_no_access(self, repository: Repository):
+        repository.pull_requests_no_access_count += 1
+        backoff = min(
+            self.NO_ACCESS_BACKOFF * 2 ** min(repository.pull_requests_no_access_count - 1, 10),
+            self.NO_ACCESS_MAX_BACKOFF,
+        )
+        repository.pull_requests_no_access_until = timezone.now() + backoff
+        repository.save(update_fields=["pull_requests_no_access_until", "pull_requests_no_access_count"])
 
-    def process_pull_request(
+    def parse_pull_request(
         self,
         integration: GitBaseIntegration,
         repository: Repository,
         repository_data: GitRepositoryData,
         pull_request_data: dict,
     ):
+        """
+        Returns the parsed pull request data and whether it is open, None if it can't be parsed
+        """
         try:
             format_data, is_open = integration.format_pull_request_data_to_webhook_request_data(
                 repository_data, pull_request_data
             )
-            data = integration.parse_pull_request_data(format_data)
+            return integration.parse_pull_request_data(format_data), is_open
         except Exception as error:
             with push_scope() as scope:
                 scope.set_extra("provider", integration.provider.name)
@@ -184,12 +320,15 @@ class Command(SingleInstanceCommandMixin, InstrumentedCommandMixin, BaseCommand)
                 logger.exception("Failed to parse Pull Request")
                 traceback_on_debug()
                 capture_exception(error)
-            return False
-
-        if self.pull_request_exists(repository, data.pr_number):
-            logger.info(f"Skipping PR#{data.pr_number} for repository '{repository.full_name()}' -  already exists")
-            return False
+            return None
 
+    def process_pull_request(
+        self,
+        integration: GitBaseIntegration,
+        repository: Repository,
+        data: PullRequestData,
+        is_open: bool,
+    ):
         if not is_open:
             logger.info(f"Skipping PR#{data.pr_number} for repository '{repository.full_name()}' - not open")
             self.create_closed_pull_request(repository, data)
@@ -235,12 +374,6 @@ class Command(SingleInstanceCommandMixin, InstrumentedCommandMixin, BaseCommand)
         except Repository.DoesNotExist:
             return None
 
-    def pull_request_exists(self, repository, pr_number):
-        return RepositoryPullRequest.objects.filter(
-            repository=repository,
-            pr_number=pr_number,
-        ).exists()
-
     def validate_providers(self, providers: [str]) -> bool:
         if providers:
             available_providers = {provider.name for provider in get_git_providers()}
@@ -0,0 +1,36 @@
+import logging
+import os
+
+from django.core.management.base import BaseCommand
+
+from mvp.models import Organization
+from mvp.services import ContextualizationDayInterval, ContextualizationService
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Stores the contextualization output files on disk in the database."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--orgid",
+            type=int,
+            help="Narrow execution just to given organization ID.",
+        )
+
+    def handle(self, *args, **options):
+        organization_id = options.get("orgid")
+        if organization_id:
+            organizations = Organization.objects.filter(id=organization_id)
+        else:
+            organizations = Organization.objects.filter(contextualization_enabled=True)
+
+        for organization in organizations:
+            for day_interval in ContextualizationDayInterval:
+                day_interval_dir = ContextualizationService.get_day_interval_directory(organization, day_interval)
+                if not os.path.isdir(day_interval_dir):
+                    continue
+
+                ContextualizationService.save_output_files(organization, day_interval, day_interval_dir)
+                logger.info(f"Imported {day_interval.value} day contextualization outputs of {organization}")
@@ -773,3 +773,7 @@ class Command(SingleInstanceCommandMixin, InstrumentedCommandMixin, BaseCommand)
 
         with open(file_path, "w") as f:
             json.dump(data, f, indent=4)
+
+        ContextualizationService.save_output_files(
+            organization, ContextualizationService.DEFAULT_DAY_INTERVAL, directory
+        )
@@ -0,0 +1,49 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from mvp.mixins import InstrumentedCommandMixin, SingleInstanceCommandMixin
+from mvp.models import Organization
+from mvp.services.repository_daily_composition_service import (
+    RepositoryDailyCompositionService,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Command(SingleInstanceCommandMixin, InstrumentedCommandMixin, BaseCommand):
+    help = "Recalculates the pre-computed daily AI composition of repositories."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--orgid",
+            type=int,
+            help="Narrow execution just to given organization ID.",
+        )
+
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Rebuild the whole history instead of updating from the last calculated day.",
+        )
+
+    def handle(self, *args, **options):
+        full = options.get("full", False)
+
+        for organization in self.get_organizations(options.get("orgid")):
+            service = RepositoryDailyCompositionService(organization)
+            if full:
+                for repository in organization.repository_set.all():
+                    service.update_repository(repository)
+            else:
+                service.update_all()
+
+            logger.info(f'Successfully updated daily composition for "{organization}"')
+
+    def get_organizations(self, organization_id):
+        qs = Organization.objects
+
+        if organization_id:
+            qs = qs.filter(id=organization_id)
+
+        return qs.all()
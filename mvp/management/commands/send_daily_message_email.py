@@ -1,7 +1,11 @@
 import logging
+import threading
+import time
+from collections import defaultdict
 
 import sentry_sdk
 from django.conf import settings
+from django.core.mail import get_connection
 from django.core.management.base import BaseCommand
 from django.template.loader import render_to_string
 from django.utils import timezone
@@ -27,6 +31,7 @@ from mvp.services.contextualization_message_service import (
 from mvp.utils import (
     get_daily_message_template_context,
     remove_empty_lines_from_text,
+    run_concurrently,
 )
 
 logger = logging.getLogger(__name__)
@@ -50,6 +55,12 @@ class Command(BaseCommand):
             nargs="+",
             help="Skips sending daily message email to orgs (space-separated).",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=settings.DAILY_MESSAGE_EMAIL_MAX_WORKERS,
+            help="Number of organizations whose messages are rendered at the same time.",
+        )
 
     @monitor(monitor_slug="send_daily_message_email")
     def handle(self, *args, **options):
@@ -57,7 +68,9 @@ class Command(BaseCommand):
         skip_orgids = options.get("skip_orgids", None)
 
         if organization_id:
-            organizations = [Organization.objects.get(id=organization_id)]
+            organizations = Organization.objects.filter(id=organization_id)
+            # raises if the organization doesn't exist
+            organizations.get()
         else:
             organizations = Organization.objects.filter(contextualization_enabled=True)
 
@@ -68,113 +81,174 @@ class Command(BaseCommand):
             )
             organizations = organizations.exclude(id__in=skip_orgids)
 
-        emails_sent_to_orgs = []
-        organizations_with_no_new_commits = []
-        organizations_with_no_recipients = []
+        organizations = list(organizations)
+
+        self.emails_sent_to_orgs = []
+        self.organizations_with_no_new_commits = []
+        self.organizations_with_no_recipients = []
+        self.num_emails_sent = 0
+        self.num_emails_sent_lock = threading.Lock()
 
         logger.info("send daily message email command started")
-        for organization in organizations:
-            sentry_sdk.set_context(
-                "organization",
-                {"id": organization.pk, "name": organization.name},
+        start_time = time.perf_counter()
+
+        # the facts of all the organizations are fetched at once instead of per organization
+        self.recipients_by_organization = self.get_recipients_by_organization(organizations)
+        self.connected_integrations = ConnectedIntegrationsService.get_connected_integrations_by_organization(
+            organizations,
+            [ConnectedIntegrationsService.JIRA, *ConnectedIntegrationsService.GIT_INTEGRATION_MAP_KEYS],
+        )
+        self.daily_messages = {
+            daily_message.organization_id: daily_message
+            for daily_message in DailyMessage.objects.filter(
+                date=timezone.now().date(),
+                organization__in=organizations,
             )
-            recipient_list = CustomUser.objects.filter(
-                organizations=organization,
-                compass_anomaly_insights_notifications=True,
+        }
+        self.message_filters = {
+            (message_filter.organization_id, message_filter.user_id): message_filter
+            for message_filter in MessageFilter.objects.filter(
+                organization__in=organizations,
+                day_interval=DayIntervalChoices.ONE_DAY,
+            ).prefetch_related("repository_groups")
+        }
+
+        # all the organizations share the same mail server connection
+        with get_connection(fail_silently=False) as connection:
+            self.connection = connection
+            run_concurrently(self.process_organization, organizations, options["workers"])
+
+        seconds = time.perf_counter() - start_time
+        logger.info(
+            "Daily message email sent to organizations",
+            extra={
+                "organizations": self.emails_sent_to_orgs,
+                "organizations_with_no_new_commits": self.organizations_with_no_new_commits,
+                "organizations_with_no_recipients": self.organizations_with_no_recipients,
+            },
+        )
+        logger.info(
+            f"Sent {self.num_emails_sent} daily message emails for {len(organizations)} organizations "
+            f"in {seconds:.1f} s ({self.num_emails_sent / seconds if seconds else 0:.1f}/s)"
+        )
+
+    def get_recipients_by_organization(self, organizations):
+        recipients_by_organization = defaultdict(list)
+        user_organizations = CustomUser.organizations.through.objects.filter(
+            organization__in=organizations,
+            customuser__compass_anomaly_insights_notifications=True,
+        ).select_related("customuser")
+        for user_organization in user_organizations:
+            recipients_by_organization[user_organization.organization_id].append(user_organization.customuser)
+
+        return recipients_by_organization
+
+    def process_organization(self, organization):
+        sentry_sdk.set_context(
+            "organization",
+            {"id": organization.pk, "name": organization.name},
+        )
+        recipient_list = self.recipients_by_organization.get(organization.id)
+        if not recipient_list:
+            self.organizations_with_no_recipients.append(organization.name)
+            logger.warning(
+                "No recipients found for sending daily message email",
+                extra={"organization": organization.name},
             )
-            if not recipient_list:
-                organizations_with_no_recipients.append(organization.name)
-                logger.warning(
-                    "No recipients found for sending daily message email",
-                    extra={"organization": organization.name},
-                )
-                continue
+            return
 
-            has_jira_connection = ConnectedIntegrationsService.is_jira_connected(organization)
-            has_git_connection = ConnectedIntegrationsService.is_git_connected(organization)
+        connected_integrations = self.connected_integrations.get(organization.id, set())
+        has_jira_connection = ConnectedIntegrationsService.JIRA in connected_integrations
+        has_git_connection = any(
+            key in connected_integrations for key in ConnectedIntegrationsService.GIT_INTEGRATION_MAP_KEYS
+        )
 
-            if has_git_connection:
-                new_commits_exist = ContextualizationService.check_commits_exist_for_pipeline_a(
-                    organization,
-                    ContextualizationDayInterval.ONE_DAY,
-                )
-            else:
-                new_commits_exist = False
-
-            try:
-                daily_message = DailyMessage.objects.get(date=timezone.now().date(), organization=organization)
-            except DailyMessage.DoesNotExist:
-                daily_message = None
-
-            has_updates = (has_git_connection and new_commits_exist) or has_jira_connection
-            if has_updates and not daily_message:
-                logger.error(
-                    "Skip sending daily message email for org. Likely a problem with the last contextualization run.",
-                    extra={
-                        "organization": organization.name,
-                        "has_git_connection": has_git_connection,
-                        "has_jira_connection": has_jira_connection,
-                    },
+        if has_git_connection:
+            new_commits_exist = ContextualizationService.check_commits_exist_for_pipeline_a(
+                organization,
+                ContextualizationDayInterval.ONE_DAY,
+            )
+        else:
+            new_commits_exist = False
+
+        daily_message = self.daily_messages.get(organization.id)
+
+        has_updates = (has_git_connection and new_commits_exist) or has_jira_connection
+        if has_updates and not daily_message:
+            logger.error(
+                "Skip sending daily message email for org. Likely a problem with the last contextualization run.",
+                extra={
+                    "organization": organization.name,
+                    "has_git_connection": has_git_connection,
+                    "has_jira_connection": has_jira_connection,
+                },
+            )
+            return
+
+        text_content_list = []
+        html_content_list = []
+        # recipients with the same filters get the same message, so each variant is rendered once
+        rendered_messages = {}
+
+        no_commits_message = not has_jira_connection and has_git_connection and not new_commits_exist
+
+        for recipient in recipient_list:
+            message_filter = self.message_filters.get((organization.id, recipient.id))
+            serialized_filters = MessageFilterSerializer(message_filter).data
+            filter_data = MessageFilterData(
+                significance_levels=serialized_filters.get("significance_levels") or [],
+                repository_groups=serialized_filters.get("repository_groups") or [],
+                ticket_categories=serialized_filters.get("ticket_categories") or [],
+            )
+            signature = ContextualizationMessageService.get_message_filter_signature(filter_data)
+            if signature not in rendered_messages:
+                rendered_messages[signature] = self.render_message(
+                    organization, daily_message, filter_data, no_commits_message
                 )
-                continue
 
-            data = daily_message.raw_json if daily_message else {"last_updated": None}
+            text_content, html_content = rendered_messages[signature]
+            text_content_list.append(text_content)
+            html_content_list.append(html_content)
 
-            message_filters: dict[str, MessageFilter] = {
-                mf.user.id: mf
-                for mf in MessageFilter.objects.filter(
-                    user__in=recipient_list,
-                    organization=organization,
-                    day_interval=DayIntervalChoices.ONE_DAY,
-                )
-            }
-            text_content_list = []
-            html_content_list = []
-
-            no_commits_message = not has_jira_connection and has_git_connection and not new_commits_exist
-
-            for recipient in recipient_list:
-                message_filter = message_filters.get(recipient.id)
-                serialized_filters = MessageFilterSerializer(message_filter).data
-                filter_data = MessageFilterData(
-                    significance_levels=serialized_filters.get("significance_levels") or [],
-                    repository_groups=serialized_filters.get("repository_groups") or [],
-                    ticket_categories=serialized_filters.get("ticket_categories") or [],
-                )
-                filtered_data = ContextualizationMessageService.get_filtered_daily_message_data(data, filter_data)
-                context = get_daily_message_template_context(organization, filtered_data, no_commits_message)
+        logger.info(
+            f"Rendered {len(rendered_messages)} daily message variants "
+            f'for {len(recipient_list)} recipients of "{organization}"'
+        )
+        recipient_list = [recipient.email for recipient in recipient_list if recipient.email]
+        sent = EmailService.send_personalized_emails(
+            subject=f"SIP-Daily Message - {organization.name}",
+            messages=text_content_list,
+            html_messages=html_content_list,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            recipient_list=recipient_list,
+            connection=self.connection,
+        )
+        if sent:
+            with self.num_emails_sent_lock:
+                self.num_emails_sent += len(recipient_list)
 
-                text_content = render_to_string(
-                    template_name="mvp/emails/daily_message.txt",
-                    context=context,
-                )
-                text_content = remove_empty_lines_from_text(text_content)
-                text_content_list.append(text_content)
-
-                html_content_list.append(
-                    render_to_string(
-                        template_name="mvp/emails/daily_message.html",
-                        context=context,
-                    )
-                )
-            recipient_list = [recipient.email for recipient in recipient_list if recipient.email]
-            EmailService.send_personalized_emails(
-                subject=f"SIP-Daily Message - {organization.name}",
-                messages=text_content_list,
-                html_messages=html_content_list,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=recipient_list,
+        if new_commits_exist:
+            self.emails_sent_to_orgs.append(organization.name)
+        else:
+            self.organizations_with_no_new_commits.append(organization.name)
+
+    def render_message(self, organization, daily_message, filter_data, no_commits_message):
+        if daily_message:
+            filtered_data = ContextualizationMessageService.get_cached_filtered_daily_message_data(
+                organization, daily_message, filter_data
             )
-            if new_commits_exist:
-                emails_sent_to_orgs.append(organization.name)
-            else:
-                organizations_with_no_new_commits.append(organization.name)
+        else:
+            filtered_data = ContextualizationMessageService.get_filtered_daily_message_data(
+                {"last_updated": None}, filter_data
+            )
+        context = get_daily_message_template_context(organization, filtered_data, no_commits_message)
 
-        logger.info(
-            "Daily message email sent to organizations",
-            extra={
-                "organizations": emails_sent_to_orgs,
-                "organizations_with_no_new_commits": organizations_with_no_new_commits,
-                "organizations_with_no_recipients": organizations_with_no_recipients,
-            },
+        text_content = render_to_string(
+            template_name="mvp/emails/daily_message.txt",
+            context=context,
+        )
+        html_content = render_to_string(
+            template_name="mvp/emails/daily_message.html",
+            context=context,
         )
+        return remove_empty_lines_from_text(text_content), html_content
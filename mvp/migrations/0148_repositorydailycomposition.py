@@ -0,0 +1,43 @@
+# Generated by Django 4.2.30 on 2026-10-19 01:10
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("mvp", "0147_messageintegration"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RepositoryDailyComposition",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("date", models.DateField()),
+                ("code_num_lines", models.PositiveIntegerField(default=0)),
+                ("code_ai_num_lines", models.PositiveIntegerField(default=0)),
+                ("code_ai_blended_num_lines", models.PositiveIntegerField(default=0)),
+                (
+                    "repository",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="mvp.repository"
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("repository", "date")},
+            },
+        ),
+    ]
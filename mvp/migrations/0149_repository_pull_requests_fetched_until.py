@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("mvp", "0148_repositorydailycomposition"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="repository",
+            name="pull_requests_fetched_until",
+            field=models.DateTimeField(blank=True, default=None, null=True),
+        ),
+        migrations.AddField(
+            model_name="repository",
+            name="pull_requests_no_access_count",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="repository",
+            name="pull_requests_no_access_until",
+            field=models.DateTimeField(blank=True, default=None, null=True),
+        ),
+    ]
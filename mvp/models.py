@@ -1441,6 +1441,12 @@ class Repository(
     analysis_historic_done = models.BooleanField(default=False)
     default_branch_name = models.CharField(max_length=250, default=None, blank=True, null=True)
 
+    # fetch_pull_requests: last update of the pull requests fetched, the next poll starts from it
+    pull_requests_fetched_until = models.DateTimeField(default=None, blank=True, null=True)
+    # fetch_pull_requests: the pull requests aren't fetched until then after the provider denied access
+    pull_requests_no_access_until = models.DateTimeField(default=None, blank=True, null=True)
+    pull_requests_no_access_count = models.PositiveSmallIntegerField(default=0)
+
     class Meta:
         unique_together = ["organization", "provider", "external_id"]
         verbose_name_plural = "repositories"
@@ -1667,6 +1673,27 @@ class RepositoryCommit(
         return self.sha
 
 
+class RepositoryDailyComposition(TimestampedModel):
+    """
+    Rollup of the analyzed line counts of a repository per day.
+
+    Days without commits carry forward the values of the previous day, so a date range
+    can be read with a single range scan. Maintained by RepositoryDailyCompositionService.
+    """
+
+    repository = models.ForeignKey(Repository, on_delete=models.CASCADE)
+    date = models.DateField()
+    code_num_lines = models.PositiveIntegerField(default=0)
+    code_ai_num_lines = models.PositiveIntegerField(default=0)
+    code_ai_blended_num_lines = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ["repository", "date"]
+
+    def __str__(self):
+        return f"{self.repository_id} - {self.date}"
+
+
 class RepositoryFile(
     PublicIdMixin,
     AttestedTimestampFieldsModel,
@@ -2296,6 +2323,18 @@ class SystemMessage(PublicIdMixin, TimestampedModel):
 
     objects = SystemMessageManager()
 
+    CACHE_KEY_NOT_EXPIRED = "system_messages_not_expired"
+    CACHE_TIMEOUT = 60 * 60  # 1 hour
+
+    @classmethod
+    def get_cached_not_expired(cls) -> list["SystemMessage"]:
+        # it's deleted when messages are saved, see signals
+        return cache.get_or_set(
+            cls.CACHE_KEY_NOT_EXPIRED,
+            lambda: list(cls.objects.filter(expires_at__gte=datetime.now(timezone.utc)).order_by("starts_at")),
+            cls.CACHE_TIMEOUT,
+        )
+
     @admin.display(boolean=True)
     def is_showing(self):
         now = datetime.now(timezone.utc)
@@ -10,6 +10,7 @@ from .email_service import EmailService  # noqa: F401
 from .fuzzy_matching_service import FuzzyMatchingService  # noqa: F401
 from .groups_ai_code_service import GroupsAICodeService  # noqa: F401
 from .notification_service import NotificationService  # noqa: F401
+from .organization_cache_service import OrganizationCacheService  # noqa: F401
 from .organization_segment_service import OrganizationSegmentService  # noqa: F401
 from .pull_request_service import PullRequestService  # noqa: F401
 from .rule_service import RuleService  # noqa: F401
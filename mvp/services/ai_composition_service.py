@@ -1,18 +1,25 @@
 import logging
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
+from datetime import date, datetime, timedelta
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 from sentry_sdk import capture_message, push_scope
 
 from mvp.models import (
     AITypeChoices,
     Organization,
     Repository,
-    RepositoryCommit,
-    RepositoryCommitStatusChoices,
+    RepositoryDailyComposition,
+)
+from mvp.utils import (
+    get_days,
+    get_first_day_week,
+    get_whole_decimal,
+    round_half_up,
+    round_half_up_array,
 )
-from mvp.utils import get_days, get_first_day_week, get_whole_decimal, round_half_up
 
 from .rule_service import RuleService
 
@@ -102,13 +109,46 @@ class AICompositionService:
             since, until, repositories, add_previous_date=daily_charts
         )
 
-        if not by_date:
+        if by_date is None:
             return [], []
 
+        return self.build_charts(by_date, dates, identifier, daily_charts)
+
+    def get_charts_by_group(
+        self,
+        since: datetime,
+        until: datetime,
+        repositories_by_group: Dict[str | int, List[Repository]],
+        daily_charts: bool = False,
+    ) -> Dict[str | int, Tuple[List[Chart], List[Chart]]]:
+        """
+        Same as get_charts for several groups of repositories, fetching the data only once.
+
+        Groups are identified by the keys of repositories_by_group, which are also used as chart identifiers.
+        """
+        dates, by_repository = self.get_lines_by_group_repository(
+            since, until, repositories_by_group, add_previous_date=daily_charts
+        )
+
+        charts = {}
+        for identifier, group_by_repository in by_repository.items():
+            if not group_by_repository:
+                charts[identifier] = [], []
+                continue
+
+            by_date = self.get_lines_by_date(group_by_repository)
+            charts[identifier] = self.build_charts(by_date, dates, identifier, daily_charts)
+
+        return charts
+
+    def build_charts(
+        self, by_date: np.ndarray, dates: List[str], identifier: Optional[str], daily_charts: bool
+    ) -> Tuple[List[Chart], List[Chart]]:
         daily = []
         if daily_charts:
             # remove the extra added day
             dates = dates[1:]
+            by_date = by_date[1:]
 
             daily_series = self.get_daily_series(by_date, dates)
             daily = self.format_charts(daily_series, dates, f"{self.SERIES_DAILY_SUFFIX}-{identifier}")
@@ -124,22 +164,63 @@ class AICompositionService:
         until: datetime,
         repositories: List[Repository] = [],
         add_previous_date=False,
-    ) -> Tuple[dict, List[str], dict]:
+    ) -> Tuple[Optional[np.ndarray], List[str], Dict[int, np.ndarray]]:
+        """
+        Returns the number of lines per date summed for all repositories, the dates and the number of lines
+        per date of each repository.
+
+        Lines are arrays of shape (dates, FIELDS_LINES_NAMES).
+        """
         dates, since_data, until_data, aggregate = self.get_dates(since, until, add_previous_date=add_previous_date)
 
         repositories = repositories or self.organization.repository_set.all()
-        commits = self.get_commits(since_data, until_data, repositories)
-        if not commits:
-            return {}, dates, {}
+        by_repository = self.get_lines_by_repository(since_data, until_data, repositories, dates, aggregate)
+        if not by_repository:
+            return None, dates, {}
 
-        by_repository = self.get_commits_by_repository(commits)
+        return self.get_lines_by_date(by_repository), dates, by_repository
 
-        if aggregate:
-            by_repository = self.aggregate_weekly_data(by_repository)
+    def get_lines_by_group_repository(
+        self,
+        since: datetime,
+        until: datetime,
+        repositories_by_group: Dict[str | int, List[Repository]],
+        add_previous_date=False,
+    ) -> Tuple[List[str], Dict[str | int, Dict[int, np.ndarray]]]:
+        """
+        Fetches the data of all the groups at once and partitions it by group and repository.
+        """
+        dates, since_data, until_data, aggregate = self.get_dates(since, until, add_previous_date=add_previous_date)
 
-        by_date, by_repository = self.get_commits_by_date(by_repository, dates)
+        repositories = [repository for group in repositories_by_group.values() for repository in group]
+        by_repository = (
+            self.get_lines_by_repository(since_data, until_data, repositories, dates, aggregate) if repositories else {}
+        )
+
+        by_group = {
+            identifier: {
+                repository.pk: by_repository[repository.pk]
+                for repository in group_repositories
+                if repository.pk in by_repository
+            }
+            for identifier, group_repositories in repositories_by_group.items()
+        }
+
+        return dates, by_group
+
+    def get_lines_by_repository(
+        self,
+        since: datetime,
+        until: datetime,
+        repositories: List[Repository],
+        dates: List[str],
+        aggregate: bool,
+    ) -> Dict[int, np.ndarray]:
+        commits = self.get_commits(since, until, repositories)
+        if not commits:
+            return {}
 
-        return by_date, dates, by_repository
+        return self.get_commits_by_repository(commits, dates, aggregate)
 
     def get_dates(self, since: datetime, until: datetime, add_previous_date=False):
         # include last day's data
@@ -190,17 +271,39 @@ class AICompositionService:
         until: datetime,
         repositories: List[Repository] = [],
     ) -> dict:
-        by_date, dates, by_repository = self.get_data_by_date_and_repository(
-            since, until, repositories, add_previous_date=True
-        )
+        by_date, dates, _ = self.get_data_by_date_and_repository(since, until, repositories, add_previous_date=True)
 
-        if not by_date:
+        if by_date is None:
             return {}
 
         # remove the extra added day
-        dates = dates[1:]
+        _, num_lines = self.calculate_daily_data(by_date[1:], dates[1:])
+
+        return num_lines
+
+    def get_daily_num_lines_by_group(
+        self,
+        since: datetime,
+        until: datetime,
+        repositories_by_group: Dict[str | int, List[Repository]],
+    ) -> Dict[str | int, dict]:
+        """
+        Same as get_daily_num_lines for several groups of repositories, fetching the data only once.
+        """
+        dates, by_repository = self.get_lines_by_group_repository(
+            since, until, repositories_by_group, add_previous_date=True
+        )
+
+        num_lines = {}
+        for identifier, group_by_repository in by_repository.items():
+            if not group_by_repository:
+                num_lines[identifier] = {}
+                continue
 
-        _, num_lines = self.calculate_daily_data(by_date, dates)
+            by_date = self.get_lines_by_date(group_by_repository)
+
+            # remove the extra added day
+            _, num_lines[identifier] = self.calculate_daily_data(by_date[1:], dates[1:])
 
         return num_lines
 
@@ -218,117 +321,113 @@ class AICompositionService:
             return {}
 
         # remove the extra added day
-        dates = dates[1:]
+        by_repository = {repository_id: lines[1:] for repository_id, lines in by_repository.items()}
 
-        num_lines = {}
-        for repository_id, repo_data in by_repository.items():
-            _, repo_num_lines = self.calculate_daily_data(repo_data, dates)
-            num_lines[repository_id] = repo_num_lines
+        return self.calculate_daily_num_lines_by_repository(by_repository, dates[1:])
 
-        return num_lines
+    def calculate_daily_num_lines_by_repository(
+        self, by_repository: Dict[int, np.ndarray], dates: List[str]
+    ) -> Dict[int, dict]:
+        """
+        Same as calculate_daily_data for each repository, only for num lines and calculating all repositories at once.
+        """
+        lines = np.stack(list(by_repository.values()))
+        self.check_ai_compositions(lines, dates)
+        deltas = self.calculate_daily_deltas(lines)
+
+        return {
+            repository_id: {name: deltas[name][index].tolist() for name in self.SERIES_DELTA}
+            for index, repository_id in enumerate(by_repository.keys())
+        }
 
-    def get_commits_by_repository(self, commits: List[dict]) -> dict:
+    def get_commits_by_repository(
+        self, commits: List[dict], dates: List[str], aggregate: bool
+    ) -> Dict[int, np.ndarray]:
         """
-        There may be more than one commit per repository per day.
+        Returns the number of lines of each repository for each date, as arrays of shape (dates, FIELDS_LINES_NAMES).
 
-        We'll use the last one to calculate the data for that day.
+        There may be more than one commit per repository per date (e.g. when aggregating weeks).
+
+        We'll use the last one to calculate the data for that date.
 
         Because commits are sorted by date ascending, the last commit will be the most recent one.
+
+        Dates without commits propagate the previous value, or are empty if there's no previous value.
         """
-        by_repository = {}
-        for commit in commits:
-            repository_id = commit["repository_id"]
-            if repository_id not in by_repository:
-                by_repository[repository_id] = {}
-
-            date = commit["date_time"].strftime(self.DATE_FORMAT_DAY)
-
-            by_repository[repository_id][date] = {field: commit[field] for field in self.FIELDS_LINES_NAMES}
-
-        return by_repository
-
-    def aggregate_weekly_data(self, by_repository: dict) -> dict:
-        weekly = {}
-        for repository_id, values in by_repository.items():
-            if repository_id not in weekly:
-                weekly[repository_id] = {}
-
-            for date, fields in values.items():
-                week_date = self.get_aggregated_week_date(date)
-
-                if week_date not in weekly[repository_id]:
-                    weekly[repository_id][week_date] = fields
-                else:
-                    for field_name, field_value in fields.items():
-                        weekly[repository_id][week_date][field_name] += field_value
-
-        return weekly
-
-    def get_commits_by_date(self, by_repository: dict, dates: List[str]) -> Tuple[dict, dict]:
-        empty_day = {field: 0 for field in self.FIELDS_LINES_NAMES}
-        by_date = {date: {**empty_day} for date in dates}
-        for lines_by_date in by_repository.values():
-            first_date = list(lines_by_date.keys())[0]
-            first_value = list(lines_by_date.values())[0]
-            for date_index, date in enumerate(dates):
-                # Empty if date is older than previous day with data
-                # Otherwise, get previous day or first day available or empty if there's no data
-                if lines_by_date.get(date) is None:
-                    lines_by_date[date] = (
-                        lines_by_date.get(
-                            dates[date_index - 1],
-                            first_value or empty_day,
-                        )
-                        if date >= first_date
-                        else empty_day
-                    )
-
-                for field in self.FIELDS_LINES_NAMES:
-                    by_date[date][field] += lines_by_date[date][field]
+        repository_ids, repository_index = np.unique(
+            self.get_commits_column(commits, "repository_id"), return_inverse=True
+        )
+        values = np.stack([self.get_commits_column(commits, field) for field in self.FIELDS_LINES_NAMES], axis=-1)
+
+        # column 0 holds the values previous to the first date
+        days = np.fromiter(map(date.toordinal, map(itemgetter("date"), commits)), dtype=np.int64, count=len(commits))
+        if aggregate:
+            days = self.get_aggregated_week_dates(days)
+        step = 7 if aggregate else 1
+        date_index = (days - datetime.strptime(dates[0], self.DATE_FORMAT_DAY).toordinal()) // step
+        date_index = np.clip(date_index, -1, None) + 1
+
+        in_range = date_index <= len(dates)
+        repository_index, date_index, values = repository_index[in_range], date_index[in_range], values[in_range]
+
+        # keep the last commit per repository and date
+        keys = repository_index * (len(dates) + 1) + date_index
+        _, last_reversed = np.unique(keys[::-1], return_index=True)
+        last = len(keys) - 1 - last_reversed
+
+        lines = np.zeros((len(repository_ids), len(dates) + 1, len(self.FIELDS_LINES_NAMES)), dtype=np.int64)
+        lines[repository_index[last], date_index[last]] = values[last]
 
+        has_data = np.zeros(lines.shape[:2], dtype=bool)
+        has_data[repository_index[last], date_index[last]] = True
+
+        # forward fill with the previous date with data, column 0 is empty if there's no previous data
+        fill_index = np.where(has_data, np.arange(len(dates) + 1), 0)
+        np.maximum.accumulate(fill_index, axis=1, out=fill_index)
+        lines = lines[np.arange(len(repository_ids))[:, None], fill_index][:, 1:]
+
+        return {
+            repository_id: repository_lines for repository_id, repository_lines in zip(repository_ids.tolist(), lines)
+        }
+
+    def get_commits_column(self, commits: List[dict], field: str) -> np.ndarray:
+        return np.fromiter(map(itemgetter(field), commits), dtype=np.int64, count=len(commits))
+
+    def get_lines_by_date(self, by_repository: Dict[int, np.ndarray]) -> np.ndarray:
         # TODO: by_repository could be used for Repositories view since it's data for each repo
-        return by_date, by_repository
+        return np.sum(list(by_repository.values()), axis=0)
 
-    def get_cumulative_series(self, by_date: dict, dates: List[str]) -> List[ChartSeries]:
+    def get_cumulative_series(self, by_date: np.ndarray, dates: List[str]) -> List[ChartSeries]:
         series = self.calculate_cumulative_percentages(by_date, dates)
 
         return [ChartSeries(name=series_name, data=values) for series_name, values in series.items()]
 
-    def calculate_cumulative_percentages(self, by_date: dict, dates: List[str]) -> dict:
-        series = {_series.label: [0] * len(dates) for _series in self.SERIES}
-        for date, fields in by_date.items():
-            if date not in dates or not (total_lines := fields[self.FIELD_NAME_TOTAL_NUM_LINES]):
-                continue
-
-            overall = self.get_ai_percentage(
-                fields[self.FIELD_NAME_OVERALL_NUM_LINES],
-                total_lines,
-            )
-            blended = self.get_ai_percentage(
-                fields[self.FIELD_NAME_BLENDED_NUM_LINES],
-                total_lines,
-            )
+    def calculate_cumulative_percentages(self, by_date: np.ndarray, dates: List[str]) -> dict:
+        total_lines, ai_num_lines, blended_num_lines = self.get_fields(by_date)
+        has_lines = total_lines != 0
 
-            """
-            To avoid rounding issues, ignore data on pure and force it by calculating:
+        overall, has_overall = self.get_ai_percentages(ai_num_lines, total_lines)
+        blended, has_blended = self.get_ai_percentages(blended_num_lines, total_lines)
 
-            Pure = Overall - Blended
-            """
-            pure = round_half_up(overall - blended, self.NUM_DECIMALS)
+        """
+        To avoid rounding issues, ignore data on pure and force it by calculating:
 
-            date_index = dates.index(date)
-            series[AITypeChoices.OVERALL.label][date_index] = overall
-            series[AITypeChoices.BLENDED.label][date_index] = blended
-            series[AITypeChoices.PURE.label][date_index] = pure
+        Pure = Overall - Blended
+        """
+        pure = round_half_up_array(overall - blended, self.NUM_DECIMALS)
 
-        return series
+        return {
+            AITypeChoices.OVERALL.label: self.get_series_values(overall, has_lines & has_overall),
+            AITypeChoices.PURE.label: self.get_series_values(pure, has_lines),
+            AITypeChoices.BLENDED.label: self.get_series_values(blended, has_lines & has_blended),
+        }
 
-    def get_daily_series(self, by_date: dict, dates: List[str]) -> List[ChartSeries]:
+    def get_daily_series(self, by_date: np.ndarray, dates: List[str]) -> List[ChartSeries]:
         percentages, _ = self.calculate_daily_data(by_date, dates)
 
         return [ChartSeries(name=series_name, data=values) for series_name, values in percentages.items()]
 
-    def calculate_daily_data(self, by_date: dict, dates: List[str]) -> Tuple[dict, dict]:
+    def calculate_daily_data(self, by_date: np.ndarray, dates: List[str]) -> Tuple[dict, dict]:
         """
         This method aims to return the total of GenAI code pushed per date, in % and num lines.
 
@@ -340,60 +439,86 @@ class AICompositionService:
 
         TODO: count the number of lines in all commits that day and calculate the % of GenAI code.
         """
-        percentages = {_series.label: [0] * len(dates) for _series in self.SERIES}
-        num_lines = {name: [0] * len(dates) for name in self.SERIES_DELTA}
-        for date, fields in by_date.items():
-            if date not in dates or not (total_lines := fields[self.FIELD_NAME_TOTAL_NUM_LINES]):
-                continue
+        self.check_ai_compositions(by_date, dates)
 
-            date_index = dates.index(date)
-            previous_fields = by_date.get(dates[date_index - 1], {})
+        deltas = self.calculate_daily_deltas(by_date)
+        has_lines = self.get_fields(by_date)[0] != 0
 
-            ai_num_lines = fields[self.FIELD_NAME_OVERALL_NUM_LINES]
-            blended_num_lines = fields[self.FIELD_NAME_BLENDED_NUM_LINES]
-            self.check_ai_composition(total_lines, ai_num_lines, blended_num_lines, date)
+        overall, has_overall = self.get_ai_percentages(
+            deltas[self.SERIES_DELTA_NAME_OVERALL], deltas[self.SERIES_DELTA_NAME_TOTAL]
+        )
+        blended, has_blended = self.get_ai_percentages(
+            deltas[self.SERIES_DELTA_NAME_BLENDED], deltas[self.SERIES_DELTA_NAME_TOTAL]
+        )
 
-            previous_total_lines = previous_fields.get(self.FIELD_NAME_TOTAL_NUM_LINES, 0)
-            previous_ai_num_lines = previous_fields.get(self.FIELD_NAME_OVERALL_NUM_LINES, 0)
-            previous_blended_num_lines = previous_fields.get(self.FIELD_NAME_BLENDED_NUM_LINES, 0)
+        """
+        To avoid rounding issues, ignore data on pure and force it by calculating:
 
-            self.check_ai_composition(
-                previous_total_lines,
-                previous_ai_num_lines,
-                previous_blended_num_lines,
-                date,
-            )
+        Pure = Overall - Blended
+        """
+        pure = round_half_up_array(overall - blended, self.NUM_DECIMALS)
 
-            # Take into account overwritten lines by adding Blended into Overall, and Overall into Total
-            blended_delta = max(0, blended_num_lines - previous_blended_num_lines)
-            overall_delta = max(0, ai_num_lines - previous_ai_num_lines) + blended_delta
-            total_delta = max(0, total_lines - previous_total_lines) + overall_delta
+        self.check_min_max_values("overall", overall, dates)
+        self.check_min_max_values("blended", blended, dates)
+        self.check_min_max_values("pure", pure, dates)
 
-            overall = self.get_ai_percentage(overall_delta, total_delta)
-            blended = self.get_ai_percentage(blended_delta, total_delta)
+        percentages = {
+            AITypeChoices.OVERALL.label: self.get_series_values(overall, has_lines & has_overall),
+            AITypeChoices.PURE.label: self.get_series_values(pure, has_lines),
+            AITypeChoices.BLENDED.label: self.get_series_values(blended, has_lines & has_blended),
+        }
+        num_lines = {name: deltas[name].tolist() for name in self.SERIES_DELTA}
 
-            """
-            To avoid rounding issues, ignore data on pure and force it by calculating:
+        return percentages, num_lines
 
-            Pure = Overall - Blended
-            """
-            pure = round_half_up(overall - blended, self.NUM_DECIMALS)
-            pure_delta = overall_delta - blended_delta
+    def calculate_daily_deltas(self, lines: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Calculates the daily deltas of lines of shape (..., dates, FIELDS_LINES_NAMES).
 
-            self.check_min_max_value("overall", overall, date)
-            self.check_min_max_value("blended", blended, date)
-            self.check_min_max_value("pure", pure, date)
+        Dates without lines have no deltas. As it has always been done, the first date is compared with the last one.
+        """
+        total_lines, ai_num_lines, blended_num_lines = self.get_fields(lines)
+        previous_total_lines, previous_ai_num_lines, previous_blended_num_lines = self.get_fields(
+            np.roll(lines, 1, axis=-2)
+        )
 
-            percentages[AITypeChoices.OVERALL.label][date_index] = overall
-            percentages[AITypeChoices.BLENDED.label][date_index] = blended
-            percentages[AITypeChoices.PURE.label][date_index] = pure
+        # Take into account overwritten lines by adding Blended into Overall, and Overall into Total
+        blended_delta = np.maximum(0, blended_num_lines - previous_blended_num_lines)
+        overall_delta = np.maximum(0, ai_num_lines - previous_ai_num_lines) + blended_delta
+        total_delta = np.maximum(0, total_lines - previous_total_lines) + overall_delta
 
-            num_lines[self.SERIES_DELTA_NAME_OVERALL][date_index] = overall_delta
-            num_lines[self.SERIES_DELTA_NAME_BLENDED][date_index] = blended_delta
-            num_lines[self.SERIES_DELTA_NAME_PURE][date_index] = pure_delta
-            num_lines[self.SERIES_DELTA_NAME_TOTAL][date_index] = total_delta
+        has_lines = total_lines != 0
+        overall_delta = np.where(has_lines, overall_delta, 0)
+        blended_delta = np.where(has_lines, blended_delta, 0)
+        total_delta = np.where(has_lines, total_delta, 0)
 
-        return percentages, num_lines
+        return {
+            self.SERIES_DELTA_NAME_OVERALL: overall_delta,
+            self.SERIES_DELTA_NAME_BLENDED: blended_delta,
+            self.SERIES_DELTA_NAME_PURE: overall_delta - blended_delta,
+            self.SERIES_DELTA_NAME_TOTAL: total_delta,
+        }
+
+    def get_fields(self, lines: np.ndarray) -> List[np.ndarray]:
+        """
+        Splits lines of shape (..., FIELDS_LINES_NAMES) into one array per field.
+        """
+        return [lines[..., index] for index in range(len(self.FIELDS_LINES_NAMES))]
+
+    def get_series_values(self, values: np.ndarray, has_value: np.ndarray) -> List[int | float]:
+        # dates without a value are 0 instead of 0.0, as they have always been
+        return [value if has else 0 for value, has in zip(values.tolist(), has_value.tolist())]
+
+    def check_ai_compositions(self, lines: np.ndarray, dates: List[str]):
+        total_lines, ai_num_lines, blended_num_lines = self.get_fields(lines)
+        invalid = (total_lines != 0) & ((ai_num_lines > total_lines) | (blended_num_lines > ai_num_lines))
+
+        for index in zip(*np.nonzero(invalid)):
+            self.check_ai_composition(*lines[index].tolist(), dates[index[-1]])
+
+    def check_min_max_values(self, name, values: np.ndarray, dates: List[str], min_value=0, max_value=100):
+        for (index,) in zip(*np.nonzero((values < min_value) | (values > max_value))):
+            self.check_min_max_value(name, float(values[index]), dates[index], min_value, max_value)
 
     def check_ai_composition(self, total_lines, ai_num_lines, blended_num_lines, date):
         # This should always be the case
@@ -435,21 +560,23 @@ class AICompositionService:
 
         Thus, the last analysis done on a repository propagates until there's a new commit.
 
-        For that reason, we'll fetch the closest commit to the since date.
+        Values are read from the RepositoryDailyComposition rollup, which already carries them forward,
+        so this is usually a single range scan. For repositories without a row on the since date
+        (e.g. the rollup hasn't been extended yet) we fetch the closest row before it.
         """
 
         commits = list(self.get_date_range_commits(since, until, repositories))
 
         # Get repositories missing the first date
         first_date = since.strftime(self.DATE_FORMAT_DAY)
-        repositories_with_first_date = []
+        repositories_with_first_date = set()
         for commit in commits:
-            date = commit["date_time"].strftime(self.DATE_FORMAT_DAY)
+            date = commit["date"].strftime(self.DATE_FORMAT_DAY)
             if date != first_date:
                 # because commits are ordered by date, if the date changes we don't need to check more commits
                 break
 
-            repositories_with_first_date.append(commit["repository_id"])
+            repositories_with_first_date.add(commit["repository_id"])
 
         missing_data_repository_ids = [
             repository.pk for repository in repositories if repository.pk not in repositories_with_first_date
@@ -472,18 +599,16 @@ class AICompositionService:
         repositories: List[Repository],
     ):
         qs = (
-            RepositoryCommit.objects.filter(
+            RepositoryDailyComposition.objects.filter(
                 repository__organization=self.organization,
-                date_time__gte=since,
-                date_time__lt=until,
-                status=RepositoryCommitStatusChoices.ANALYZED,
-                pull_requests__isnull=True,
+                date__gte=since,
+                date__lt=until,
             )
-            .order_by("date_time")
+            .order_by("date")
             .values(
                 *self.FIELDS_LINES_NAMES,
                 "repository_id",
-                "date_time",
+                "date",
             )
         )
 
@@ -494,21 +619,19 @@ class AICompositionService:
 
     def get_closest_commits(self, until: datetime, repository_ids: List[int]):
         """
-        Get the most recent commit per repository.
+        Get the most recent daily values per repository.
         """
         qs = (
-            RepositoryCommit.objects.filter(
-                date_time__lt=until,
+            RepositoryDailyComposition.objects.filter(
+                date__lt=until,
                 repository__id__in=repository_ids,
-                status=RepositoryCommitStatusChoices.ANALYZED,
-                pull_requests__isnull=True,
             )
-            .order_by("repository", "-date_time")
+            .order_by("repository", "-date")
             .distinct("repository")
             .values(
                 *self.FIELDS_LINES_NAMES,
                 "repository_id",
-                "date_time",
+                "date",
             )
         )
 
@@ -520,6 +643,17 @@ class AICompositionService:
 
         return round_half_up(ai_lines / total_lines * 100, num_decimals)
 
+    def get_ai_percentages(
+        self, ai_lines: np.ndarray, total_lines: np.ndarray, num_decimals=NUM_DECIMALS
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized version of get_ai_percentage, also returns which percentages have a value.
+        """
+        has_value = (ai_lines != 0) & (total_lines != 0)
+        percentages = np.divide(ai_lines, total_lines, out=np.zeros(ai_lines.shape), where=has_value) * 100
+
+        return round_half_up_array(np.where(has_value, percentages, 0), num_decimals), has_value
+
     def format_ai_values(self, value: int | float, previous_value: Optional[int | float] = 0):
         whole, decimal = get_whole_decimal(value)
         return {
@@ -535,3 +669,10 @@ class AICompositionService:
 
     def get_aggregated_week_date(self, date: str) -> str:
         return get_first_day_week(datetime.strptime(date, self.DATE_FORMAT_DAY)).strftime(self.DATE_FORMAT_DAY)
+
+    def get_aggregated_week_dates(self, ordinals: np.ndarray) -> np.ndarray:
+        """
+        Vectorized version of get_aggregated_week_date for arrays of date ordinals.
+        """
+        # ordinal 1 is Monday 0001-01-01, so Sundays are multiples of 7
+        return ordinals - ordinals % 7
@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 from compass.integrations.integrations import (
     AzureDevOpsIntegration,
     BitBucketIntegration,
@@ -127,6 +129,35 @@ class ConnectedIntegrationsService:
 
         return bool(integration.is_connection_connected(connection))
 
+    @classmethod
+    def get_connected_integrations_by_organization(
+        cls,
+        organizations: list[Organization],
+        integration_map_keys: list,
+    ) -> dict[int, set[str]]:
+        """
+        Same as `is_integration_connected` for many organizations in a single query.
+        Returns the keys of the connected integrations by organization id.
+        """
+        integrations_by_provider_id = {}
+        for key in integration_map_keys:
+            integration = cls.INTEGRATION_MAP[key]()
+            integrations_by_provider_id[integration.provider.id] = (key, integration)
+
+        connections = DataProviderConnection.objects.filter(
+            organization__in=organizations,
+            data__isnull=False,
+            provider_id__in=integrations_by_provider_id,
+        )
+
+        connected_integrations = defaultdict(set)
+        for connection in connections:
+            key, integration = integrations_by_provider_id[connection.provider_id]
+            if integration.is_connection_connected(connection):
+                connected_integrations[connection.organization_id].add(key)
+
+        return connected_integrations
+
     @classmethod
     def is_connection_connected(cls, connection: DataProviderConnection) -> bool:
         integration = IntegrationFactory().get_integration(connection.provider)
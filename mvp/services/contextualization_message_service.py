@@ -1,13 +1,17 @@
 import copy
+import hashlib
+import json
 import logging
 import re
 import statistics
 from enum import Enum
 from typing import Any, TypedDict
 
+from django.core.cache import cache
 from django.db.models import QuerySet
 
 from compass.contextualization.models import (
+    DailyMessage,
     MessageFilterData,
     SignificanceLevelChoices,
 )
@@ -20,6 +24,7 @@ from mvp.services import (
     ConnectedIntegrationsService,
     ContextualizationDayInterval,
     ContextualizationService,
+    OrganizationCacheService,
 )
 
 logger = logging.getLogger(__name__)
@@ -45,10 +50,9 @@ class JiraQualityCategory(Enum):
 
 
 class ContextualizationMessageService:
-    # Class-level cache for expensive operations
-    _jira_base_url_cache = {}
-    _repository_cache = {}
-    _decoded_id_cache = {}
+    # the Jira base URL is requested to the Jira API, so it's cached until the connection changes
+    CACHE_KEY_JIRA_BASE_URL_TEMPLATE = "contextualization_message_jira_base_url_{organization_id}"
+    CACHE_TIMEOUT_JIRA_BASE_URL = 60 * 60  # 1 hour
 
     @classmethod
     def get_for_day_interval(
@@ -60,7 +64,10 @@ class ContextualizationMessageService:
         This collects data from various services across the system to
         provide data for the daily and weekly message emails and views.
         """
-        repositories: QuerySet[Repository] = organization.repository_set.all()
+        # all the repositories used by the insights are loaded at once
+        repositories: QuerySet[Repository] = organization.repository_set.select_related(
+            "organization", "provider", "group"
+        )
         repository_public_id_map = {repo.public_id(): repo for repo in repositories}
 
         anomaly_insights_and_risks, anomaly_insights_and_risks_updated_at = cls.get_anomaly_insights_and_risks(
@@ -204,6 +211,36 @@ class ContextualizationMessageService:
 
         return insights_with_repos
 
+    @staticmethod
+    def get_message_filter_signature(message_filter: MessageFilterData | None) -> str:
+        """
+        Filters selecting the same values have the same signature, regardless of their order.
+        A missing filter and a filter without values have the same signature too, as both select everything.
+        """
+        normalized_filter = {
+            key: sorted({str(value) for value in (message_filter or {}).get(key) or []})
+            for key in MessageFilterData.__annotations__
+        }
+        return hashlib.sha256(json.dumps(normalized_filter, sort_keys=True).encode()).hexdigest()
+
+    @classmethod
+    def get_cached_filtered_daily_message_data(
+        cls,
+        organization: Organization,
+        daily_message: DailyMessage,
+        message_filter: MessageFilterData,
+    ):
+        """
+        Filtered data is cached per filter signature, so recipients and views using the same filters share it.
+        The daily message is updated when the contextualization is imported again, which changes the cache key.
+        """
+        signature = cls.get_message_filter_signature(message_filter)
+        return OrganizationCacheService.get_or_set(
+            organization,
+            f"filtered_daily_message_{daily_message.pk}_{daily_message.updated_at.timestamp()}_{signature}",
+            lambda: cls.get_filtered_daily_message_data(daily_message.raw_json, message_filter),
+        )
+
     @classmethod
     def get_filtered_daily_message_data(cls, data, message_filter: MessageFilterData | None):
         if not message_filter:
@@ -254,13 +291,10 @@ class ContextualizationMessageService:
                 ]
 
             # Filter by Jira projects associated with repository groups
-            jira_project_names = set()
-            jira_project_keys = set()
-            for repo_group in repository_groups:
-                repo_group_id = DecodePublicIdMixin().decode_id(repo_group)
-                jira_projects = JiraProject.objects.filter(repository_group=repo_group_id)
-                jira_project_names.update(jira_projects.values_list("name", flat=True))
-                jira_project_keys.update(jira_projects.values_list("key", flat=True))
+            repo_group_ids = [DecodePublicIdMixin().decode_id(repo_group) for repo_group in repository_groups]
+            jira_projects = JiraProject.objects.filter(repository_group__in=repo_group_ids).values_list("name", "key")
+            jira_project_names = {name for name, _ in jira_projects}
+            jira_project_keys = {key for _, key in jira_projects}
 
             # Apply Jira project filtering to insights
             if jira_project_names:
@@ -305,41 +339,54 @@ class ContextualizationMessageService:
 
     @classmethod
     def get_jira_url(cls, organization: Organization, task_id: str):
-        # Use class-level cache for Jira base URL to prevent repetitive DB lookups
-        org_id = organization.id
-        if org_id not in cls._jira_base_url_cache:
-            try:
-                connection = DataProviderConnection.objects.get(
-                    organization=organization,
-                    provider__name="Jira",
-                )
+        base_url = cls.get_jira_base_url(organization)
+        return f"{base_url}/browse/{task_id}" if base_url else None
 
-                if not connection.is_connected():
-                    return None
+    @classmethod
+    def get_jira_base_url(cls, organization: Organization) -> str | None:
+        return cache.get_or_set(
+            cls.get_jira_base_url_cache_key(organization.id),
+            lambda: cls.fetch_jira_base_url(organization),
+            cls.CACHE_TIMEOUT_JIRA_BASE_URL,
+        )
 
-                jira_integration = JiraIntegration()
-                jira_integration.init_api(
-                    config=JiraApiConfig(
-                        access_token=connection.data.get("access_token"),
-                        refresh_token=connection.data.get("refresh_token"),
-                        cloud_id=connection.data.get("cloud_id"),
-                    ),
-                    connection=connection,
-                )
-                cls._jira_base_url_cache[org_id] = jira_integration.get_base_jira_url(connection)
-            except Exception:
-                logger.exception("Error getting Jira URL", extra={"organization": organization})
-                cls._jira_base_url_cache[org_id] = None
-        base_url = cls._jira_base_url_cache[org_id]
-        return f"{base_url}/browse/{task_id}" if base_url else None
+    @classmethod
+    def get_jira_base_url_cache_key(cls, organization_id: int) -> str:
+        return cls.CACHE_KEY_JIRA_BASE_URL_TEMPLATE.format(organization_id=organization_id)
 
     @classmethod
-    def get_resource_url(cls, repository_pk: int, resource_type: str, args: list):
-        # Use repository cache to avoid repetitive database lookups
-        repository = cls._repository_cache.get(repository_pk)
+    def clear_jira_base_url_cache(cls, organization_id: int):
+        cache.delete(cls.get_jira_base_url_cache_key(organization_id))
+
+    @staticmethod
+    def fetch_jira_base_url(organization: Organization) -> str | None:
+        try:
+            connection = DataProviderConnection.objects.get(
+                organization=organization,
+                provider__name="Jira",
+            )
+
+            if not connection.is_connected():
+                return None
+
+            jira_integration = JiraIntegration()
+            jira_integration.init_api(
+                config=JiraApiConfig(
+                    access_token=connection.data.get("access_token"),
+                    refresh_token=connection.data.get("refresh_token"),
+                    cloud_id=connection.data.get("cloud_id"),
+                ),
+                connection=connection,
+            )
+            return jira_integration.get_base_jira_url(connection)
+        except Exception:
+            logger.exception("Error getting Jira URL", extra={"organization": organization})
+            return None
+
+    @classmethod
+    def get_resource_url(cls, repository: Repository | None, resource_type: str, args: list):
         if not repository:
-            repository = Repository.objects.select_related("organization", "provider").get(pk=repository_pk)
-            cls._repository_cache[repository_pk] = repository
+            return None
 
         provider_name = repository.provider.name.lower()
 
@@ -362,11 +409,17 @@ class ContextualizationMessageService:
         return None
 
     @classmethod
-    def create_detailed_sources_and_files(cls, organization: Organization, insight: dict):
+    def create_detailed_sources_and_files(
+        cls,
+        organization: Organization,
+        insight: dict,
+        repository: Repository | None = None,
+    ):
         """Transform insight data into a list of sources and files with URLs.
 
         Args:
             insight: Dictionary containing insight data
+            repository: Repository of the insight, looked up by its public id if not given
 
         Returns:
             List of dictionaries with 'url' and 'label' keys
@@ -401,17 +454,17 @@ class ContextualizationMessageService:
         if "repo" in insight:
             # "repo" is the public_id of the repository
             repo_public_id = insight.get("repo")
-
-            # Use cache for decoded IDs to avoid repetitive decoding operations
-            if repo_public_id not in cls._decoded_id_cache:
-                cls._decoded_id_cache[repo_public_id] = DecodePublicIdMixin().decode_id(repo_public_id)
-
-            repo_pk = cls._decoded_id_cache[repo_public_id]
+            if not repository:
+                repository = (
+                    Repository.objects.select_related("organization", "provider")
+                    .filter(organization=organization, pk=DecodePublicIdMixin().decode_id(repo_public_id))
+                    .first()
+                )
 
             if isinstance(insight.get("sources"), list):
                 for commit_hash in insight["sources"]:
                     try:
-                        url = cls.get_resource_url(repo_pk, "commit", [commit_hash])
+                        url = cls.get_resource_url(repository, "commit", [commit_hash])
                     except Exception:
                         logger.exception(
                             "Error determining commit URL",
@@ -433,7 +486,7 @@ class ContextualizationMessageService:
             if isinstance(insight.get("files"), list):
                 for file_details in insight["files"]:
                     try:
-                        url = cls.get_resource_url(repo_pk, "file", [file_details])
+                        url = cls.get_resource_url(repository, "file", [file_details])
                     except Exception:
                         logger.exception(
                             "Error determining file URL",
@@ -507,7 +560,7 @@ class ContextualizationMessageService:
 
         # Add detailed_sources_and_files - this is an expensive operation
         enhanced_insight["detailed_sources_and_files"] = cls.create_detailed_sources_and_files(
-            repo.organization, insight
+            repo.organization, insight, repo
         )
 
         return enhanced_insight
@@ -634,6 +687,10 @@ class ContextualizationMessageService:
 
     @classmethod
     def enhance_jira_quality_summary(cls, organization: Organization, data: dict):
+        # `key` is not a unique field, the first project of each key is used
+        project_names = dict(
+            JiraProject.objects.filter(organization=organization).order_by("-pk").values_list("key", "name")
+        )
         data["all_projects"] = {
             "quality_category": cls.get_jira_quality_category(data["all_projects"]["average_score"]),
             **data["all_projects"],
@@ -641,7 +698,7 @@ class ContextualizationMessageService:
         data["by_project"] = [
             {
                 "quality_category": cls.get_jira_quality_category(project["average_score"]),
-                "project_name": cls.get_jira_project_name(organization, project["project"]),
+                "project_name": project_names.get(project["project"]),
                 **project,
             }
             for project in data.get("by_project", [])
@@ -661,16 +718,6 @@ class ContextualizationMessageService:
         else:
             return "Unknown"
 
-    @staticmethod
-    def get_jira_project_name(organization: Organization, project_key: str):
-        # Getting first here as `key` is not a unique field.
-        jira_project = JiraProject.objects.filter(organization=organization, key=project_key).first()
-
-        if not jira_project:
-            return None
-
-        return jira_project.name
-
     @classmethod
     def format_jira_completeness_score(cls, data: list):
         """
@@ -3,8 +3,11 @@ import csv
 import json
 import logging
 import os
+import pickle
 import shutil
 import textwrap
+import threading
+from concurrent.futures import Future, wait
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from enum import Enum
@@ -12,8 +15,9 @@ from typing import Optional
 
 import pandas as pd
 from django.conf import settings
+from django.db import connection, connections, transaction
 from django.utils import timezone
-from opentelemetry import trace
+from opentelemetry import context, trace
 from pydantic import BaseModel
 from sentry_sdk import capture_exception, capture_message, push_scope
 
@@ -44,6 +48,7 @@ from contextualization.pipelines.pipeline_D_jira_score_completeness.jira_complet
     PipelineDResult,
     run_jira_completeness_score_pipeline,
 )
+from contextualization.pipelines.pipeline_D_jira_score_completeness.schemas import PreviousTicketScore
 from contextualization.utils.custom_exceptions import NoCommitsFoundError
 from mvp.models import (
     DataProviderConnection,
@@ -86,6 +91,73 @@ class ContextualizationResults(BaseModel):
     insights_aggregation: InsightsAggregation | None = None
 
 
+class ContextualizationCheckpoints:
+    """
+    Results of the completed pipelines of a contextualization run, stored on disk until the run is imported,
+    so a run that fails is resumed without executing the completed pipelines again
+    """
+
+    # the run whose pipeline outputs are in the contextualization directory, the only one that can be resumed
+    ACTIVE_RUN_FILENAME = "active_run"
+
+    def __init__(self, directory: str, run_name: str, enabled: bool = True):
+        self.directory = directory
+        self.run_name = run_name
+        self.run_directory = os.path.join(directory, run_name)
+        self.enabled = enabled
+
+    def exists(self) -> bool:
+        return self.enabled and os.path.isdir(self.run_directory) and self.get_active_run() == self.run_name
+
+    def get_active_run(self) -> Optional[str]:
+        path = os.path.join(self.directory, self.ACTIVE_RUN_FILENAME)
+        if not os.path.exists(path):
+            return None
+
+        with open(path) as f:
+            return f.read().strip()
+
+    def start(self):
+        if not self.enabled:
+            return
+
+        self.clear()
+        os.makedirs(self.run_directory, exist_ok=True)
+        path = os.path.join(self.directory, self.ACTIVE_RUN_FILENAME)
+        with open(f"{path}.tmp", "w") as f:
+            f.write(self.run_name)
+        os.replace(f"{path}.tmp", path)
+
+        # the pipeline outputs the checkpoints of other runs depend on are cleaned, so they can't be resumed anymore
+        # (the organization lock keeps the runs of the same organization from overlapping)
+        for entry in os.scandir(self.directory):
+            if entry.is_dir() and entry.name != self.run_name:
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+    def run(self, pipeline: str, function):
+        """
+        Returns the result of function, executing it only if the pipeline has no checkpoint
+        """
+        if not self.enabled:
+            return function()
+
+        path = os.path.join(self.run_directory, f"{pipeline}.pickle")
+        if os.path.exists(path):
+            logger.info(f"Resuming pipeline {pipeline} from its checkpoint", extra={"checkpoint": path})
+            with open(path, "rb") as f:
+                return pickle.load(f)
+
+        result = function()
+        with open(f"{path}.tmp", "wb") as f:
+            pickle.dump(result, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(f"{path}.tmp", path)
+        return result
+
+    def clear(self):
+        if self.enabled and os.path.isdir(self.run_directory):
+            shutil.rmtree(self.run_directory, ignore_errors=True)
+
+
 class ContextualizationService:
     DATA_DIR_NAME = "__contextualization"
     # always at 06:00 UTC
@@ -95,6 +167,9 @@ class ContextualizationService:
     DATE_SLACK_FORMAT = "%Y-%m-%d %H:%M:%S"
 
     DEFAULT_DAY_INTERVAL = ContextualizationDayInterval.TWO_WEEKS
+    CHECKPOINTS_DIR_NAME = "checkpoints"
+    # first key of the database advisory lock of an organization, the second one is the organization id
+    ORGANIZATION_LOCK_KEY = 7301
     DAY_INTERVAL_TWO_WEEKS_FOLDER = "__two_weeks"
     DAY_INTERVAL_ONE_WEEK_FOLDER = "__one_week"
     DAY_INTERVAL_ONE_DAY_FOLDER = "__one_day"
@@ -230,6 +305,7 @@ class ContextualizationService:
         import_only=False,
         dry_run=False,
     ) -> ContextualizationResults | None:
+        pipeline_d_future = None
         try:
             pipelines = pipelines or cls.ALL_PIPELINES
             contextualization_results = ContextualizationResults()
@@ -251,12 +327,22 @@ class ContextualizationService:
                     },
                 )
 
-                if not dry_run and not import_only:
+                start_date, end_date = cls.get_start_and_end_date(day_interval)
+                checkpoints = cls.get_checkpoints(
+                    organization, day_interval, end_date, by_group, enabled=not dry_run and not import_only
+                )
+                resume = checkpoints.exists()
+                if resume:
+                    logger.info(
+                        "Resuming the previous contextualization run from its checkpoints",
+                        extra={"organization": organization.name, "day_interval": day_interval.value},
+                    )
+                elif not dry_run and not import_only:
                     cls.clean_previous_data(organization, pipelines=pipelines)
 
                 data_dir = cls.create_contextualization_directory(organization)
-
-                start_date, end_date = cls.get_start_and_end_date(day_interval)
+                if not resume:
+                    checkpoints.start()
                 jira_params = None
                 repo_group_git_repos, repo_group_jira_projects = None, None
                 if by_group:
@@ -278,23 +364,52 @@ class ContextualizationService:
 
                 copy_files = {}
 
+                pipeline_d_output_path = os.path.join(
+                    data_dir,
+                    cls.SCRIPT_OUTPUT_DIR,
+                    cls.SCRIPT_PIPLINE_D_SUFFIX_OUTPUT_DIR,
+                )
+                if cls.PIPELINE_D in pipelines and not import_only:
+                    jira_params = cls.get_jira_params(
+                        organization=organization,
+                        start_date=start_date.strftime(cls.DATE_FORMAT),
+                        end_date=end_date.strftime(cls.DATE_FORMAT),
+                    )
+                    if jira_params:
+                        # pipeline D only depends on Jira, so it runs while the git pipelines do
+                        pipeline_d_future = cls.start_in_thread(
+                            checkpoints.run,
+                            cls.PIPELINE_D,
+                            lambda: cls.execute_pipeline_d(
+                                jira_params=jira_params,
+                                output_path=pipeline_d_output_path,
+                                organization=organization,
+                                dry_run=dry_run,
+                            ),
+                        )
+
                 if cls.PIPELINE_A in pipelines:
                     if not import_only:
-                        pipeline_a_result = cls.execute_pipeline_a(
-                            data_dir,
-                            start_date,
-                            end_date,
-                            dry_run=dry_run,
-                        )
-                        if by_group:
-                            # if by group then execute again but generate insights separated by group
+
+                        def execute_pipeline_a():
                             pipeline_a_result = cls.execute_pipeline_a(
                                 data_dir,
                                 start_date,
                                 end_date,
-                                repo_group_git_repos=repo_group_git_repos,
                                 dry_run=dry_run,
                             )
+                            if by_group:
+                                # if by group then execute again but generate insights separated by group
+                                pipeline_a_result = cls.execute_pipeline_a(
+                                    data_dir,
+                                    start_date,
+                                    end_date,
+                                    repo_group_git_repos=repo_group_git_repos,
+                                    dry_run=dry_run,
+                                )
+                            return pipeline_a_result
+
+                        pipeline_a_result = checkpoints.run(cls.PIPELINE_A, execute_pipeline_a)
 
                         contextualization_results.pipeline_a_result = pipeline_a_result
                         if not pipeline_a_result.total_code_commit_count:
@@ -314,14 +429,17 @@ class ContextualizationService:
                         end_date=end_date.strftime(cls.DATE_FORMAT),
                     )
                     if not import_only and repo_group_git_repos is not None:
-                        pipeline_b_and_c_result = cls.execute_pipeline_b_and_c(
-                            data_dir,
-                            organization=organization,
-                            summary_data_dfs=contextualization_results.pipeline_a_result.summary_data_dfs,
-                            repo_group_git_repos=repo_group_git_repos,
-                            repo_group_jira_projects=repo_group_jira_projects,
-                            jira_params=jira_params,
-                            dry_run=dry_run,
+                        pipeline_b_and_c_result = checkpoints.run(
+                            cls.PIPELINE_BC,
+                            lambda: cls.execute_pipeline_b_and_c(
+                                data_dir,
+                                organization=organization,
+                                summary_data_dfs=contextualization_results.pipeline_a_result.summary_data_dfs,
+                                repo_group_git_repos=repo_group_git_repos,
+                                repo_group_jira_projects=repo_group_jira_projects,
+                                jira_params=jira_params,
+                                dry_run=dry_run,
+                            ),
                         )
                         contextualization_results.pipeline_b_and_c_result = pipeline_b_and_c_result
 
@@ -329,14 +447,23 @@ class ContextualizationService:
                     copy_files.update(cls.COPY_FILES_PIPELINE_ANOMALY_INSIGHTS)
 
                     if not import_only:
-                        combined_insights = cls.execute_pipeline_anomaly_insights(
-                            data_dir, contextualization_results.pipeline_a_result.summary_data_dfs, dry_run=dry_run
-                        )
-                        contextualization_results.pipeline_anomaly_insights_result = combined_insights
 
-                        if not dry_run and day_interval == cls.DEFAULT_DAY_INTERVAL:
-                            cls.post_combined_anomaly_insights_email_to_slack(organization, day_interval=day_interval)
-                            cls.post_combined_anomaly_insights_file_to_slack(organization, day_interval=day_interval)
+                        def execute_pipeline_anomaly_insights():
+                            combined_insights = cls.execute_pipeline_anomaly_insights(
+                                data_dir, contextualization_results.pipeline_a_result.summary_data_dfs, dry_run=dry_run
+                            )
+                            if not dry_run and day_interval == cls.DEFAULT_DAY_INTERVAL:
+                                cls.post_combined_anomaly_insights_email_to_slack(
+                                    organization, day_interval=day_interval
+                                )
+                                cls.post_combined_anomaly_insights_file_to_slack(
+                                    organization, day_interval=day_interval
+                                )
+                            return combined_insights
+
+                        contextualization_results.pipeline_anomaly_insights_result = checkpoints.run(
+                            cls.PIPELINE_ANOMALY_INSIGHTS, execute_pipeline_anomaly_insights
+                        )
 
                 if cls.PIPELINE_D in pipelines:
                     jira_params = jira_params or cls.get_jira_params(
@@ -347,19 +474,8 @@ class ContextualizationService:
                     if jira_params:
                         copy_files.update(cls.COPY_FILES_PIPELINE_D)
 
-                        output_path = os.path.join(
-                            data_dir,
-                            cls.SCRIPT_OUTPUT_DIR,
-                            cls.SCRIPT_PIPLINE_D_SUFFIX_OUTPUT_DIR,
-                        )
-
                         if not import_only:
-                            pipeline_d_result = cls.execute_pipeline_d(
-                                jira_params=jira_params,
-                                output_path=output_path,
-                                dry_run=dry_run,
-                            )
-                            contextualization_results.pipeline_d_result = pipeline_d_result
+                            contextualization_results.pipeline_d_result = pipeline_d_future.result()
                     else:
                         logger.info(
                             "Jira not connected, skipping pipeline d",
@@ -382,10 +498,13 @@ class ContextualizationService:
                         )
 
                         if not import_only:
-                            jira_combined_insights = cls.execute_pipeline_jira_anomaly_insights(
-                                output_path=jira_anomaly_insights_output_path,
-                                contextualization_results=contextualization_results,
-                                dry_run=dry_run,
+                            jira_combined_insights = checkpoints.run(
+                                cls.PIPELINE_JIRA_ANOMALY_INSIGHTS,
+                                lambda: cls.execute_pipeline_jira_anomaly_insights(
+                                    output_path=jira_anomaly_insights_output_path,
+                                    contextualization_results=contextualization_results,
+                                    dry_run=dry_run,
+                                ),
                             )
                             contextualization_results.pipeline_jira_anomaly_insights_result = jira_combined_insights
                     else:
@@ -415,11 +534,14 @@ class ContextualizationService:
                     )
 
                     if not import_only:
-                        insights_aggregation = cls.execute_pipeline_insights_aggregation(
-                            insights_aggregation_input_git_anomalies_file,
-                            insights_aggregation_input_jira_anomalies_file,
-                            contextualization_results,
-                            dry_run=dry_run,
+                        insights_aggregation = checkpoints.run(
+                            cls.PIPELINE_INSIGHTS_AGGREGATION,
+                            lambda: cls.execute_pipeline_insights_aggregation(
+                                insights_aggregation_input_git_anomalies_file,
+                                insights_aggregation_input_jira_anomalies_file,
+                                contextualization_results,
+                                dry_run=dry_run,
+                            ),
                         )
                         contextualization_results.insights_aggregation = insights_aggregation
 
@@ -436,6 +558,7 @@ class ContextualizationService:
                         organization=organization,
                         by_group=by_group,
                     )
+                    cls.save_output_files(organization, day_interval, day_interval_dir)
 
                     if day_interval == cls.DEFAULT_DAY_INTERVAL:
                         justification_path = os.path.join(day_interval_dir, cls.OUTPUT_FILENAME_JUSTIFICATION)
@@ -449,6 +572,10 @@ class ContextualizationService:
                 extra={"organization": organization.name},
             )
             return None
+        finally:
+            if pipeline_d_future:
+                # a pipeline D still running is waited for, its checkpoint is kept if the run failed
+                wait([pipeline_d_future])
 
     @staticmethod
     def get_start_and_end_date(day_interval: ContextualizationDayInterval):
@@ -456,6 +583,58 @@ class ContextualizationService:
         start_date = end_date - timedelta(days=day_interval.value)
         return start_date, end_date
 
+    @classmethod
+    def get_checkpoints(
+        cls,
+        organization: Organization,
+        day_interval: ContextualizationDayInterval,
+        end_date: datetime,
+        by_group=False,
+        enabled=True,
+    ) -> ContextualizationCheckpoints:
+        directory = os.path.join(cls.get_contextualization_directory(organization), cls.CHECKPOINTS_DIR_NAME)
+        run_name = f"{day_interval.value}_{end_date.strftime(cls.DATE_FORMAT)}_{'groups' if by_group else 'all'}"
+        return ContextualizationCheckpoints(directory, run_name, enabled=enabled)
+
+    @classmethod
+    @contextmanager
+    def organization_lock(cls, organization: Organization):
+        """
+        Yields whether the database advisory lock of the organization was acquired,
+        so the same organization isn't contextualized by two runs at the same time
+        """
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_lock(%s, %s)", [cls.ORGANIZATION_LOCK_KEY, organization.id])
+            acquired = cursor.fetchone()[0]
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT pg_advisory_unlock(%s, %s)", [cls.ORGANIZATION_LOCK_KEY, organization.id])
+
+    @staticmethod
+    def start_in_thread(function, *args) -> Future:
+        """
+        Calls function(*args) in a new thread within the current trace, returning the future of its result
+        """
+        future = Future()
+        parent_context = context.get_current()
+
+        def run():
+            token = context.attach(parent_context)
+            try:
+                future.set_result(function(*args))
+            except Exception as error:
+                future.set_exception(error)
+            finally:
+                context.detach(token)
+                connections.close_all()
+
+        future.set_running_or_notify_cancel()
+        threading.Thread(target=run).start()
+        return future
+
     @classmethod
     def check_commits_exist_for_pipeline_a(
         cls,
@@ -780,7 +959,9 @@ class ContextualizationService:
             )
 
     @classmethod
-    def execute_pipeline_d(cls, jira_params: dict, output_path: str, dry_run=False) -> PipelineDResult | None:
+    def execute_pipeline_d(
+        cls, jira_params: dict, output_path: str, organization: Organization | None = None, dry_run=False
+    ) -> PipelineDResult | None:
         if not jira_params:
             logger.info("Jira not connected, skipping pipeline d")
             return None
@@ -801,10 +982,39 @@ class ContextualizationService:
                 jira_access_token=jira_params.get("access_token"),
                 start_date=jira_params.get("start_date"),
                 end_date=jira_params.get("end_date"),
+                previous_scores=cls.get_previous_ticket_scores(organization) if organization else None,
             )
 
         return result
 
+    @classmethod
+    def get_previous_ticket_scores(cls, organization: Organization) -> dict[str, PreviousTicketScore]:
+        """
+        The latest score of each ticket of the organization, by issue key
+        """
+        # Import models inside the function to avoid circular import
+        from compass.contextualization.models import TicketCompleteness
+
+        tickets = TicketCompleteness.latest_ticket_data(organization).values(
+            "ticket_id",
+            "completeness_hash",
+            "completeness_score",
+            "raw_completeness_score_evaluation",
+            "completeness_score_explanation",
+            "llm_category",
+        )
+        return {
+            ticket["ticket_id"]: PreviousTicketScore(
+                completeness_hash=ticket["completeness_hash"],
+                jira_completeness_score=ticket["completeness_score"],
+                evaluation_jira_completeness_score=ticket["raw_completeness_score_evaluation"],
+                explanation_jira_completeness_score=ticket["completeness_score_explanation"],
+                llm_category=ticket["llm_category"],
+            )
+            for ticket in tickets
+            if ticket["completeness_hash"]
+        }
+
     @classmethod
     def execute_pipeline_jira_anomaly_insights(
         cls, output_path: str, contextualization_results: ContextualizationResults, dry_run=False
@@ -903,26 +1113,20 @@ class ContextualizationService:
         organization: Organization,
         day_interval: ContextualizationDayInterval = DEFAULT_DAY_INTERVAL,
     ):
-        day_interval_dir = cls.get_day_interval_directory(organization, day_interval)
-        path = os.path.join(
-            day_interval_dir,
-            cls.OUTPUT_FILENAME_COMBINED_ANOMALY_INSIGHTS,
-        )
-        if not os.path.exists(path):
+        data, _ = cls.load_output_data(organization, cls.OUTPUT_FILENAME_COMBINED_ANOMALY_INSIGHTS, day_interval)
+        if not data:
             logger.error(
-                f"Combined anomalies insights file not found",
-                extra={"organization": organization.name, "path": path},
+                "Combined anomalies insights output not found",
+                extra={"organization": organization.name, "day_interval": day_interval.value},
             )
             with push_scope() as scope:
                 scope.set_extra("organization", organization.name)
-                scope.set_extra("combined_anomaly_script_output_path", path)
+                scope.set_extra("day_interval", day_interval.value)
                 traceback_on_debug()
-                capture_message("Combined anomalies insights file not found")
-
+                capture_message("Combined anomalies insights output not found")
             return None
 
-        with open(path) as f:
-            return json.load(f)
+        return data
 
     @classmethod
     def get_organizations(
@@ -1227,6 +1431,54 @@ class ContextualizationService:
             filename,
         )
 
+    @classmethod
+    def save_output_files(
+        cls,
+        organization: Organization,
+        day_interval: ContextualizationDayInterval,
+        day_interval_dir: str,
+    ):
+        """
+        Stores the output files of the day interval directory in the database, replacing the previous outputs
+        """
+        # Import models inside the function to avoid circular import
+        from compass.contextualization.models import ContextualizationOutput
+
+        outputs = []
+        for filename in sorted(os.listdir(day_interval_dir)):
+            file_path = os.path.join(day_interval_dir, filename)
+            if not filename.endswith(".json") or not os.path.isfile(file_path):
+                continue
+
+            data, file_timestamp = cls.load_output_file(organization, file_path)
+            if not file_timestamp:
+                continue
+
+            outputs.append(
+                ContextualizationOutput(
+                    organization=organization,
+                    day_interval=day_interval.value,
+                    filename=filename,
+                    data=data,
+                    generated_at=datetime.fromtimestamp(file_timestamp, tz=timezone.utc),
+                )
+            )
+
+        logger.info(
+            f"Saving {len(outputs)} output files of {day_interval_dir}",
+            extra={"organization": organization.name},
+        )
+        with transaction.atomic():
+            ContextualizationOutput.objects.filter(organization=organization, day_interval=day_interval.value).exclude(
+                filename__in=[output.filename for output in outputs]
+            ).delete()
+            ContextualizationOutput.objects.bulk_create(
+                outputs,
+                update_conflicts=True,
+                unique_fields=["organization", "day_interval", "filename"],
+                update_fields=["data", "generated_at", "updated_at"],
+            )
+
     @classmethod
     def load_output_data(
         cls,
@@ -1234,15 +1486,42 @@ class ContextualizationService:
         filename: str,
         day_interval: ContextualizationDayInterval = DEFAULT_DAY_INTERVAL,
     ):
-        file_path = cls.get_output_file_path(organization, filename, day_interval)
+        return cls.load_outputs_data(organization, [filename], day_interval)[filename]
+
+    @classmethod
+    def load_outputs_data(
+        cls,
+        organization: Organization,
+        filenames: list[str],
+        day_interval: ContextualizationDayInterval = DEFAULT_DAY_INTERVAL,
+    ) -> dict[str, tuple[dict, float]]:
+        """
+        The data and timestamp of each of the outputs in a single query, empty data and 0 for the missing ones
+        """
+        # Import models inside the function to avoid circular import
+        from compass.contextualization.models import ContextualizationOutput
+
+        outputs = {filename: ({}, 0) for filename in filenames}
+        for filename, data, generated_at in ContextualizationOutput.objects.filter(
+            organization=organization,
+            day_interval=day_interval.value,
+            filename__in=filenames,
+        ).values_list("filename", "data", "generated_at"):
+            outputs[filename] = (data, generated_at.timestamp())
+
+        return outputs
+
+    @classmethod
+    def load_output_file(cls, organization: Organization, file_path: str):
         if not os.path.exists(file_path):
             return {}, 0
 
         try:
-            data = json.load(open(file_path))
+            with open(file_path) as f:
+                data = json.load(f)
             file_timestamp = os.path.getmtime(file_path)
             return data, file_timestamp
-        except FileNotFoundError as error:
+        except (FileNotFoundError, json.JSONDecodeError) as error:
             logger.exception(
                 "Error loading output data",
                 extra={"file_path": file_path, "organization": organization.name},
@@ -1261,11 +1540,19 @@ class ContextualizationService:
         filename: str,
         day_interval: ContextualizationDayInterval = DEFAULT_DAY_INTERVAL,
     ):
-        file_path = cls.get_output_file_path(organization, filename, day_interval)
-        if not os.path.exists(file_path):
-            return 0
-
-        return os.path.getmtime(file_path)
+        # Import models inside the function to avoid circular import
+        from compass.contextualization.models import ContextualizationOutput
+
+        generated_at = (
+            ContextualizationOutput.objects.filter(
+                organization=organization,
+                day_interval=day_interval.value,
+                filename=filename,
+            )
+            .values_list("generated_at", flat=True)
+            .first()
+        )
+        return generated_at.timestamp() if generated_at else 0
 
     @classmethod
     def load_output_csv(
@@ -24,6 +24,7 @@ class EmailService:
         auth_password=None,
         connection=None,
         headers: dict[str, Any] | None = None,
+        batch_size: int | None = None,
     ) -> int:
         """
         based on django.core.mail.send_mass_mail
@@ -37,7 +38,11 @@ class EmailService:
         If auth_user is None, the EMAIL_HOST_USER setting is used.
         If auth_password is None, the EMAIL_HOST_PASSWORD setting is used.
 
+        Messages are sent in batches of batch_size (EMAIL_BATCH_SIZE setting by default)
+        through the same connection, which is kept open between batches.
         """
+        batch_size = batch_size or settings.EMAIL_BATCH_SIZE
+        opened_connection = connection is None
         connection = connection or get_connection(
             username=auth_user, password=auth_password, fail_silently=fail_silently
         )
@@ -48,7 +53,17 @@ class EmailService:
                 message.attach_alternative(message_html, "text/html")
             messages.append(message)
 
-        return connection.send_messages(messages)
+        if opened_connection:
+            connection.open()
+
+        try:
+            num_sent = 0
+            for index in range(0, len(messages), batch_size):
+                num_sent += connection.send_messages(messages[index : index + batch_size]) or 0
+            return num_sent
+        finally:
+            if opened_connection:
+                connection.close()
 
     @staticmethod
     def _send_emails(
@@ -161,7 +176,7 @@ class EmailService:
         )
 
     @staticmethod
-    def send_analysis_started_email(organization):
+    def send_analysis_started_email(organization, connection=None):
         if not settings.SEND_ANALYSIS_STARTED_EMAIL_ACTIVE:
             logger.info("Skipping sending analysis started email")
             return False
@@ -198,6 +213,7 @@ class EmailService:
                     for email_to in email_addresses
                 ],
                 fail_silently=False,
+                connection=connection,
             )
 
         except Exception as e:
@@ -214,7 +230,7 @@ class EmailService:
             return delivered_messages > 0
 
     @staticmethod
-    def send_import_done_email(organization):
+    def send_import_done_email(organization, connection=None):
         if not settings.SEND_IMPORT_DONE_EMAIL_ACTIVE:
             logger.info("Skipping sending import done email")
             return False
@@ -250,6 +266,7 @@ class EmailService:
                     for email_to in email_addresses
                 ],
                 fail_silently=False,
+                connection=connection,
             )
 
         except Exception as e:
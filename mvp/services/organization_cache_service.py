@@ -0,0 +1,75 @@
+import logging
+import time
+from typing import Any, Callable
+
+from django.core.cache import cache
+
+from mvp.models import Organization
+
+logger = logging.getLogger(__name__)
+
+
+class OrganizationCacheService:
+    """
+    Caches data of an organization that only changes when new data is imported or settings are edited.
+
+    Keys include the data version of the organization, which is bumped whenever its data changes.
+    Stale entries are never read again, they just expire or are evicted.
+
+    The data version is kept in the cache too. It's a timestamp instead of a counter so that, if it
+    is evicted or cleared, the new version can never match older entries.
+    """
+
+    CACHE_KEY_TEMPLATE = "org_{organization_id}_v{data_version}_{name}"
+    CACHE_KEY_DATA_VERSION_TEMPLATE = "org_data_version_{organization_id}"
+    CACHE_TIMEOUT = 60 * 60 * 24  # 1 day
+
+    @classmethod
+    def get_or_set(
+        cls,
+        organization: Organization,
+        name: str,
+        default: Callable[[], Any],
+        timeout: int = CACHE_TIMEOUT,
+    ) -> Any:
+        cache_key = cls.get_cache_key(organization, name)
+        return cache.get_or_set(cache_key, default, timeout)
+
+    @classmethod
+    def set(
+        cls,
+        organization: Organization,
+        name: str,
+        value: Any,
+        timeout: int = CACHE_TIMEOUT,
+    ):
+        cache.set(cls.get_cache_key(organization, name), value, timeout)
+
+    @classmethod
+    def get_cache_key(cls, organization: Organization, name: str) -> str:
+        return cls.CACHE_KEY_TEMPLATE.format(
+            organization_id=organization.id,
+            data_version=cls.get_data_version(organization),
+            name=name,
+        )
+
+    @classmethod
+    def get_data_version(cls, organization: Organization) -> int:
+        cache_key = cls.get_data_version_cache_key(organization)
+        data_version = cache.get(cache_key)
+        if data_version is None:
+            data_version = time.time_ns()
+            if not cache.add(cache_key, data_version, None):
+                # another process added it meanwhile
+                data_version = cache.get(cache_key, data_version)
+
+        return data_version
+
+    @classmethod
+    def bump_data_version(cls, organization: Organization):
+        cache.set(cls.get_data_version_cache_key(organization), time.time_ns(), None)
+        logger.info(f'Bumped cached data version for "{organization}"')
+
+    @classmethod
+    def get_data_version_cache_key(cls, organization: Organization) -> str:
+        return cls.CACHE_KEY_DATA_VERSION_TEMPLATE.format(organization_id=organization.id)
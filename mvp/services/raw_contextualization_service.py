@@ -20,9 +20,15 @@ class RawContextualizationService:
         organization: Organization,
         day_interval: ContextualizationDayInterval,
     ) -> dict:
+        output_filenames = cls.get_output_filenames()
+        # all the outputs are loaded at once
+        outputs = ContextualizationService.load_outputs_data(
+            organization,
+            [filename for filename, _ in output_filenames],
+            day_interval=day_interval,
+        )
         output_data = {
-            filename: cls.get_output_data(filename, organization, day_interval, pipeline)
-            for filename, pipeline in cls.get_output_filenames()
+            filename: cls.get_output_data(*outputs[filename], pipeline) for filename, pipeline in output_filenames
         }
         updated_at = max([output["updated_at"] for output in output_data.values() if output["updated_at"] is not None])
 
@@ -41,18 +47,7 @@ class RawContextualizationService:
         ]
 
     @classmethod
-    def get_output_data(
-        cls,
-        filename: str,
-        organization: Organization,
-        day_interval: ContextualizationDayInterval,
-        pipeline: str,
-    ):
-        data, updated_at = ContextualizationService.load_output_data(
-            organization,
-            filename,
-            day_interval=day_interval,
-        )
+    def get_output_data(cls, data: dict, updated_at: float, pipeline: str):
         parsed_updated_at = (
             datetime.fromtimestamp(updated_at, tz=timezone.utc).strftime(cls.DATE_FORMAT) if updated_at else None
         )
@@ -0,0 +1,123 @@
+import logging
+from datetime import date, timedelta
+from typing import Dict, Optional
+
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from mvp.models import (
+    Organization,
+    Repository,
+    RepositoryCommit,
+    RepositoryCommitStatusChoices,
+    RepositoryDailyComposition,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RepositoryDailyCompositionService:
+    """
+    Maintains the RepositoryDailyComposition rollup used by AICompositionService.
+
+    Each repository has one row per day from its first analyzed commit until today.
+    The values of a day are the ones of the last analyzed commit of that day, or the
+    previous day's values if there were no commits.
+    """
+
+    FIELDS_LINES_NAMES = [
+        "code_num_lines",
+        "code_ai_num_lines",
+        "code_ai_blended_num_lines",
+    ]
+
+    BATCH_SIZE = 1000
+
+    def __init__(self, organization: Organization):
+        self.organization = organization
+
+    def update_all(self, since_by_repository: Optional[Dict[int, date]] = None):
+        """
+        Brings the rollup of every repository of the organization up to date.
+
+        By default, a repository is recalculated from its last stored day, which picks up new commits.
+        since_by_repository allows recalculating from an older date, e.g. when old commits are imported.
+        """
+        since_by_repository = since_by_repository or {}
+
+        last_dates = dict(
+            RepositoryDailyComposition.objects.filter(repository__organization=self.organization)
+            .values("repository_id")
+            .annotate(last_date=Max("date"))
+            .values_list("repository_id", "last_date")
+        )
+
+        for repository in self.organization.repository_set.all():
+            last_date = last_dates.get(repository.pk)
+            if not last_date:
+                # not built yet, calculate from the beginning
+                since = None
+            else:
+                since = min(last_date, since_by_repository.get(repository.pk, last_date))
+
+            self.update_repository(repository, since=since)
+
+    def update_repository(self, repository: Repository, since: Optional[date] = None):
+        until = timezone.now().date()
+
+        previous_values = self.get_previous_values(repository, since) if since else None
+        values_by_date = self.get_values_by_date(repository, since)
+
+        if previous_values is None and not values_by_date:
+            RepositoryDailyComposition.objects.filter(repository=repository).delete()
+            return
+
+        start_date = since if previous_values is not None else min(values_by_date.keys())
+
+        rows = []
+        values = previous_values
+        current_date = start_date
+        while current_date <= until:
+            values = values_by_date.get(current_date, values)
+            rows.append(RepositoryDailyComposition(repository=repository, date=current_date, **values))
+            current_date += timedelta(days=1)
+
+        with transaction.atomic():
+            qs = RepositoryDailyComposition.objects.filter(repository=repository)
+            if since:
+                qs = qs.filter(date__gte=since)
+            qs.delete()
+            RepositoryDailyComposition.objects.bulk_create(rows, batch_size=self.BATCH_SIZE)
+
+        logger.info(f"Updated {len(rows)} daily composition rows for repository '{repository.full_name()}'")
+
+    def get_values_by_date(self, repository: Repository, since: Optional[date] = None) -> Dict[date, dict]:
+        """
+        There may be more than one commit per day, we keep the last one.
+        """
+        qs = self.get_commits_queryset(repository).order_by("date_time")
+        if since:
+            qs = qs.filter(date_time__date__gte=since)
+
+        values_by_date = {}
+        for commit in qs.values(*self.FIELDS_LINES_NAMES, "date_time"):
+            values_by_date[commit["date_time"].date()] = {field: commit[field] for field in self.FIELDS_LINES_NAMES}
+
+        return values_by_date
+
+    def get_previous_values(self, repository: Repository, since: date) -> Optional[dict]:
+        return (
+            self.get_commits_queryset(repository)
+            .filter(date_time__date__lt=since)
+            .order_by("-date_time")
+            .values(*self.FIELDS_LINES_NAMES)
+            .first()
+        )
+
+    def get_commits_queryset(self, repository: Repository):
+        return RepositoryCommit.objects.filter(
+            repository=repository,
+            status=RepositoryCommitStatusChoices.ANALYZED,
+            pull_requests__isnull=True,
+        )
@@ -77,13 +77,41 @@ class ROIService:
         3. Obtain the overall percentage
         """
         repositories = repositories or group.repository_set.all()
-        until = get_tz_date(datetime.utcnow().date())
-        since = get_tz_date(until - timedelta(days=cls.OVERALL_PERCENTAGE_PERIOD_DAYS))
+        since, until = cls.get_overall_percentage_dates()
 
         service = AICompositionService(organization)
         daily_data = service.get_daily_num_lines(since, until, repositories)
 
-        deltas = {name: sum(daily_data[name]) for name in AICompositionService.SERIES_DELTA}
+        return cls.calculate_overall_percentage(daily_data)
+
+    @classmethod
+    def get_overall_percentages(
+        cls,
+        organization: Organization,
+        repositories_by_group: dict[int, list[Repository]],
+    ) -> dict[int, tuple[float, dict]]:
+        """
+        Same as get_overall_percentage for several groups, fetching the data only once.
+        """
+        since, until = cls.get_overall_percentage_dates()
+
+        service = AICompositionService(organization)
+        daily_data_by_group = service.get_daily_num_lines_by_group(since, until, repositories_by_group)
+
+        return {
+            group_id: cls.calculate_overall_percentage(daily_data)
+            for group_id, daily_data in daily_data_by_group.items()
+        }
+
+    @classmethod
+    def get_overall_percentage_dates(cls) -> (datetime, datetime):
+        until = get_tz_date(datetime.utcnow().date())
+        since = get_tz_date(until - timedelta(days=cls.OVERALL_PERCENTAGE_PERIOD_DAYS))
+        return since, until
+
+    @classmethod
+    def calculate_overall_percentage(cls, daily_data: dict) -> (float, dict):
+        deltas = {name: sum(daily_data.get(name, [])) for name in AICompositionService.SERIES_DELTA}
 
         overall_delta = deltas[AICompositionService.SERIES_DELTA_NAME_OVERALL]
         total_delta = deltas[AICompositionService.SERIES_DELTA_NAME_TOTAL]
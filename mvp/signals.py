@@ -1,10 +1,52 @@
 import posthog
 from django.contrib.auth.signals import user_logged_in
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from mvp.models import DataProviderConnection, Organization, RepositoryGroup, Rule, RuleCondition, SystemMessage
+from mvp.services import OrganizationCacheService
+from mvp.services.contextualization_message_service import ContextualizationMessageService
+
 
 @receiver(user_logged_in)
 def user_logged_in_handler(sender, request, user, **kwargs):
     request.reset_cookies = True
 
     posthog.capture(user.email, event="login_staff" if user.is_staff else "login_user")
+
+
+def bump_organization_data_version(organization):
+    if not organization:
+        return
+
+    # wait for the transaction so that the data is not cached again before it's committed
+    transaction.on_commit(lambda: OrganizationCacheService.bump_data_version(organization))
+
+
+@receiver([post_save, post_delete], sender=Organization)
+def organization_changed_handler(sender, instance, **kwargs):
+    bump_organization_data_version(instance)
+
+
+@receiver([post_save, post_delete], sender=RepositoryGroup)
+@receiver([post_save, post_delete], sender=Rule)
+def organization_settings_changed_handler(sender, instance, **kwargs):
+    bump_organization_data_version(instance.organization)
+
+
+@receiver([post_save, post_delete], sender=RuleCondition)
+def rule_condition_changed_handler(sender, instance, **kwargs):
+    bump_organization_data_version(instance.rule.organization)
+
+
+@receiver([post_save, post_delete], sender=DataProviderConnection)
+def connection_changed_handler(sender, instance, **kwargs):
+    organization_id = instance.organization_id
+    transaction.on_commit(lambda: ContextualizationMessageService.clear_jira_base_url_cache(organization_id))
+
+
+@receiver([post_save, post_delete], sender=SystemMessage)
+def system_message_changed_handler(sender, instance, **kwargs):
+    transaction.on_commit(lambda: cache.delete(SystemMessage.CACHE_KEY_NOT_EXPIRED))
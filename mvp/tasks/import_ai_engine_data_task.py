@@ -1,7 +1,7 @@
 import json
 import logging
 import os
-from datetime import datetime
+from datetime import date, datetime
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
@@ -27,8 +27,11 @@ from mvp.models import (
     RepositoryFileChunkBlame,
     RepositoryFileLanguageChoices,
 )
-from mvp.services import FuzzyMatchingService, GroupsAICodeService
+from mvp.services import FuzzyMatchingService, GroupsAICodeService, OrganizationCacheService
 from mvp.services.email_service import EmailService
+from mvp.services.repository_daily_composition_service import (
+    RepositoryDailyCompositionService,
+)
 from mvp.tasks import ExportGBOMTask
 from mvp.utils import process_csv_file, traceback_on_debug
 
@@ -50,6 +53,8 @@ class ImportAIEngineDataTask:
         self._files = {}
         self._attestations = {}
         self._author_stats: dict[str, AuthorStat] = {}
+        # earliest commit date changed per repository, to refresh the daily composition rollup from there
+        self._composition_since: dict[int, date] = {}
 
         self.gbom = ExportGBOMTask()
 
@@ -85,7 +90,12 @@ class ImportAIEngineDataTask:
     def update_organization(self, organization):
         FuzzyMatchingService.set_organization_linked_authors(organization)
         GroupsAICodeService(organization).update_all()
+        self.update_daily_composition(organization)
         self.gbom.generate_precomputed_gbom(organization, force=True)
+        OrganizationCacheService.bump_data_version(organization)
+
+    def update_daily_composition(self, organization):
+        RepositoryDailyCompositionService(organization).update_all(self._composition_since)
 
     def process_repository(self, repository, erase=False, commit_sha=None):
         # Manually imported repositories don't use a git provider.
@@ -181,12 +191,15 @@ class ImportAIEngineDataTask:
             if pull_request:
                 self.set_not_evaluated_files_from_metadata(commit, self._files)
                 self.update_pull_request_analysis(pull_request, commit, self._files)
-            elif update_repository:
-                self.update_repository_analysis(repository, commit)
-                self.update_repository_authors_analysis(repository, self._authors)
+            else:
+                self.track_composition_change(commit)
 
-                # Now that we have the new data, we can delete the previous GBOM
-                self.gbom.delete_precomputed_gbom(repository.organization)
+                if update_repository:
+                    self.update_repository_analysis(repository, commit)
+                    self.update_repository_authors_analysis(repository, self._authors)
+
+                    # Now that we have the new data, we can delete the previous GBOM
+                    self.gbom.delete_precomputed_gbom(repository.organization)
 
             AuthorStat.objects.bulk_create(
                 self._author_stats.values(),
@@ -212,8 +225,16 @@ class ImportAIEngineDataTask:
             logger.exception("Could not process CSV")
             commit.status = RepositoryCommitStatusChoices.FAILURE
             commit.save()
+            if not pull_request:
+                self.track_composition_change(commit)
             return False
 
+    def track_composition_change(self, commit):
+        repository_id = commit.repository_id
+        commit_date = commit.date_time.date()
+        if repository_id not in self._composition_since or commit_date < self._composition_since[repository_id]:
+            self._composition_since[repository_id] = commit_date
+
     def update_files_analysis(self, files):
         for file in files.values():
             self.set_ai_percentages(file)
@@ -11,6 +11,7 @@ from django.utils import timezone
 from compass.dashboard.models import GitDiffContext, GitDiffRepositoryGroupInsight
 from mvp.models import Organization
 from mvp.services.contextualization_service import ContextualizationService
+from mvp.services.organization_cache_service import OrganizationCacheService
 from mvp.utils import process_csv_file
 
 logger = logging.getLogger(__name__)
@@ -39,6 +40,7 @@ class ImportContextualizationDataTask:
     def import_data_to_db(self, organization):
         summary_imported = self.import_summary_data(organization)
         justification_imported = self.import_justification_data(organization)
+        OrganizationCacheService.bump_data_version(organization)
         return all([summary_imported, justification_imported])
 
     def import_summary_data(self, organization):
@@ -0,0 +1,71 @@
+import threading
+import time
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import SimpleTestCase
+
+from cto_tool.cache import TieredCache
+
+
+class TieredCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.shared = caches["shared"]
+        self.shared.clear()
+        self.cache = TieredCache(None, {"OPTIONS": {"SHARED_CACHE": "shared", "LOCAL_TIMEOUT": 10}})
+
+    def test_get_from_local_and_shared_tiers(self):
+        self.shared.set("key", {"value": 1})
+
+        self.assertEqual(self.cache.get("key"), {"value": 1})
+        self.assertEqual(self.cache.get("key"), {"value": 1})
+        self.assertIsNone(self.cache.get("missing"))
+
+        stats = self.cache.get_stats()
+        self.assertEqual((stats["local_hits"], stats["shared_hits"], stats["misses"]), (1, 1, 1))
+        self.assertAlmostEqual(stats["hit_ratio"], 2 / 3)
+
+    def test_local_values_are_copies(self):
+        self.cache.set("key", {"value": 1})
+        self.cache.get("key")["value"] = 2
+
+        self.assertEqual(self.cache.get("key"), {"value": 1})
+
+    def test_local_entries_expire(self):
+        self.cache.set("key", 1)
+        # changed by another process
+        self.shared.set("key", 2)
+        self.assertEqual(self.cache.get("key"), 1)
+
+        with patch("cto_tool.cache.time.monotonic", return_value=time.monotonic() + 11):
+            self.assertEqual(self.cache.get("key"), 2)
+
+    def test_get_or_set_calculates_once(self):
+        num_calls = 0
+
+        def calculate():
+            nonlocal num_calls
+            num_calls += 1
+            time.sleep(0.1)
+            return "value"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.cache.get_or_set("key", calculate))) for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(num_calls, 1)
+        self.assertEqual(results, ["value"] * 5)
+        self.assertEqual(self.shared.get("key"), "value")
+        self.assertFalse(self.shared.has_key(f"key{TieredCache.LOCK_KEY_SUFFIX}"))
+
+    def test_get_or_set_waits_for_other_process(self):
+        # another process is calculating it
+        self.shared.add(f"key{TieredCache.LOCK_KEY_SUFFIX}", 1)
+        threading.Timer(0.2, lambda: self.shared.set("key", "other")).start()
+
+        self.assertEqual(self.cache.get_or_set("key", lambda: "value"), "other")
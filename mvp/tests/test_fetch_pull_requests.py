@@ -0,0 +1,112 @@
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+import requests
+from django.test import TestCase
+from django.utils import timezone
+
+from compass.integrations.apis import GitHubApi
+from compass.integrations.integrations import GitHubIntegration, GitRepositoryData
+from mvp.management.commands.fetch_pull_requests import Command
+from mvp.models import Organization, Repository, RepositoryPullRequest
+
+
+class FetchPullRequestsTests(TestCase):
+    def setUp(self):
+        self.organization = Organization.objects.create(name="Test Org")
+        self.integration = GitHubIntegration()
+        self.repository = Repository.objects.create(
+            organization=self.organization,
+            provider=self.integration.provider,
+            external_id="1",
+            owner="org",
+            name="repo",
+        )
+        self.repository_data = GitRepositoryData(
+            id="1",
+            name="repo",
+            owner="org",
+            raw_data={"id": "1", "name": "repo", "full_name": "org/repo", "owner": {"login": "org"}},
+            store_data={"installation_id": 1},
+        )
+        self.integration.api = Mock()
+        self.now = timezone.now().replace(microsecond=0)
+
+    def get_pull_request(self, number, minutes_ago):
+        updated_at = (self.now - timedelta(minutes=minutes_ago)).strftime(GitHubApi.DATE_FORMAT)
+        return {
+            "number": number,
+            "state": "closed",
+            "updated_at": updated_at,
+            "merged_at": None,
+            "merge_commit_sha": None,
+            "head": {"sha": f"head{number}", "repo": None},
+            "base": {"sha": f"base{number}"},
+        }
+
+    def process_repository(self, *pages):
+        self.integration.api.get_repository_pull_request_pages.return_value = iter(pages)
+        Command().process_repository(self.organization, self.integration, self.repository_data)
+        self.repository.refresh_from_db()
+
+    def test_process_repository_from_watermark(self):
+        RepositoryPullRequest.objects.create(repository=self.repository, pr_number=3, is_closed=True)
+        self.repository.pull_requests_fetched_until = self.now - timedelta(days=1)
+        self.repository.save()
+
+        self.process_repository(
+            # updated after the threshold, fetched by the next poll
+            [self.get_pull_request(5, minutes_ago=1), self.get_pull_request(4, minutes_ago=60)],
+            [self.get_pull_request(3, minutes_ago=120), self.get_pull_request(2, minutes_ago=60 * 25 - 1)],
+            [self.get_pull_request(1, minutes_ago=60 * 26)],
+        )
+
+        self.assertEqual(
+            sorted(RepositoryPullRequest.objects.values_list("pr_number", flat=True)),
+            [2, 3, 4],
+        )
+        self.assertEqual(self.repository.pull_requests_fetched_until, self.now - timedelta(minutes=60))
+
+    def test_process_repository_before_failed_pull_request(self):
+        self.repository.pull_requests_fetched_until = self.now - timedelta(days=2)
+        self.repository.save()
+        failed_pull_request = self.get_pull_request(3, minutes_ago=120)
+        del failed_pull_request["head"]
+        # failing for longer than the retry period
+        skipped_pull_request = self.get_pull_request(1, minutes_ago=60 * 26)
+        del skipped_pull_request["head"]
+
+        self.process_repository(
+            [self.get_pull_request(4, minutes_ago=60), failed_pull_request],
+            [self.get_pull_request(2, minutes_ago=180), skipped_pull_request],
+        )
+
+        self.assertEqual(sorted(RepositoryPullRequest.objects.values_list("pr_number", flat=True)), [2, 4])
+        # the failed pull request is fetched again by the next poll, the skipped one isn't
+        self.assertEqual(self.repository.pull_requests_fetched_until, self.now - timedelta(minutes=120, seconds=1))
+
+        # once failing for longer than the retry period, the watermark moves past it
+        self.now += Command.FAILED_PR_RETRY_PERIOD
+        with patch("django.utils.timezone.now", return_value=self.now):
+            self.process_repository([failed_pull_request])
+        self.assertEqual(self.repository.pull_requests_fetched_until, self.now - timedelta(minutes=120 + 60 * 24))
+
+    def test_process_repository_no_access(self):
+        response = requests.Response()
+        response.status_code = 403
+        self.integration.api.get_repository_pull_request_pages.side_effect = requests.exceptions.HTTPError(
+            response=response
+        )
+
+        for _ in range(2):
+            self.repository.pull_requests_no_access_until = None
+            self.repository.save()
+            Command().process_repository(self.organization, self.integration, self.repository_data)
+            self.repository.refresh_from_db()
+
+        self.assertEqual(self.repository.pull_requests_no_access_count, 2)
+        self.assertGreater(self.repository.pull_requests_no_access_until, timezone.now() + timedelta(hours=11))
+
+        # skipped until then
+        Command().process_repository(self.organization, self.integration, self.repository_data)
+        self.assertEqual(self.integration.api.get_repository_pull_request_pages.call_count, 2)
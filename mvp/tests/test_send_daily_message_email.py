@@ -0,0 +1,58 @@
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from compass.contextualization.models import DailyMessage, DayIntervalChoices, MessageFilter
+from mvp.management.commands.send_daily_message_email import Command
+from mvp.models import CustomUser, DataProvider, DataProviderConnection, Organization
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class SendDailyMessageEmailTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        jira_provider = DataProvider.objects.create(name="Jira")
+
+        self.organizations = []
+        for index in range(2):
+            organization = Organization.objects.create(name=f"Org {index}", contextualization_enabled=True)
+            DataProviderConnection.objects.create(
+                provider=jira_provider,
+                organization=organization,
+                data={"access_token": "token", "refresh_token": "token"},
+            )
+            DailyMessage.objects.create(
+                organization=organization,
+                date=timezone.now().date(),
+                raw_json={"last_updated": None, "anomaly_insights_and_risks": {}},
+            )
+            for user_index in range(3):
+                user = CustomUser.objects.create_user(
+                    email=f"user{user_index}@org{index}.com", compass_anomaly_insights_notifications=True
+                )
+                user.organizations.add(organization)
+                if user_index == 2:
+                    MessageFilter.objects.create(
+                        organization=organization,
+                        user=user,
+                        day_interval=DayIntervalChoices.ONE_DAY,
+                        significance_levels=["9"],
+                    )
+            self.organizations.append(organization)
+
+        CustomUser.objects.create_user(email="muted@org0.com").organizations.add(self.organizations[0])
+
+    def test_send_daily_message_email(self):
+        with patch.object(Command, "render_message", autospec=True, side_effect=Command.render_message) as mock_render:
+            call_command("send_daily_message_email", workers=2)
+
+        self.assertEqual(
+            sorted(message.to[0] for message in mail.outbox),
+            sorted(f"user{user_index}@org{index}.com" for index in range(2) for user_index in range(3)),
+        )
+        # users without filters share the same message
+        self.assertEqual(mock_render.call_count, 4)
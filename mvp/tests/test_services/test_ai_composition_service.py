@@ -0,0 +1,91 @@
+from datetime import date, timedelta
+
+from django.test import TestCase
+
+from compass.integrations.integrations import GitHubIntegration
+from mvp.models import Organization, Repository, RepositoryDailyComposition
+from mvp.services import AICompositionService
+from mvp.utils import round_half_up, round_half_up_array
+
+
+class AICompositionServiceTests(TestCase):
+    def setUp(self):
+        self.organization = Organization.objects.create(name="Test Org")
+        self.service = AICompositionService(self.organization)
+        self.until = date(2025, 1, 10)
+
+        self.repository1 = self.create_repository("repo1")
+        self.repository2 = self.create_repository("repo2")
+
+        # (days ago, num lines, ai num lines, blended num lines)
+        self.create_rows(self.repository1, [(3, 100, 10, 5), (2, 100, 10, 5), (1, 200, 50, 20), (0, 200, 50, 20)])
+        # starts later and the last day isn't calculated yet
+        self.create_rows(self.repository2, [(1, 300, 0, 0)])
+
+    def create_repository(self, name):
+        return Repository.objects.create(
+            organization=self.organization,
+            provider=GitHubIntegration().provider,
+            external_id=name,
+            owner="org",
+            name=name,
+        )
+
+    def create_rows(self, repository, rows):
+        for days_ago, num_lines, ai_num_lines, blended_num_lines in rows:
+            RepositoryDailyComposition.objects.create(
+                repository=repository,
+                date=self.until - timedelta(days=days_ago),
+                code_num_lines=num_lines,
+                code_ai_num_lines=ai_num_lines,
+                code_ai_blended_num_lines=blended_num_lines,
+            )
+
+    def get_series(self, charts):
+        return {chart.label: chart.data.series[0].data for chart in charts}
+
+    def test_get_charts(self):
+        cumulative, daily = self.service.get_charts(
+            self.until - timedelta(days=2), self.until, [self.repository1, self.repository2], daily_charts=True
+        )
+
+        self.assertEqual(cumulative[0].data.categories, ["2025-01-08", "2025-01-09", "2025-01-10"])
+        self.assertEqual(
+            self.get_series(cumulative),
+            {
+                "Overall": [10.0, 10.0, 10.0],
+                "Pure": [5.0, 6.0, 6.0],
+                "Blended": [5.0, 4.0, 4.0],
+            },
+        )
+        self.assertEqual(
+            self.get_series(daily),
+            {
+                "Overall": [0, 12.09, 0],
+                "Pure": [0.0, 8.79, 0.0],
+                "Blended": [0, 3.3, 0],
+            },
+        )
+
+    def test_get_daily_num_lines_by_repository(self):
+        num_lines = self.service.get_daily_num_lines_by_repository(
+            self.until - timedelta(days=2), self.until, [self.repository1, self.repository2]
+        )
+
+        self.assertEqual(num_lines[self.repository1.pk]["Total"], [0, 155, 0])
+        self.assertEqual(num_lines[self.repository1.pk]["Overall"], [0, 55, 0])
+        self.assertEqual(num_lines[self.repository2.pk]["Total"], [0, 300, 0])
+
+    def test_get_charts_weekly_uses_last_value_of_week(self):
+        cumulative, _ = self.service.get_charts(self.until - timedelta(days=20), self.until, [self.repository1])
+
+        self.assertEqual(cumulative[0].data.categories[-1], "2025-01-05")
+        self.assertEqual(self.get_series(cumulative)["Overall"][-1], 25.0)
+
+    def test_round_half_up_array(self):
+        values = [1.005, 2.675, 0.125, 12.345, -1.005, 33.33333, 0, 99.995]
+
+        self.assertEqual(
+            round_half_up_array(values, 2).tolist(),
+            [round_half_up(value, 2) for value in values],
+        )
@@ -0,0 +1,93 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from compass.contextualization.models import DailyMessage, MessageFilterData
+from mvp.models import DataProvider, DataProviderConnection, Organization
+from mvp.services.contextualization_message_service import ContextualizationMessageService
+
+
+class ContextualizationMessageServiceFilterTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.organization = Organization.objects.create(name="Test Org")
+        self.daily_message = DailyMessage.objects.create(
+            organization=self.organization,
+            date=timezone.now().date(),
+            raw_json={
+                "last_updated": None,
+                "anomaly_insights_and_risks": {
+                    "9": [{"significance_score": 9, "title": "high"}],
+                    "7": [{"significance_score": 7, "title": "low"}],
+                },
+            },
+        )
+
+    def get_filter(self, significance_levels=None, ticket_categories=None):
+        return MessageFilterData(
+            significance_levels=significance_levels or [],
+            repository_groups=[],
+            ticket_categories=ticket_categories or [],
+        )
+
+    def test_get_message_filter_signature(self):
+        get_signature = ContextualizationMessageService.get_message_filter_signature
+
+        self.assertEqual(get_signature(None), get_signature(self.get_filter()))
+        self.assertEqual(
+            get_signature(self.get_filter(significance_levels=["9", "8"])),
+            get_signature(self.get_filter(significance_levels=["8", "9", "9"])),
+        )
+        self.assertNotEqual(
+            get_signature(self.get_filter(significance_levels=["9"])),
+            get_signature(self.get_filter(ticket_categories=["9"])),
+        )
+
+    def test_get_cached_filtered_daily_message_data(self):
+        with patch.object(
+            ContextualizationMessageService,
+            "get_filtered_daily_message_data",
+            wraps=ContextualizationMessageService.get_filtered_daily_message_data,
+        ) as mock_get_filtered_daily_message_data:
+            for significance_levels in (["9", "8"], ["8", "9"], ["9"]):
+                data = ContextualizationMessageService.get_cached_filtered_daily_message_data(
+                    self.organization, self.daily_message, self.get_filter(significance_levels=significance_levels)
+                )
+                self.assertEqual(list(data["anomaly_insights_and_risks"]), ["9"])
+
+            self.assertEqual(mock_get_filtered_daily_message_data.call_count, 2)
+
+            # updating the daily message invalidates its filtered data
+            self.daily_message.save()
+            ContextualizationMessageService.get_cached_filtered_daily_message_data(
+                self.organization, self.daily_message, self.get_filter(significance_levels=["9"])
+            )
+            self.assertEqual(mock_get_filtered_daily_message_data.call_count, 3)
+
+
+class ContextualizationMessageServiceJiraUrlTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.organization = Organization.objects.create(name="Test Org")
+        self.connection = DataProviderConnection.objects.create(
+            provider=DataProvider.objects.create(name="Jira"),
+            organization=self.organization,
+            data={"access_token": "token"},
+        )
+
+    @patch.object(ContextualizationMessageService, "fetch_jira_base_url", return_value="https://org.atlassian.net")
+    def test_jira_base_url_is_cached_until_connection_changes(self, mock_fetch_jira_base_url):
+        for task_id in ("PRJ-1", "PRJ-2"):
+            self.assertEqual(
+                ContextualizationMessageService.get_jira_url(self.organization, task_id),
+                f"https://org.atlassian.net/browse/{task_id}",
+            )
+        mock_fetch_jira_base_url.assert_called_once()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.connection.save()
+
+        ContextualizationMessageService.get_jira_url(self.organization, "PRJ-1")
+        self.assertEqual(mock_fetch_jira_base_url.call_count, 2)
@@ -0,0 +1,166 @@
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+
+from django.test import SimpleTestCase, TestCase
+
+from compass.contextualization.tasks.import_ticket_completeness_task import ImportTicketCompletenessTask
+from contextualization.pipelines.pipeline_D_jira_score_completeness.jira_completeness_score import (
+    reuse_previous_scores,
+)
+from contextualization.pipelines.pipeline_D_jira_score_completeness.schemas import (
+    JiraTicketData,
+    TicketCompletenessScoreResult,
+)
+from mvp.models import JiraProject, Organization
+from mvp.services import ContextualizationDayInterval, ContextualizationService
+from mvp.services.contextualization_service import ContextualizationCheckpoints
+
+
+class ContextualizationServicePipelineDTests(TestCase):
+    def setUp(self):
+        self.organization = Organization.objects.create(name="Test Org")
+        JiraProject.objects.create(organization=self.organization, name="Project", key="PRJ", external_id="1")
+
+    def get_ticket(self, issue_key, description):
+        return JiraTicketData(
+            issue_key=issue_key,
+            summary="Summary",
+            issue_type="Story",
+            components=[],
+            priority="High",
+            project_name="PRJ",
+            status="To Do",
+            created=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            labels=[],
+            attachment=[],
+            issuelinks=[],
+            description=description,
+        )
+
+    def test_reuse_previous_scores(self):
+        scored_ticket = self.get_ticket("PRJ-1", "Description")
+        ImportTicketCompletenessTask().import_results(
+            self.organization,
+            [
+                TicketCompletenessScoreResult(
+                    issue_key="PRJ-1",
+                    summary="Summary",
+                    priority="High",
+                    jira_completeness_score=80,
+                    evaluation_jira_completeness_score="evaluation",
+                    explanation_jira_completeness_score="explanation",
+                    stage_category="Ready for Work",
+                    llm_category="Story",
+                    project_name="PRJ",
+                    quality_category="Advanced",
+                    completeness_hash=scored_ticket.get_completeness_hash(),
+                )
+            ],
+        )
+
+        previous_scores = ContextualizationService.get_previous_ticket_scores(self.organization)
+        tickets = [
+            self.get_ticket("PRJ-1", "Description"),
+            self.get_ticket("PRJ-2", "Description"),
+            self.get_ticket("PRJ-1", "Changed description"),
+        ]
+        tickets_to_score = reuse_previous_scores(tickets, previous_scores)
+
+        self.assertEqual(tickets_to_score, tickets[1:])
+        self.assertEqual(tickets[0].jira_completeness_score, 80)
+        self.assertEqual(tickets[0].explanation_jira_completeness_score, "explanation")
+        self.assertEqual(tickets[0].llm_category, "Story")
+        self.assertEqual(tickets[0].quality_category, "Advanced")
+        self.assertIsNone(tickets[2].jira_completeness_score)
+
+
+class ContextualizationServiceOutputDataTests(TestCase):
+    def setUp(self):
+        self.organization = Organization.objects.create(name="Test Org")
+
+    def save_output_files(self, outputs):
+        with tempfile.TemporaryDirectory() as day_interval_dir:
+            for filename, data in outputs.items():
+                with open(os.path.join(day_interval_dir, filename), "w") as f:
+                    json.dump(data, f)
+            ContextualizationService.save_output_files(
+                self.organization, ContextualizationDayInterval.ONE_DAY, day_interval_dir
+            )
+
+    def test_save_output_files(self):
+        self.save_output_files({"count.json": {"repo": 1}, "justification.json": {"summary": "old"}})
+        self.save_output_files({"justification.json": {"summary": "new"}})
+
+        outputs = ContextualizationService.load_outputs_data(
+            self.organization,
+            ["count.json", "justification.json"],
+            day_interval=ContextualizationDayInterval.ONE_DAY,
+        )
+
+        self.assertEqual(outputs["count.json"], ({}, 0))
+        data, timestamp = outputs["justification.json"]
+        self.assertEqual(data, {"summary": "new"})
+        self.assertTrue(timestamp)
+        self.assertEqual(
+            ContextualizationService.get_output_data_timestamp(
+                self.organization, "justification.json", ContextualizationDayInterval.ONE_DAY
+            ),
+            timestamp,
+        )
+        # other day intervals have their own outputs
+        self.assertEqual(ContextualizationService.load_output_data(self.organization, "justification.json"), ({}, 0))
+
+    def test_read_combined_anomaly_script_output(self):
+        filename = ContextualizationService.OUTPUT_FILENAME_COMBINED_ANOMALY_INSIGHTS
+        self.save_output_files({filename: {"anomaly_insights": [{"repo": "r1"}]}})
+
+        self.assertEqual(
+            ContextualizationService.read_combined_anomaly_script_output(
+                self.organization, ContextualizationDayInterval.ONE_DAY
+            ),
+            {"anomaly_insights": [{"repo": "r1"}]},
+        )
+        self.assertIsNone(ContextualizationService.read_combined_anomaly_script_output(self.organization))
+
+
+class ContextualizationCheckpointsTests(SimpleTestCase):
+    def test_run_resumes_completed_pipelines(self):
+        calls = []
+
+        def pipeline(result):
+            calls.append(result)
+            return result
+
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoints = ContextualizationCheckpoints(directory, "14_2024-01-01_all")
+            checkpoints.start()
+            self.assertEqual(checkpoints.run("a", lambda: pipeline({"a": 1})), {"a": 1})
+            with self.assertRaises(ValueError):
+                checkpoints.run("bc", lambda: pipeline(int("failed")))
+
+            # the next run only executes the pipelines that didn't complete
+            checkpoints = ContextualizationCheckpoints(directory, "14_2024-01-01_all")
+            self.assertTrue(checkpoints.exists())
+            self.assertEqual(checkpoints.run("a", lambda: pipeline({"a": 2})), {"a": 1})
+            self.assertEqual(checkpoints.run("bc", lambda: pipeline("bc")), "bc")
+            self.assertEqual(calls, [{"a": 1}, "bc"])
+
+            checkpoints.clear()
+            self.assertFalse(checkpoints.exists())
+            self.assertFalse(ContextualizationCheckpoints(directory, "14_2024-01-01_all", enabled=False).exists())
+
+    def test_start_removes_the_checkpoints_of_other_runs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoints = ContextualizationCheckpoints(directory, "14_2024-01-01_all")
+            checkpoints.start()
+            checkpoints.run("a", lambda: {"a": 1})
+
+            # the outputs of the other run replace the ones these checkpoints depend on
+            other_checkpoints = ContextualizationCheckpoints(directory, "1_2024-01-02_all")
+            other_checkpoints.start()
+
+            self.assertFalse(os.path.isdir(checkpoints.run_directory))
+            self.assertFalse(checkpoints.exists())
+            self.assertTrue(other_checkpoints.exists())
@@ -3,13 +3,15 @@ from unittest.mock import patch
 from django.test import TestCase
 from django.utils import timezone
 
-from compass.contextualization.models import Initiative, InitiativeEpic, Roadmap
+from compass.contextualization.models import Initiative, InitiativeEpic, ReconcilableInitiative, Roadmap
 from compass.contextualization.tasks.import_pipeline_bc_data_task import ImportPipelineBCDataTask
 from contextualization.pipelines.pipeline_B_and_C_product_roadmap.schemas import (
     Epic as SchemaEpic,
 )
 from contextualization.pipelines.pipeline_B_and_C_product_roadmap.schemas import (
     GitInitiatives,
+    Insight,
+    Insights,
     PipelineBCResult,
     PipelineBCResultItem,
 )
@@ -275,3 +277,75 @@ class ImportPipelineBCDataTaskTest(TestCase):
 
         self.assertTrue(epic.pinned)
         self.assertEqual(epic.parent, self.existing_pinned_epic_with_custom_name)
+
+    @patch.object(ImportPipelineBCDataTask, "get_group_file_timestamp")
+    def test_import_all_repository_groups(self, mock_get_group_file_timestamp):
+        """Test the initiatives, epics and reconcilable initiatives of every group are imported on each run."""
+
+        mock_get_group_file_timestamp.return_value = timezone.now().timestamp()
+        other_repo_group = RepositoryGroup.objects.create(name="OtherRepoGroup", organization=self.organization)
+
+        def get_item(initiative_name):
+            return PipelineBCResultItem(
+                git_initiatives=GitInitiatives(
+                    summary="Roadmap summary",
+                    initiatives=[
+                        SchemaInitiative(
+                            initiative_name=initiative_name,
+                            initiative_description="Desc",
+                            initiative_percentage=50,
+                            epics=[
+                                SchemaEpic(epic_name="Epic A", epic_description="Epic desc", epic_percentage=60),
+                                SchemaEpic(epic_name="Epic B", epic_description="Epic desc", epic_percentage=40),
+                            ],
+                        )
+                    ],
+                ),
+                acceleration_summary=None,
+                insights=Insights(
+                    insights=[
+                        Insight(
+                            git_activity="Git activity",
+                            jira_activity="No tickets",
+                            needs_reconciliation=needs_reconciliation,
+                            work_group=f"{initiative_name} work {needs_reconciliation}",
+                            work_group_type="initiative",
+                        )
+                        for needs_reconciliation in (True, False)
+                    ]
+                ),
+            )
+
+        result = PipelineBCResult(
+            items={
+                self.repo_group.public_id(): get_item("Group Initiative"),
+                other_repo_group.public_id(): get_item("Other Group Initiative"),
+            }
+        )
+
+        task = ImportPipelineBCDataTask()
+        task.import_results(self.organization, ContextualizationDayInterval.TWO_WEEKS, result)
+
+        for repo_group, initiative_name in (
+            (self.repo_group, "Group Initiative"),
+            (other_repo_group, "Other Group Initiative"),
+        ):
+            roadmap = Roadmap.objects.get(repository_group=repo_group)
+            initiative = Initiative.objects.get(roadmap=roadmap)
+            self.assertEqual(initiative.name, initiative_name)
+            self.assertEqual(
+                list(initiative.epics.order_by("name").values_list("name", "percentage")),
+                [("Epic A", 60), ("Epic B", 40)],
+            )
+            self.assertEqual(
+                list(ReconcilableInitiative.objects.filter(roadmap=roadmap).values_list("name", flat=True)),
+                [f"{initiative_name} work True"],
+            )
+
+        # re-importing creates new roadmaps and keeps the previous ones as they were
+        task.import_results(self.organization, ContextualizationDayInterval.TWO_WEEKS, result)
+
+        self.assertEqual(Roadmap.objects.filter(repository_group__isnull=False).count(), 4)
+        self.assertEqual(Initiative.objects.filter(roadmap__repository_group__isnull=False).count(), 4)
+        self.assertEqual(InitiativeEpic.objects.filter(initiative__roadmap__repository_group__isnull=False).count(), 8)
+        self.assertEqual(ReconcilableInitiative.objects.count(), 4)
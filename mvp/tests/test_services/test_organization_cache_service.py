@@ -0,0 +1,45 @@
+from unittest.mock import Mock
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from mvp.models import Organization, RepositoryGroup
+from mvp.services import OrganizationCacheService
+
+
+class OrganizationCacheServiceTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.organization = Organization.objects.create(name="Test Org")
+        self.other_organization = Organization.objects.create(name="Other Org")
+
+    def test_get_or_set(self):
+        default = Mock(return_value={"value": 1})
+
+        self.assertEqual(OrganizationCacheService.get_or_set(self.organization, "data", default), {"value": 1})
+        self.assertEqual(OrganizationCacheService.get_or_set(self.organization, "data", default), {"value": 1})
+        default.assert_called_once()
+
+        OrganizationCacheService.get_or_set(self.other_organization, "data", default)
+        self.assertEqual(default.call_count, 2)
+
+    def test_bump_data_version(self):
+        default = Mock(return_value={"value": 1})
+        OrganizationCacheService.get_or_set(self.organization, "data", default)
+        OrganizationCacheService.get_or_set(self.other_organization, "data", default)
+
+        OrganizationCacheService.bump_data_version(self.organization)
+
+        OrganizationCacheService.get_or_set(self.organization, "data", default)
+        OrganizationCacheService.get_or_set(self.other_organization, "data", default)
+        self.assertEqual(default.call_count, 3)
+
+    def test_settings_change_bumps_data_version_on_commit(self):
+        data_version = OrganizationCacheService.get_data_version(self.organization)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            RepositoryGroup.objects.create(organization=self.organization, name="Group")
+
+            self.assertEqual(OrganizationCacheService.get_data_version(self.organization), data_version)
+
+        self.assertNotEqual(OrganizationCacheService.get_data_version(self.organization), data_version)
@@ -0,0 +1,119 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from compass.integrations.integrations import GitHubIntegration
+from mvp.models import (
+    Organization,
+    Repository,
+    RepositoryCommit,
+    RepositoryCommitStatusChoices,
+    RepositoryDailyComposition,
+    RepositoryPullRequest,
+)
+from mvp.services import AICompositionService
+from mvp.services.repository_daily_composition_service import (
+    RepositoryDailyCompositionService,
+)
+
+
+class RepositoryDailyCompositionServiceTests(TestCase):
+    def setUp(self):
+        self.organization = Organization.objects.create(name="Test Org")
+        self.repository = Repository.objects.create(
+            organization=self.organization,
+            provider=GitHubIntegration().provider,
+            external_id="abc123",
+            owner="org",
+            name="repo",
+        )
+        self.today = timezone.now().replace(hour=12, minute=0, second=0, microsecond=0)
+
+        self.create_commit("sha1", days_ago=3, num_lines=100, ai_num_lines=10, blended_num_lines=5)
+        self.create_commit("sha2", days_ago=1, num_lines=200, ai_num_lines=20, blended_num_lines=10, hour=10)
+        self.create_commit("sha3", days_ago=1, num_lines=300, ai_num_lines=30, blended_num_lines=15, hour=11)
+
+        pending = self.create_commit("sha4", days_ago=2, num_lines=999, ai_num_lines=999, blended_num_lines=999)
+        pending.status = RepositoryCommitStatusChoices.PENDING
+        pending.save()
+
+        pull_request_commit = self.create_commit(
+            "sha5", days_ago=2, num_lines=999, ai_num_lines=999, blended_num_lines=999
+        )
+        pull_request = RepositoryPullRequest.objects.create(
+            repository=self.repository,
+            pr_number=1,
+            base_commit_sha="sha1",
+            head_commit_sha="sha5",
+        )
+        pull_request_commit.pull_requests.add(pull_request)
+
+    def create_commit(self, sha, days_ago, num_lines, ai_num_lines, blended_num_lines, hour=12):
+        return RepositoryCommit.objects.create(
+            repository=self.repository,
+            sha=sha,
+            date_time=self.today.replace(hour=hour) - timedelta(days=days_ago),
+            status=RepositoryCommitStatusChoices.ANALYZED,
+            code_num_lines=num_lines,
+            code_ai_num_lines=ai_num_lines,
+            code_ai_blended_num_lines=blended_num_lines,
+        )
+
+    def get_num_lines_by_date(self):
+        return {
+            row.date: row.code_num_lines
+            for row in RepositoryDailyComposition.objects.filter(repository=self.repository).order_by("date")
+        }
+
+    def day(self, days_ago):
+        return (self.today - timedelta(days=days_ago)).date()
+
+    def test_update_all_carries_forward_last_commit_of_the_day(self):
+        RepositoryDailyCompositionService(self.organization).update_all()
+
+        self.assertEqual(
+            self.get_num_lines_by_date(),
+            {
+                self.day(3): 100,
+                self.day(2): 100,
+                self.day(1): 300,
+                self.day(0): 300,
+            },
+        )
+
+    def test_update_all_recalculates_from_given_date(self):
+        service = RepositoryDailyCompositionService(self.organization)
+        service.update_all()
+
+        self.create_commit("sha6", days_ago=2, num_lines=150, ai_num_lines=15, blended_num_lines=5)
+        service.update_all({self.repository.pk: self.day(2)})
+
+        self.assertEqual(
+            self.get_num_lines_by_date(),
+            {
+                self.day(3): 100,
+                self.day(2): 150,
+                self.day(1): 300,
+                self.day(0): 300,
+            },
+        )
+
+    def test_ai_composition_charts_read_from_rollup(self):
+        RepositoryDailyCompositionService(self.organization).update_all()
+
+        service = AICompositionService(self.organization)
+        cumulative, _ = service.get_charts(self.today - timedelta(days=3), self.today)
+
+        overall = next(chart for chart in cumulative if chart.label == AICompositionService.SERIES_DELTA_NAME_OVERALL)
+        self.assertEqual(overall.data.series[0].data, [10.0, 10.0, 10.0, 10.0])
+
+    def test_weekly_values_are_the_last_day_of_the_week(self):
+        RepositoryDailyCompositionService(self.organization).update_all()
+
+        service = AICompositionService(self.organization)
+        by_date, dates, _ = service.get_data_by_date_and_repository(self.today - timedelta(days=30), self.today)
+
+        # the daily rows are snapshots, so a week is its last day instead of the sum of its days
+        self.assertEqual(dates[-1], service.get_aggregated_week_date(self.today.strftime(service.DATE_FORMAT_DAY)))
+        self.assertEqual(by_date[-1].tolist(), [300, 30, 15])
@@ -9,13 +9,15 @@ import traceback
 from datetime import datetime, timedelta
 from decimal import Decimal
 from functools import wraps
-from threading import Thread
+from threading import Lock, Thread
 
 import boto3
+import numpy as np
 import pytz
 from botocore.client import Config
 from dateutil.relativedelta import relativedelta
 from django.conf import settings
+from django.db import connections
 from django.utils import timezone
 from requests.exceptions import HTTPError
 from sentry_sdk import capture_exception, push_scope
@@ -163,6 +165,49 @@ def start_new_thread(function):
     return decorator
 
 
+def run_concurrently(function, items, max_workers):
+    """
+    Calls function(item) for every item in up to max_workers threads, or one after another in the current
+    thread if max_workers is 1. Each thread closes its database connections when it finishes.
+
+    The first exception is raised once the running calls finish, the items not started yet are skipped.
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        for item in items:
+            function(item)
+        return
+
+    pending_items = iter(items)
+    no_item = object()
+    lock = Lock()
+    errors = []
+
+    def worker():
+        try:
+            while not errors:
+                with lock:
+                    item = next(pending_items, no_item)
+                    if item is no_item:
+                        return
+
+                try:
+                    function(item)
+                except Exception as error:
+                    errors.append(error)
+        finally:
+            connections.close_all()
+
+    threads = [Thread(target=worker) for _ in range(min(max_workers, len(items)))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+
 def traceback_on_debug():
     if settings.DEBUG and not settings.TESTING:
         traceback.print_exc()
@@ -190,6 +235,25 @@ def round_half_up(num, d):
             return float(new_num)
 
 
+def round_half_up_array(values, d):
+    """
+    Vectorized version of round_half_up, returning exactly the same values.
+
+    round_half_up rounds the decimal representation of the number and not its binary value,
+    so negative values and values too close to a rounding boundary fall back to it.
+    """
+    values = np.asarray(values, dtype=float)
+    multiplier = 10**d
+    scaled = values * multiplier
+    rounded = np.floor(scaled + 0.5) / multiplier
+
+    fallback = (values < 0) | (np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+    for index in zip(*np.nonzero(fallback)):
+        rounded[index] = round_half_up(float(values[index]), d)
+
+    return rounded
+
+
 def set_csv_field_size_limit():
     # Source: https://stackoverflow.com/questions/15063936/csv-error-field-larger-than-field-limit-131072
     max_size = sys.maxsize